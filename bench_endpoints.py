@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Microbenchmark relationship construction from full nodes and NodeRefs.
+
+Builds N HasIP edges between the same Domain and PublicIPAddress, once from
+the node instances and once from NodeRefs to them. Endpoint validation is an
+isinstance check inside pydantic-core for both, so the two should cost about
+the same per edge, and full-node edges about what they cost when endpoints
+were untyped.
+"""
+
+import argparse
+import time
+
+from networksdb.base import NodeRef
+from networksdb.nodes import Domain, PublicIPAddress
+from networksdb.relationships import HasIP
+
+
+def build(count, start_node, end_node):
+    """Construct `count` HasIP edges and return the elapsed time and last edge."""
+    start = time.perf_counter()
+    for _ in range(count):
+        rel = HasIP(start_node=start_node, end_node=end_node)
+    return time.perf_counter() - start, rel
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--edges", type=int, default=200_000, help="Edges per run")
+    args = parser.parse_args()
+
+    domain = Domain(address="example.com")
+    address = PublicIPAddress(address="203.0.113.7")
+    results = {}
+    for label, start_node, end_node in (
+        ("full nodes", domain, address),
+        ("NodeRefs", NodeRef.of(domain), NodeRef.of(address)),
+    ):
+        build(1000, start_node, end_node)  # warm up validation memos
+        elapsed, rel = build(args.edges, start_node, end_node)
+        results[label] = rel.rel_id
+        print(f"{label:12}{elapsed / args.edges * 1e6:8.2f} us/edge {args.edges / elapsed:12,.0f} edges/s")
+
+    assert results["full nodes"] == results["NodeRefs"], "rel_ids differ"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark and guard the import time of the networksdb package.
+
+Runs ``python -X importtime -c "import networksdb"`` in fresh interpreters and
+reports the median cumulative import time. It also checks that the import stays
+lazy: no node/relationship model, sql_metadata or ziptie_schema module may be
+loaded by the bare package import. Finally, it times the first class lookup,
+which is what pays for importing that one model.
+
+Exits non-zero when a heavy module is imported eagerly, or when --max-ms is
+given and the median import time exceeds it, so it can run in CI.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Modules that must only be imported on first use
+LAZY_PREFIXES = (
+    "networksdb.nodes.",
+    "networksdb.relationships.",
+    "networksdb.sql_metadata",
+    "networksdb.base",
+    "ziptie_schema",
+    "pydantic",
+)
+
+LOADED_MODULES = "import sys, networksdb; print('\\n'.join(sorted(sys.modules)))"
+
+FIRST_LOOKUP = (
+    "import time; t = time.perf_counter(); import networksdb; "
+    "t1 = time.perf_counter(); networksdb.get_node_class('Domain'); "
+    "t2 = time.perf_counter(); print(t1 - t, t2 - t1)"
+)
+
+
+def run_python(args):
+    env = dict(os.environ)
+    src = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, env=env, check=True
+    )
+
+
+def import_time_us(module="networksdb"):
+    """Cumulative import time of module, from -X importtime, in microseconds."""
+    stderr = run_python(["-X", "importtime", "-c", f"import {module}"]).stderr
+    for line in stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise RuntimeError(f"{module} not found in -X importtime output")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Interpreter launches to sample")
+    parser.add_argument("--max-ms", type=float, help="Fail if the median import time exceeds this")
+    args = parser.parse_args()
+
+    loaded = run_python(["-c", LOADED_MODULES]).stdout.split()
+    eager = [name for name in loaded if name.startswith(LAZY_PREFIXES)]
+
+    samples = [import_time_us() / 1000 for _ in range(args.runs)]
+    median = statistics.median(samples)
+    print(f"{'import networksdb':28}{median:8.1f} ms  (median of {args.runs}, "
+          f"min {min(samples):.1f}, max {max(samples):.1f})")
+
+    package, lookup = map(float, run_python(["-c", FIRST_LOOKUP]).stdout.split())
+    print(f"{'first get_node_class()':28}{lookup * 1000:8.1f} ms  "
+          f"(package import {package * 1000:.1f} ms, wall clock)")
+
+    failed = False
+    if eager:
+        print(f"\nFAIL: imported eagerly: {', '.join(eager)}")
+        failed = True
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"\nFAIL: median import time {median:.1f} ms > {args.max_ms:.1f} ms")
+        failed = True
+    if not failed:
+        print("\nOK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Benchmark canonical JSONL writing and reading.
+
+Writes N canonical PublicIPAddress/Domain records with networksdb.io.jsonl,
+then reads them back as raw records and as (trusted) node batches, once per
+file suffix (plain, .gz, and .zst when zstandard is installed).
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from networksdb.io import jsonl
+from networksdb.nodes import Domain, PublicIPAddress
+
+
+def make_records(count):
+    """Build `count` to_dict() records from a small pool of varied nodes."""
+    pool = []
+    for i in range(1000):
+        pool.append(PublicIPAddress(address=f"198.51.{i // 256}.{i % 256}", sources=[f"feed-{i % 7}"]).to_dict())
+        pool.append(Domain(address=f"host{i}.example.com").to_dict())
+    return [pool[i % len(pool)] for i in range(count)]
+
+
+def timed(label, count, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:24}{elapsed:10.2f}s {count / elapsed:14,.0f} lines/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=1_000_000, help="Number of records")
+    args = parser.parse_args()
+
+    records = make_records(args.lines)
+    suffixes = [".jsonl", ".jsonl.gz"]
+    if jsonl.zstandard is not None:
+        suffixes.append(".jsonl.zst")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for suffix in suffixes:
+            path = os.path.join(tmp, "records" + suffix)
+            print(f"{suffix} ({args.lines:,} lines)")
+            timed("  write", args.lines, lambda: jsonl.write_jsonl(records, path))
+            read = timed("  read records", args.lines, lambda: sum(1 for _ in jsonl.iter_records(path)))
+            assert read == args.lines, f"read {read} of {args.lines} lines"
+            timed("  read nodes (trusted)", args.lines,
+                  lambda: sum(len(batch) for batch in jsonl.iter_node_batches(path, trusted=True)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Microbenchmark PublicIPAddress.merge() folds.
+
+Folds N duplicate PublicIPAddress nodes into one, once through the
+non-revalidating path (the default) and once with revalidate=True, which
+rebuilds every intermediate result through the validating constructor as the
+generated merge() methods used to do.
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from networksdb.nodes import PublicIPAddress
+
+
+def make_duplicates(count, seed=0):
+    """Build a pool of validated duplicates of one address to fold repeatedly."""
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1)
+    return [
+        PublicIPAddress(
+            address="203.0.113.7",
+            created_at=base + timedelta(minutes=rng.randrange(100_000)),
+            modified_at=base + timedelta(minutes=rng.randrange(100_000)),
+            count=1,
+            sources=[f"feed-{rng.randrange(20)}"],
+            asn=rng.choice(["", "AS64500", "AS64501"]),
+        )
+        for _ in range(count)
+    ]
+
+
+def fold(nodes, merges, revalidate):
+    """Merge `merges` nodes (cycling through the pool) into the first one."""
+    merged = nodes[0]
+    pool = len(nodes)
+    start = time.perf_counter()
+    for i in range(merges):
+        merged = merged.merge(nodes[i % pool], revalidate=revalidate)
+    return time.perf_counter() - start, merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--merges", type=int, default=1_000_000, help="Number of merges")
+    parser.add_argument("--pool", type=int, default=1000, help="Distinct duplicate instances")
+    args = parser.parse_args()
+
+    nodes = make_duplicates(args.pool)
+    results = {}
+    for label, revalidate in (("revalidate", True), ("construct", False)):
+        elapsed, merged = fold(nodes, args.merges, revalidate)
+        results[label] = (elapsed, merged.to_dict())
+        print(f"{label:16}{elapsed:10.2f}s {args.merges / elapsed:14,.0f} merges/s")
+
+    assert results["revalidate"][1] == results["construct"][1], "merge results differ"
+    print(f"\nSpeedup: {results['revalidate'][0] / results['construct'][0]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
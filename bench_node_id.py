@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark redundant node_id/rel_id hashing on an end-to-end parse.
+
+Parses data/50k_public.csv into Domain and IP address nodes plus HAS_IP
+relationships, serializes everything with to_dict() and merges duplicates by
+node_id/rel_id. The run is repeated with the per-instance ID memo disabled so
+the number of compute_node_id()/compute_rel_id() calls and the wall time can be
+compared.
+"""
+
+import argparse
+import csv
+import time
+from contextlib import contextmanager
+
+from ziptie_schema.base.mixins import IDGenerationMixin
+
+from networksdb.nodes import Domain, PrivateIPAddress, PublicIPAddress
+from networksdb.relationships import HasIP
+from networksdb.transforms import classify_ip
+
+NODE_CLASSES = (Domain, PrivateIPAddress, PublicIPAddress)
+
+
+@contextmanager
+def count_hashes():
+    """Count calls to the ID hashing methods while the block runs."""
+    counts = {"node": 0, "rel": 0}
+    compute_node_id = IDGenerationMixin.compute_node_id
+    compute_rel_id = IDGenerationMixin.compute_rel_id
+
+    def counting_node_id(self):
+        counts["node"] += 1
+        return compute_node_id(self)
+
+    def counting_rel_id(self):
+        counts["rel"] += 1
+        return compute_rel_id(self)
+
+    IDGenerationMixin.compute_node_id = counting_node_id
+    IDGenerationMixin.compute_rel_id = counting_rel_id
+    try:
+        yield counts
+    finally:
+        IDGenerationMixin.compute_node_id = compute_node_id
+        IDGenerationMixin.compute_rel_id = compute_rel_id
+
+
+@contextmanager
+def memo_disabled():
+    """Temporarily restore the unmemoized node_id/rel_id properties."""
+    saved = [(cls, "node_id", cls.__dict__["node_id"]) for cls in NODE_CLASSES]
+    saved.append((HasIP, "rel_id", HasIP.__dict__["rel_id"]))
+    for cls, name, _ in saved:
+        compute = "compute_node_id" if name == "node_id" else "compute_rel_id"
+        setattr(cls, name, property(lambda self, compute=compute: getattr(self, compute)()))
+    try:
+        yield
+    finally:
+        for cls, name, prop in saved:
+            setattr(cls, name, prop)
+
+
+def parse(path, limit=None):
+    """Parse the CSV into nodes and HAS_IP relationships."""
+    nodes, rels = [], []
+    with open(path, newline="") as f:
+        for i, row in enumerate(csv.DictReader(f)):
+            if limit is not None and i >= limit:
+                break
+            domain = Domain(address=row["domain"])
+            address = row["ipv4_address"]
+            if classify_ip({"address": address}) == "PrivateIPAddress":
+                ip = PrivateIPAddress(address=address, context=row["domain"])
+            else:
+                ip = PublicIPAddress(address=address)
+            nodes += (domain, ip)
+            rels.append(HasIP(start_node=domain, end_node=ip))
+    return nodes, rels
+
+
+def run(path, limit=None):
+    """Parse, serialize and merge once; return (seconds, counts, unique entities)."""
+    with count_hashes() as counts:
+        start = time.perf_counter()
+        nodes, rels = parse(path, limit)
+        for entity in nodes + rels:
+            entity.to_dict()
+        merged = {}
+        for node in nodes:
+            existing = merged.get(node.node_id)
+            merged[node.node_id] = node if existing is None else existing.merge(node)
+        for rel in rels:
+            existing = merged.get(rel.rel_id)
+            merged[rel.rel_id] = rel if existing is None else existing.merge(rel)
+        elapsed = time.perf_counter() - start
+    return elapsed, dict(counts), len(merged)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv", default="data/50k_public.csv", help="Input CSV")
+    parser.add_argument("--limit", type=int, default=None, help="Only parse the first N rows")
+    args = parser.parse_args()
+
+    with memo_disabled():
+        base_time, base_counts, base_unique = run(args.csv, args.limit)
+    memo_time, memo_counts, memo_unique = run(args.csv, args.limit)
+    assert base_unique == memo_unique, "memoized run produced different entities"
+
+    print(f"{'':12}{'node hashes':>14}{'rel hashes':>14}{'seconds':>10}")
+    print(f"{'unmemoized':12}{base_counts['node']:>14,}{base_counts['rel']:>14,}{base_time:>10.2f}")
+    print(f"{'memoized':12}{memo_counts['node']:>14,}{memo_counts['rel']:>14,}{memo_time:>10.2f}")
+    saved = (base_counts["node"] + base_counts["rel"]) - (memo_counts["node"] + memo_counts["rel"])
+    print(f"\nRedundant hashes removed: {saved:,} ({base_time / memo_time:.2f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
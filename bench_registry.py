@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Benchmark Neo4j label matching in Registry.deserialize_node_from_labels.
+
+Generates N node records with mixed label sets (e.g. Domain nodes that are
+also MailServer/WebServer) and times:
+
+- label matching alone, with the original scan over class_to_labels versus the
+  indexed and memoized Registry.match_labels()
+- full deserialize_node_from_labels() over the same records
+"""
+
+import argparse
+import random
+import time
+
+from networksdb.registry import registry
+
+LABEL_SETS = [
+    (["Domain"], {"address": "example.com"}),
+    (["Domain", "MailServer"], {"address": "mail.example.com"}),
+    (["Domain", "WebServer"], {"address": "www.example.com"}),
+    (["Domain", "MailServer", "WebServer"], {"address": "mx.example.org"}),
+    (["PublicIPAddress", "IPAddress", "IPv4Address"], {"address": "203.0.113.7"}),
+    (["PrivateIPAddress", "IPAddress", "IPv4Address"], {"address": "10.0.0.7", "context": "lab"}),
+    (["EmailAddress", "Suspicious"], {"address": "bob@example.com"}),
+]
+
+
+def scan_match(class_to_labels, labels):
+    """The original best-match loop, for comparison."""
+    neo4j_label_set = set(labels)
+    best_match_class = None
+    best_match_score = 0
+    best_match_labels = set()
+    for cls, cls_labels in class_to_labels.items():
+        score = len(cls_labels & neo4j_label_set)
+        if score > best_match_score:
+            best_match_class = cls
+            best_match_score = score
+            best_match_labels = cls_labels
+    return best_match_class, list(neo4j_label_set - best_match_labels)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000, help="Number of node records")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--skip-deserialize", action="store_true",
+                        help="Only time label matching")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    records = [rng.choice(LABEL_SETS) for _ in range(args.count)]
+    # Neo4j returns labels in no particular order
+    records = [(rng.sample(labels, len(labels)), data) for labels, data in records]
+
+    start = time.perf_counter()
+    scanned = [scan_match(registry.class_to_labels, labels) for labels, _ in records]
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = [registry.match_labels(labels) for labels, _ in records]
+    index_time = time.perf_counter() - start
+
+    for (scan_cls, scan_extra), (cls, extra) in zip(scanned, indexed):
+        assert scan_cls is cls and set(scan_extra) == set(extra), "label match mismatch"
+
+    print(f"{'label matching (scan)':32}{scan_time:8.2f}s")
+    print(f"{'label matching (indexed)':32}{index_time:8.2f}s  ({scan_time / index_time:.1f}x)")
+
+    if not args.skip_deserialize:
+        start = time.perf_counter()
+        for labels, data in records:
+            registry.deserialize_node_from_labels(data, labels)
+        elapsed = time.perf_counter() - start
+        print(f"{'deserialize_node_from_labels':32}{elapsed:8.2f}s  "
+              f"({args.count / elapsed:,.0f} nodes/s)")
+
+
+if __name__ == "__main__":
+    main()
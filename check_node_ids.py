@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Check that batch node_id/rel_id computation matches the per-instance path.
+
+Generates random addresses, domains and email addresses (including unicode,
+mixed case and IPv6), builds each node individually and compares node.node_id
+and rel.rel_id against compute_node_ids()/compute_rel_ids() over the same
+columns.
+"""
+
+import argparse
+import ipaddress
+import random
+import string
+import sys
+
+from networksdb.base.ids import compute_node_ids, compute_rel_ids
+from networksdb.nodes import Domain, EmailAddress, PrivateIPAddress, PublicIPAddress
+from networksdb.relationships import HasIP, Knows
+
+ALPHABET = string.ascii_letters + string.digits + "-_.äöüß漢字"
+
+
+def random_label(rng):
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(1, 20))).strip(".") or "x"
+
+
+def random_domain(rng):
+    return f"{random_label(rng)}.{rng.choice(['com', 'org', 'io', 'de', '中国'])}"
+
+
+def random_ip(rng):
+    if rng.random() < 0.2:
+        return str(ipaddress.IPv6Address(rng.getrandbits(128)))
+    return str(ipaddress.IPv4Address(rng.getrandbits(32)))
+
+
+def check_nodes(cls, rows):
+    """Compare per-instance and batch node_ids; return (nodes, mismatch count)."""
+    nodes = [cls(**row) for row in rows]
+    identifying = [
+        name for name, field_info in cls.model_fields.items()
+        if (field_info.json_schema_extra or {}).get("identifying") and name != "primary_label"
+    ]
+    columns = {name: [getattr(node, name) for node in nodes] for name in identifying}
+    batch = compute_node_ids(cls._primary_label.get_default(), columns)
+    mismatches = sum(node.node_id != node_id for node, node_id in zip(nodes, batch))
+    print(f"{cls.__name__:18} {len(nodes):>8} rows  {mismatches} mismatches")
+    return nodes, mismatches
+
+
+def check_rels(cls, starts, ends):
+    """Compare per-instance and batch rel_ids; return the mismatch count."""
+    rels = [cls(start_node=start, end_node=end) for start, end in zip(starts, ends)]
+    batch = compute_rel_ids(
+        rels[0].rel_type,
+        [start.node_id for start in starts],
+        [end.node_id for end in ends],
+        start_labels=[start.primary_label for start in starts],
+        end_labels=[end.primary_label for end in ends],
+    )
+    mismatches = sum(rel.rel_id != rel_id for rel, rel_id in zip(rels, batch))
+    print(f"{cls.__name__:18} {len(rels):>8} rows  {mismatches} mismatches")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000, help="Rows per class")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    args = parser.parse_args()
+
+    seed = args.seed if args.seed is not None else random.randrange(2**32)
+    rng = random.Random(seed)
+    print(f"seed={seed}")
+
+    addresses = [random_ip(rng) for _ in range(args.rows)]
+    public = [a for a in addresses if not ipaddress.ip_address(a).is_private]
+    private = [a for a in addresses if ipaddress.ip_address(a).is_private]
+
+    domains, failures = check_nodes(Domain, [{"address": random_domain(rng)} for _ in range(args.rows)])
+    ips, n = check_nodes(PublicIPAddress, [{"address": a} for a in public])
+    failures += n
+    _, n = check_nodes(
+        PrivateIPAddress, [{"address": a, "context": random_label(rng)} for a in private]
+    )
+    failures += n
+    emails, n = check_nodes(
+        EmailAddress,
+        [{"address": f"{random_label(rng)}@{random_domain(rng)}"} for _ in range(args.rows)],
+    )
+    failures += n
+
+    failures += check_rels(HasIP, domains[:len(ips)], ips)
+    failures += check_rels(Knows, emails, list(reversed(emails)))
+
+    if failures:
+        print(f"FAILED: {failures} mismatching ids (seed={seed})")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,14 +2,32 @@
 """
 Generate CSV data with IPv4 addresses and domain names.
 Supports public, private, or mixed IP address generation with realistic domain names.
+
+With --vectorized, rows are generated in NumPy chunks and written as CSV or
+Parquet by several processes (one output file per shard), so datasets of
+100M+ rows can be generated in bounded memory. See VectorizedNetworkDataGenerator.
 """
 
 import argparse
 import csv
+import os
 import random
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Tuple
 
+try:
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+    pa = None
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+
 
 class NetworkDataGenerator:
     def __init__(self, ip_type: str = "public", duplication_percent: float = 20.0):
@@ -177,6 +195,233 @@ class NetworkDataGenerator:
             writer.writerows(data)
 
 
+class VectorizedNetworkDataGenerator(NetworkDataGenerator):
+    """Chunked NumPy generator with the row distribution of NetworkDataGenerator.
+
+    Every unique row is a pure function of (seed, unique index): its random
+    bits come from a counter-based hash (splitmix64) of the index, so a
+    duplicate is produced by regenerating a randomly chosen unique index
+    rather than by keeping unique rows in memory. Public addresses are drawn
+    with vectorized rejection of the private/reserved ranges, and domains are
+    drawn from the finite domain vocabulary with the per-domain probabilities
+    of generate_domain().
+
+    The dataset is split into shards of consecutive rows, and shards into
+    chunks. Each chunk holds its share of the unique indexes plus duplicates of
+    uniformly random unique indexes, shuffled with an RNG seeded by
+    (seed, shard, chunk), so output depends only on the seed, shard count and
+    chunk size, not on how many processes generate it.
+    """
+
+    _GOLDEN = 0x9E3779B97F4A7C15
+    _MASK = (1 << 64) - 1
+
+    # Hash streams: independent random bits per unique index
+    _KIND, _DOMAIN, _PRIVATE, _PUBLIC = range(4)
+
+    def __init__(self, ip_type: str = "public", duplication_percent: float = 20.0, seed: int = 0):
+        if np is None:
+            raise ImportError("Vectorized generation requires numpy and pyarrow: pip install numpy pyarrow")
+        super().__init__(ip_type, duplication_percent)
+        if ip_type not in ("public", "private", "mixed"):
+            raise ValueError(f"Invalid ip_type: {ip_type}")
+        if duplication_percent < 0 or duplication_percent > 100:
+            raise ValueError("Duplication percentage must be between 0 and 100")
+        self.seed = seed
+        self._key = self._mix(np.array([seed & self._MASK], dtype=np.uint64))[0]
+        self._octets = pa.array([str(i) for i in range(256)])
+        self._domains, self._domain_cdf = self._domain_vocabulary()
+
+    def _domain_vocabulary(self):
+        """All domains generate_domain() can return, with their cumulative probabilities."""
+        bases = self.base_domains
+        subdomains = [sub for sub in self.subdomains if sub]
+        p_sub = 0.4 / len(self.subdomains)
+        p_secondary = 0.15 / len(self.secondary_subdomains)
+        p_base = (0.6 + p_sub * (len(self.subdomains) - len(subdomains))) / len(bases)
+        domains, weights = list(bases), [p_base] * len(bases)
+        for sub in subdomains:
+            domains.extend(f"{sub}.{base}" for base in bases)
+            weights.extend([p_sub * 0.85 / len(bases)] * len(bases))
+            for secondary in self.secondary_subdomains:
+                domains.extend(f"{sub}.{secondary}.{base}" for base in bases)
+                weights.extend([p_sub * p_secondary / len(bases)] * len(bases))
+        cdf = np.cumsum(weights)
+        return pa.array(domains), cdf / cdf[-1]
+
+    @staticmethod
+    def _mix(x):
+        """splitmix64 finalizer over a uint64 array (wrapping arithmetic)."""
+        x = x ^ (x >> np.uint64(30))
+        x = x * np.uint64(0xBF58476D1CE4E5B9)
+        x = x ^ (x >> np.uint64(27))
+        x = x * np.uint64(0x94D049BB133111EB)
+        return x ^ (x >> np.uint64(31))
+
+    def _bits(self, unique_ids, stream: int):
+        """64 random bits per unique index, independent per stream."""
+        counters = unique_ids * np.uint64(self._GOLDEN) + np.uint64(stream * self._GOLDEN & self._MASK)
+        return self._mix(self._mix(counters) ^ self._key)
+
+    @staticmethod
+    def _uniform(bits):
+        return (bits >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+    @staticmethod
+    def _byte(bits, index: int):
+        return ((bits >> np.uint64(8 * index)) & np.uint64(0xFF)).astype(np.uint16)
+
+    def _public_octets(self, unique_ids):
+        """Octets 1-255 each, resampling rows in private/reserved ranges."""
+        octets = np.empty((4, len(unique_ids)), dtype=np.uint16)
+        todo = np.arange(len(unique_ids))
+        stream = self._PUBLIC
+        while len(todo):
+            bits = self._bits(unique_ids[todo], stream)
+            candidate = np.stack([(self._byte(bits, i) * 255 >> 8) + 1 for i in range(4)])
+            first, second = candidate[0], candidate[1]
+            rejected = (
+                (first == 10)
+                | ((first == 172) & (second >= 16) & (second <= 31))
+                | ((first == 192) & (second == 168))
+                | (first == 127) | (first == 169) | (first >= 224)
+            )
+            accepted = ~rejected
+            octets[:, todo[accepted]] = candidate[:, accepted]
+            todo = todo[rejected]
+            stream += 1
+        return octets
+
+    def _private_octets(self, unique_ids):
+        """10.0.0.0/8, 172.16.0.0/12 or 192.168.0.0/16 (equally likely), host octet 1-254."""
+        bits = self._bits(unique_ids, self._PRIVATE)
+        ip_class = ((bits >> np.uint64(32)) * np.uint64(3) >> np.uint64(32)).astype(np.uint8)
+        b0, b1, b2 = (self._byte(bits, i) for i in range(3))
+        host = (b2 * 254 >> 8) + 1
+        octets = np.empty((4, len(unique_ids)), dtype=np.uint16)
+        octets[0] = np.choose(ip_class, [10, 172, 192])
+        octets[1] = np.choose(ip_class, [b0, 16 + (b0 >> 4), np.full_like(b0, 168)])
+        octets[2] = np.choose(ip_class, [b1, b1, b0])
+        octets[3] = np.choose(ip_class, [host, host, (b1 * 254 >> 8) + 1])
+        return octets
+
+    def generate_columns(self, unique_ids):
+        """Build the (ipv4_address, domain) rows of the given unique indexes.
+
+        Args:
+            unique_ids: uint64 array of unique row indexes (repeats are duplicates)
+
+        Returns:
+            pyarrow.Table with ipv4_address and domain columns, in input order
+        """
+        unique_ids = np.asarray(unique_ids, dtype=np.uint64)
+        if self.ip_type == "public":
+            octets = self._public_octets(unique_ids)
+        elif self.ip_type == "private":
+            octets = self._private_octets(unique_ids)
+        else:
+            # 70% public, 30% private, as in generate_ip()
+            public = self._uniform(self._bits(unique_ids, self._KIND)) < 0.7
+            octets = self._private_octets(unique_ids)
+            octets[:, public] = self._public_octets(unique_ids[public])
+        addresses = pc.binary_join_element_wise(
+            *(self._octets.take(pa.array(row)) for row in octets), "."
+        )
+        domain_ids = np.searchsorted(self._domain_cdf, self._uniform(self._bits(unique_ids, self._DOMAIN)), side="right")
+        domains = self._domains.take(pa.array(np.minimum(domain_ids, len(self._domain_cdf) - 1)))
+        return pa.table({"ipv4_address": addresses, "domain": domains})
+
+    def unique_count(self, num_rows: int) -> int:
+        """Number of unique rows in a dataset of num_rows (as generate_data())."""
+        return max(1, int(num_rows * (100 - self.duplication_percent) / 100))
+
+    def chunk_unique_ids(self, num_rows: int, start: int, stop: int, rng):
+        """Shuffled unique indexes of rows [start, stop) of a num_rows dataset.
+
+        Unique indexes are spread over rows in proportion, so each unique row
+        appears exactly once overall; the remaining rows of the chunk are
+        duplicates of uniformly random unique rows.
+        """
+        unique_total = self.unique_count(num_rows)
+        first = unique_total * start // num_rows
+        last = unique_total * stop // num_rows
+        duplicates = rng.integers(0, unique_total, size=(stop - start) - (last - first), dtype=np.uint64)
+        unique_ids = np.concatenate([np.arange(first, last, dtype=np.uint64), duplicates])
+        rng.shuffle(unique_ids)
+        return unique_ids
+
+    def write_shard(self, num_rows: int, shard: int, shards: int, output_file: str,
+                    file_format: str = "csv", chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Write one shard's rows (a contiguous share of num_rows) chunk by chunk.
+
+        Returns:
+            Number of rows written
+        """
+        start = num_rows * shard // shards
+        stop = num_rows * (shard + 1) // shards
+        schema = pa.schema([("ipv4_address", pa.string()), ("domain", pa.string())])
+        if file_format == "parquet":
+            sink = None
+            writer = pq.ParquetWriter(output_file, schema, compression="zstd")
+        else:
+            # Header written here: pyarrow quotes header names
+            sink = pa.OSFile(output_file, "wb")
+            sink.write(",".join(schema.names).encode() + b"\n")
+            writer = pa_csv.CSVWriter(sink, schema, write_options=pa_csv.WriteOptions(
+                include_header=False,
+                # Addresses and domains never contain delimiters or quotes
+                quoting_style="none",
+            ))
+        try:
+            for chunk, chunk_start in enumerate(range(start, stop, chunk_size)):
+                chunk_stop = min(chunk_start + chunk_size, stop)
+                rng = np.random.default_rng([self.seed, shard, chunk])
+                writer.write_table(self.generate_columns(self.chunk_unique_ids(num_rows, chunk_start, chunk_stop, rng)))
+        finally:
+            writer.close()
+            if sink is not None:
+                sink.close()
+        return stop - start
+
+
+def shard_path(output_file: str, shard: int, shards: int) -> str:
+    """Output file of a shard: the output itself, or <stem>-00001-of-00004<ext>."""
+    if shards == 1:
+        return output_file
+    stem, ext = os.path.splitext(output_file)
+    return f"{stem}-{shard:05d}-of-{shards:05d}{ext}"
+
+
+def _write_shard(args) -> Tuple[str, int]:
+    ip_type, duplication, seed, num_rows, shard, shards, output_file, file_format, chunk_size = args
+    generator = VectorizedNetworkDataGenerator(ip_type, duplication, seed)
+    path = shard_path(output_file, shard, shards)
+    rows = generator.write_shard(num_rows, shard, shards, path, file_format, chunk_size)
+    print(f"Wrote {rows:,} rows to {path}", file=sys.stderr)
+    return path, rows
+
+
+def generate_sharded(num_rows: int, output_file: str, ip_type: str = "public",
+                     duplication_percent: float = 20.0, seed: int = 0, shards: int = 1,
+                     workers: int = 1, file_format: str = "csv",
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Tuple[str, int]]:
+    """Generate num_rows rows into `shards` files using `workers` processes.
+
+    Returns:
+        (path, rows) per shard
+    """
+    # Validate arguments before starting workers
+    VectorizedNetworkDataGenerator(ip_type, duplication_percent, seed)
+    tasks = [
+        (ip_type, duplication_percent, seed, num_rows, shard, shards, output_file, file_format, chunk_size)
+        for shard in range(shards)
+    ]
+    if workers == 1:
+        return [_write_shard(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_write_shard, tasks))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate CSV with IPv4 addresses and domain names"
@@ -203,6 +448,41 @@ def main():
         default=20.0,
         help="Percentage of duplicate rows (0-100, default: 20)"
     )
+    parser.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="Generate in NumPy chunks with multiple processes (requires numpy and pyarrow)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["csv", "parquet"],
+        default="csv",
+        help="Output format with --vectorized (default: csv)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes with --vectorized, at most one per shard (default: CPU count)"
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Output files with --vectorized; part of what --seed output depends on (default: 1)"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Rows generated at a time with --vectorized (default: {DEFAULT_CHUNK_SIZE:,})"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed with --vectorized (default: 0)"
+    )
 
     args = parser.parse_args()
 
@@ -216,6 +496,19 @@ def main():
 
     print(f"Generating {args.rows:,} rows with {args.ip_type} IP addresses and {args.duplication}% duplication...", file=sys.stderr)
 
+    if args.vectorized:
+        shards = args.shards
+        if args.workers <= 0 or shards <= 0 or args.chunk_size <= 0:
+            print("Error: --workers, --shards and --chunk-size must be positive", file=sys.stderr)
+            sys.exit(1)
+        results = generate_sharded(
+            args.rows, args.output, args.ip_type, args.duplication, args.seed,
+            shards, min(args.workers, shards), args.format, args.chunk_size,
+        )
+        total = sum(rows for _, rows in results)
+        print(f"Successfully generated {total:,} rows to {len(results)} file(s)", file=sys.stderr)
+        return
+
     generator = NetworkDataGenerator(args.ip_type, args.duplication)
     data = generator.generate_data(args.rows)
     generator.write_csv(data, args.output)
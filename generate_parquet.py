@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Convert an IPv4/domain CSV (as written by generate_csv.py) to canonical Parquet.
+Each row becomes a Domain node, a PublicIPAddress/PrivateIPAddress node and a
+HAS_IP relationship, written with networksdb.io.parquet partitioned by
+primary_label/rel_type. The default builds the data/network_data.parquet fixture.
+"""
+
+import argparse
+import csv
+import sys
+
+from networksdb.io.parquet import DEFAULT_ROW_GROUP_SIZE, CanonicalParquetWriter
+from networksdb.nodes import Domain, PrivateIPAddress, PublicIPAddress
+from networksdb.relationships import HasIP
+from networksdb.transforms import classify_ip
+
+
+def read_entities(path: str):
+    """Yield the nodes and HAS_IP relationship of each CSV row."""
+    with open(path, newline='', encoding='utf-8') as csvfile:
+        for row in csv.DictReader(csvfile, skipinitialspace=True):
+            domain = Domain(address=row['domain'])
+            address = row['ipv4_address']
+            if classify_ip({'address': address}) == 'PrivateIPAddress':
+                ip = PrivateIPAddress(address=address, context=row['domain'])
+            else:
+                ip = PublicIPAddress(address=address)
+            yield domain
+            yield ip
+            yield HasIP(start_node=domain, end_node=ip)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert an IPv4/domain CSV to canonical Parquet"
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default="data/network_data.csv",
+        help="Input CSV filename (default: data/network_data.csv)"
+    )
+    parser.add_argument(
+        "-o", "--output",
+        default="data/network_data.parquet",
+        help="Output directory (default: data/network_data.parquet)"
+    )
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=DEFAULT_ROW_GROUP_SIZE,
+        help=f"Rows per Parquet row group (default: {DEFAULT_ROW_GROUP_SIZE:,})"
+    )
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        default=None,
+        help="zstd compression level (default: codec default)"
+    )
+
+    args = parser.parse_args()
+
+    with CanonicalParquetWriter(
+        args.output,
+        row_group_size=args.row_group_size,
+        compression_level=args.compression_level,
+    ) as writer:
+        writer.write_all(read_entities(args.input))
+
+    for entity, paths in writer.close().items():
+        print(f"{entity}: {', '.join(paths)}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,98 +1,83 @@
 #!/usr/bin/env python3
 """
 Script to insert CSV data into Trino Iceberg table.
-Usage: python insert_into_trino.py
+Rows are loaded with networksdb.io.trino: parameterized multi-row INSERTs,
+run as concurrent batches over a connection pool with retries.
+Usage: python insert_into_trino.py [--csv data/50k_public.csv] [--workers 4]
 """
 
+import argparse
 import csv
-from trino.dbapi import connect
-from trino.exceptions import TrinoUserError
+import sys
+
+from networksdb.io.trino import DEFAULT_BATCH_SIZE, DEFAULT_WORKERS, TrinoLoader, trino_connect
+
+TABLE = 'iceberg.testdb."50k_public"'
+COLUMNS = ['ipv4_address', 'domain']
+
+
+def read_rows(path):
+    """Yield (ipv4_address, domain) tuples from the CSV."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            yield row['ipv4_address'], row['domain']
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Insert CSV data into a Trino Iceberg table")
+    parser.add_argument("--csv", default="data/50k_public.csv", help="Input CSV file")
+    parser.add_argument("--host", default="localhost", help="Trino host")
+    parser.add_argument("--port", type=int, default=8080, help="Trino port")
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+        help=f"Rows per INSERT statement (default: {DEFAULT_BATCH_SIZE:,})"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=DEFAULT_WORKERS,
+        help=f"Concurrent batches (default: {DEFAULT_WORKERS})"
+    )
+    args = parser.parse_args()
+
     # Trino connection settings from parsers/trino.yaml
-    conn = connect(
-        host='localhost',
-        port=8080,
+    connect = trino_connect(
+        host=args.host,
+        port=args.port,
         user='trino',
         catalog='iceberg',
         schema='testdb',
         http_scheme='http'
     )
 
-    cur = conn.cursor()
-
-    # Create table if it doesn't exist
-    print("Creating table iceberg.testdb.50k_public...")
-    try:
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS iceberg.testdb."50k_public" (
+    with TrinoLoader(connect, TABLE, COLUMNS, batch_size=args.batch_size, workers=args.workers) as loader:
+        print(f"Creating table {TABLE}...")
+        loader.execute(f"""
+            CREATE TABLE IF NOT EXISTS {TABLE} (
                 ipv4_address VARCHAR,
                 domain VARCHAR
             )
             WITH (format = 'PARQUET')
-        """)
-        print("Table created successfully.")
-    except TrinoUserError as e:
-        print(f"Error creating table: {e}")
-        conn.close()
-        return
+        """, idempotent=True)
 
-    # Read CSV and insert in batches
-    csv_file = 'data/50k_public.csv'
-    batch_size = 10000
-
-    print(f"Reading CSV file: {csv_file}")
-
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        batch = []
-        total_inserted = 0
-
-        for row in reader:
-            # Escape single quotes in the data
-            ipv4 = row['ipv4_address'].replace("'", "''")
-            domain = row['domain'].replace("'", "''")
-            batch.append(f"('{ipv4}', '{domain}')")
-
-            if len(batch) >= batch_size:
-                # Insert batch
-                values = ',\n'.join(batch)
-                insert_sql = f'INSERT INTO iceberg.testdb."50k_public" VALUES {values}'
-
-                try:
-                    cur.execute(insert_sql)
-                    total_inserted += len(batch)
-                    print(f"Inserted {total_inserted} rows...")
-                    batch = []
-                except TrinoUserError as e:
-                    print(f"Error inserting batch: {e}")
-                    conn.close()
-                    return
-
-        # Insert remaining rows
-        if batch:
-            values = ',\n'.join(batch)
-            insert_sql = f'INSERT INTO iceberg.testdb."50k_public" VALUES {values}'
-
-            try:
-                cur.execute(insert_sql)
-                total_inserted += len(batch)
-                print(f"Inserted {total_inserted} rows...")
-            except TrinoUserError as e:
-                print(f"Error inserting final batch: {e}")
-                conn.close()
-                return
+        print(f"Reading CSV file: {args.csv}")
+        try:
+            stats = loader.load_rows(
+                read_rows(args.csv),
+                on_batch=lambda s: print(f"Inserted {s.rows:,} rows ({s.rows_per_second:,.0f} rows/s)...")
+            )
+        except Exception as e:
+            print(f"Error inserting rows: {e}", file=sys.stderr)
+            return 1
+        print(f"Inserted {stats.rows:,} rows in {stats.elapsed:.1f}s "
+              f"({stats.rows_per_second:,.0f} rows/s, {stats.retries} retries)")
 
-    # Verify the count
-    print("\nVerifying insert...")
-    cur.execute('SELECT COUNT(*) FROM iceberg.testdb."50k_public"')
-    count = cur.fetchone()[0]
-    print(f"Total rows in table: {count}")
+        # Verify the count
+        print("\nVerifying insert...")
+        count = loader.execute(f'SELECT COUNT(*) FROM {TABLE}')[0][0]
+        print(f"Total rows in table: {count}")
 
-    conn.close()
     print("\nDone!")
+    return 0
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -39,6 +39,21 @@ setup(
             "black",
             "mypy",
         ],
+        "arrow": [
+            "pyarrow",
+        ],
+        "numpy": [
+            "numpy",
+        ],
+        "orjson": [
+            "orjson",
+        ],
+        "trino": [
+            "trino",
+        ],
+        "zstd": [
+            "zstandard",
+        ],
     },
     entry_points={
         "console_scripts": [
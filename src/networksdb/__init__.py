@@ -1,4 +1,5 @@
 """Generated Ziptie graph models."""
+import importlib
 
 # Import registry for convenience (safe imports for generation-time use)
 try:
@@ -18,24 +19,41 @@ try:
         deserialize_relationship,
         deserialize_node_from_labels,
         deserialize_neo4j_node,
+        deserialize_many,
     )
 except ImportError:
     # Registry not yet generated - will be available after generation completes
     pass
 
-# Import SQL metadata for ziptie-parsing consumption
-try:
-    from .sql_metadata import sql_metadata
-except ImportError:
-    # SQL metadata not yet generated
-    pass
+# SQL metadata (for ziptie-parsing consumption) and constants are loaded on
+# first access (PEP 562), like the classes behind the registry
+_LAZY_ATTRIBUTES = {
+    "sql_metadata": ".sql_metadata",
+    "Labels": ".constants",
+    "Properties": ".constants",
+    "RelationshipTypes": ".constants",
+    "load_metadata_from_package": ".metadata",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(module_name, __name__)
+    except ImportError as exc:
+        # Not yet generated
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from exc
+    value = getattr(module, name)
+    # Importing .sql_metadata bound the submodule to the same name; the dict wins
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-# Import constants for convenience
-try:
-    from .constants import Labels, Properties, RelationshipTypes
-except ImportError:
-    # Constants not yet generated
-    pass
 
 __all__ = [
     "registry",
@@ -53,8 +71,10 @@ __all__ = [
     "deserialize_relationship",
     "deserialize_node_from_labels",
     "deserialize_neo4j_node",
+    "deserialize_many",
     # SQL metadata (for ziptie-parsing)
     "sql_metadata",
+    "load_metadata_from_package",
     # Constants
     "Labels",
     "Properties",
@@ -0,0 +1,179 @@
+"""Fixed pyarrow schemas for canonical node/relationship tables.
+
+Each entity type in sql_metadata maps to one Arrow schema in the canonical
+to_dict() layout, with the property containers as typed structs:
+
+- identifying_properties: struct of the schema's identifying properties
+- properties: struct of the schema's regular properties
+- dynamic_properties: JSON string of the properties not defined by the schema
+  (only for entities with has_dynamic_properties)
+
+Writers can build record batches straight against this schema (see
+canonical_batch()) instead of inferring a schema per batch or reconciling
+per-batch schemas with diagonal concats.
+
+Timestamps stay ISO 8601 strings, as in to_dict(). Embedded node properties
+(e.g. Email.from_rel) are not serialized by to_dict() and have no column. A
+container with no fields (e.g. Email's identifying_properties) is left out,
+since Parquet cannot store a struct without children.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .base.serialization import dumps_json
+from .metadata import EntityMetadata, PropertyMetadata, load_metadata_from_package
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+# Property types from sql_metadata that to_dict() does not serialize
+_EMBEDDED_TYPES = frozenset({'node', 'node_list'})
+
+_schemas: Dict[str, Any] = {}
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("Arrow schemas require pyarrow: pip install pyarrow")
+
+
+def arrow_type(prop: PropertyMetadata) -> Any:
+    """Arrow type of a scalar/list/struct property.
+
+    Raises:
+        ValueError: If the sql_metadata type has no Arrow mapping
+    """
+    _require_pyarrow()
+    kind = prop.type
+    if kind in ('string', 'iso8601_timestamp'):
+        return pa.string()
+    if kind == 'int':
+        return pa.int64()
+    if kind == 'float':
+        return pa.float64()
+    if kind == 'bool':
+        return pa.bool_()
+    if kind == 'list':
+        item = PropertyMetadata(prop.name, {'type': prop.items_type or 'string'})
+        return pa.list_(arrow_type(item))
+    if kind == 'dict' and prop.fields:
+        return pa.struct([
+            pa.field(field.name, arrow_type(field), nullable=not field.required)
+            for field in prop.fields
+        ])
+    raise ValueError(f"No Arrow type for property '{prop.name}' of type '{kind}'")
+
+
+def _container_type(entity: EntityMetadata, names: Tuple[str, ...]) -> Optional[Any]:
+    fields = [
+        pa.field(name, arrow_type(entity.properties[name]))
+        for name in names
+        if entity.properties[name].type not in _EMBEDDED_TYPES
+    ]
+    return pa.struct(fields) if fields else None
+
+
+def arrow_schema(entity_type_name: str) -> Any:
+    """Return the fixed canonical Arrow schema of an entity type.
+
+    Schemas are built once per entity and carry the entity name and
+    schema_version as schema metadata.
+
+    Args:
+        entity_type_name: Primary label or relationship type (e.g. "HAS_IP")
+
+    Returns:
+        pyarrow.Schema
+
+    Raises:
+        ImportError: If pyarrow is not installed
+        KeyError: If the entity type is not in sql_metadata
+    """
+    _require_pyarrow()
+    schema = _schemas.get(entity_type_name)
+    if schema is not None:
+        return schema
+
+    entity = load_metadata_from_package(__package__).get_entity(entity_type_name)
+    containers = {
+        'identifying_properties': _container_type(entity, entity.identifying_fields),
+        'properties': _container_type(entity, entity.regular_fields),
+        'dynamic_properties': pa.string() if entity.has_dynamic_properties else None,
+    }
+    fields = []
+    for name, prop in entity.canonical.items():
+        if name in containers:
+            if containers[name] is not None:
+                fields.append(pa.field(name, containers[name], nullable=name == 'dynamic_properties'))
+        else:
+            fields.append(pa.field(name, arrow_type(prop), nullable=not prop.required))
+    schema = _schemas[entity_type_name] = pa.schema(fields, metadata={
+        'entity': entity.name,
+        'schema_version': entity.schema_version or '',
+    })
+    return schema
+
+
+def canonical_batch(records: Iterable[Dict[str, Any]], entity_type_name: str) -> Any:
+    """Build a RecordBatch of to_dict() records against the entity's fixed schema.
+
+    to_dict() keeps dynamic properties in 'properties'; they are moved to the
+    dynamic_properties JSON column (null when a record has none).
+
+    Args:
+        records: to_dict() output (serialize_containers=False) of one entity type
+        entity_type_name: Primary label or relationship type of the records
+
+    Returns:
+        pyarrow.RecordBatch with exactly arrow_schema(entity_type_name)
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    schema = arrow_schema(entity_type_name)
+    if 'dynamic_properties' not in schema.names:
+        rows = records
+    else:
+        entity = load_metadata_from_package(__package__).get_entity(entity_type_name)
+        regular = frozenset(entity.regular_fields)
+        rows = []
+        for record in records:
+            dynamic = {
+                key: value for key, value in (record.get('properties') or {}).items()
+                if key not in regular
+            }
+            row = dict(record)
+            row['dynamic_properties'] = dumps_json(dynamic) if dynamic else None
+            rows.append(row)
+    return pa.RecordBatch.from_pylist(list(rows), schema=schema)
+
+
+def canonical_columns(is_relationship: bool) -> Dict[str, List[Any]]:
+    """Top-level columns of all node (or relationship) schemas.
+
+    Returns:
+        Mapping of column name to the distinct Arrow types it has across
+        entities, in first-seen order. Columns that some entity lacks can be
+        found by comparing against required_columns().
+    """
+    columns: Dict[str, List[Any]] = {}
+    for entity in _entities(is_relationship):
+        for field in arrow_schema(entity.name):
+            types = columns.setdefault(field.name, [])
+            if field.type not in types:
+                types.append(field.type)
+    return columns
+
+
+def required_columns(is_relationship: bool) -> List[str]:
+    """Top-level columns present in every node (or relationship) schema."""
+    schemas = [arrow_schema(entity.name) for entity in _entities(is_relationship)]
+    if not schemas:
+        return []
+    return [name for name in schemas[0].names if all(name in schema.names for schema in schemas)]
+
+
+def _entities(is_relationship: bool) -> List[EntityMetadata]:
+    registry = load_metadata_from_package(__package__)
+    return [entity for entity in registry.entities.values() if entity.is_relationship == is_relationship]
@@ -5,8 +5,15 @@ This module re-exports the base classes from ziptie_schema.base for convenience.
 from ziptie_schema.base.models import BaseNode, BaseRelationship
 from ziptie_schema.base.mixins import IDGenerationMixin
 
+from .node_pool import NodePool, active_pool, intern_nodes
+from .node_ref import NodeRef
+
 __all__ = [
     "BaseNode",
     "BaseRelationship", 
     "IDGenerationMixin",
+    "NodePool",
+    "NodeRef",
+    "active_pool",
+    "intern_nodes",
 ]
\ No newline at end of file
@@ -0,0 +1,700 @@
+"""Columnar construction of canonical node and relationship rows.
+
+This module builds the canonical ``to_dict()`` format (see
+``sql_metadata["_canonical_formats"]``) for a whole batch of rows at once. The
+same normalizers, validators, classifier and node_id/rel_id computation that
+model construction applies per instance are applied column by column, so no
+per-row model instance is built. Relationships are built from endpoint label
+and node_id columns alone, without endpoint node instances, including the
+relationships implied by the embedded nodes of many nodes at once.
+"""
+
+import importlib
+import sys
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from pydantic import TypeAdapter
+from ziptie_schema.classification import ClassificationError
+
+from .ids import _class_labels, _endpoint_labels, _node_class, node_ids_for_class, rel_ids_for_class
+from .node_pairs import find_label_pair, invalid_pair_error
+from .serialization import _is_datetime_field, dumps_json
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+
+# Fields handled by the canonical envelope rather than the property containers
+_ENVELOPE_FIELDS = ('node_id', 'labels', 'primary_label', 'additional_labels')
+_REL_ENVELOPE_FIELDS = ('rel_id', 'rel_type', 'start_node', 'end_node')
+
+# Edges per table emitted by embedded_relationship_batches
+DEFAULT_EDGE_BATCH_SIZE = 65_536
+
+
+class _FieldPlan(NamedTuple):
+    """Precomputed per-field processing steps."""
+    name: str
+    description: str
+    required: bool
+    identifying: bool
+    is_datetime: bool
+    normalizers: Tuple[Tuple[str, Callable[[Any], Any]], ...]
+    validators: Tuple[Tuple[str, Callable[[Any], bool]], ...]
+    adapter: TypeAdapter
+    default: Callable[[], Any]
+
+
+class _ClassPlan(NamedTuple):
+    """Precomputed processing steps for one node class."""
+    fields: Tuple[_FieldPlan, ...]
+    field_names: frozenset
+    extra: str
+    ignored: frozenset
+    label_enricher: Optional[Callable[[dict], List[str]]]
+
+
+_PLANS: Dict[type, _ClassPlan] = {}
+
+
+def _resolve(path: str) -> Callable[..., Any]:
+    """Import a transform by its dotted path (e.g. ``ziptie_schema.trim``)."""
+    module_name, attr = path.rsplit('.', 1)
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _class_attr(cls: type, name: str, default: Any = None) -> Any:
+    """Read a class attribute, unwrapping Pydantic private attribute defaults."""
+    value = getattr(cls, name, default)
+    if hasattr(value, 'get_default'):
+        return value.get_default()
+    return value
+
+
+def _plan_for(cls: type) -> _ClassPlan:
+    """Build (once) the column processing plan for a node class."""
+    plan = _PLANS.get(cls)
+    if plan is not None:
+        return plan
+
+    fields = []
+    for field_name, field_info in cls.model_fields.items():
+        if field_name in _ENVELOPE_FIELDS or field_name in _REL_ENVELOPE_FIELDS or field_info.exclude:
+            continue
+
+        metadata = field_info.json_schema_extra or {}
+        if metadata.get('property_type') in ('node', 'node_list'):
+            raise TypeError(
+                f"{cls.__name__}.from_columns does not support embedded node "
+                f"property '{field_name}'; instantiate {cls.__name__} per row instead"
+            )
+
+        def default(field_info=field_info):
+            return field_info.get_default(call_default_factory=True)
+
+        fields.append(_FieldPlan(
+            name=field_name,
+            description=field_info.description or field_name,
+            required=field_info.is_required(),
+            identifying=bool(metadata.get('identifying', False)),
+            is_datetime=_is_datetime_field(field_info),
+            normalizers=tuple((p, _resolve(p)) for p in metadata.get('normalizers', [])),
+            validators=tuple((p, _resolve(p)) for p in metadata.get('validators', [])),
+            adapter=TypeAdapter(List[field_info.annotation]),
+            default=default,
+        ))
+
+    enricher_path = _class_attr(cls, '_label_enricher')
+    plan = _ClassPlan(
+        fields=tuple(fields),
+        field_names=frozenset(cls.model_fields),
+        extra=cls.model_config.get('extra') or 'ignore',
+        ignored=frozenset(_class_attr(cls, '_ignored_properties') or ()),
+        label_enricher=_resolve(enricher_path) if enricher_path else None,
+    )
+    _PLANS[cls] = plan
+    return plan
+
+
+def _to_columns(table: Any) -> Tuple[Dict[str, list], int, str]:
+    """Convert a pyarrow/Polars table (or dict of lists) to Python column lists."""
+    if type(table).__module__.split('.', 1)[0] == 'polars':
+        columns = table.to_dict(as_series=False)
+        kind = 'polars'
+    elif hasattr(table, 'to_pydict'):
+        columns = table.to_pydict()
+        kind = 'arrow'
+    elif isinstance(table, dict):
+        columns = {name: list(values) for name, values in table.items()}
+        kind = 'arrow'
+    else:
+        raise TypeError(
+            f"Expected a pyarrow Table/RecordBatch or Polars DataFrame, "
+            f"got {type(table).__name__}"
+        )
+
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+    return columns, lengths.pop() if lengths else 0, kind
+
+
+def _serialize_value(value: Any) -> Any:
+    """Convert datetime objects to ISO format strings, as ``to_dict()`` does."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _normalize(field: _FieldPlan, values: List[Any]) -> List[Any]:
+    """Apply a field's normalizers to every non-null value of a column."""
+    for _, normalizer in field.normalizers:
+        normalized = []
+        for value in values:
+            if value is None:
+                normalized.append(value)
+                continue
+            try:
+                normalized.append(normalizer(value))
+            except Exception as e:
+                raise ValueError(
+                    f"Failed to process '{field.name}' ({field.description}): {str(e)}"
+                ) from e
+        values = normalized
+    return values
+
+
+def _process_field(
+    cls: type,
+    field: _FieldPlan,
+    values: List[Any],
+    rows: Sequence[int],
+) -> List[Any]:
+    """Normalize, type-validate and run validators over one column."""
+    values = _normalize(field, values)
+
+    if field.required:
+        for row, value in zip(rows, values):
+            if value is None:
+                raise ValueError(
+                    f"\n{cls.__name__} is missing required fields:\n"
+                    f"  • {field.name}: {field.description} (row {row})"
+                )
+
+    values = field.adapter.validate_python(values)
+
+    for path, validator in field.validators:
+        for value in values:
+            if value is not None and not validator(value):
+                raise ValueError(f"Validation failed for {path}: {value}")
+
+    return values
+
+
+def _classify(cls: type, columns: Dict[str, list]) -> Dict[type, List[int]]:
+    """Route each row of a classifiable base class to its concrete subclass."""
+    classifier_path = _class_attr(cls, '_classifier_function')
+    classifier = _resolve(classifier_path)
+
+    # Pre-normalize with the base class normalizers, as __new__ does
+    normalized = dict(columns)
+    for field in _plan_for(cls).fields:
+        if field.name in columns and field.normalizers:
+            normalized[field.name] = _normalize(field, columns[field.name])
+
+    batch_path = _class_attr(cls, '_batch_classifier_function')
+    if batch_path:
+        # Batch classifiers take the column mapping and return the subclass
+        # names first (optionally followed by other per-row outputs)
+        result = _resolve(batch_path)(normalized)
+        subclass_names = list(result[0] if isinstance(result, tuple) else result)
+    else:
+        names = list(normalized)
+        subclass_names = [
+            classifier(dict(zip(names, row))) for row in zip(*normalized.values())
+        ]
+
+    parent_package = sys.modules[cls.__module__.rsplit('.', 1)[0]]
+    groups: Dict[type, List[int]] = {}
+    resolved: Dict[str, type] = {}
+    for row, subclass_name in enumerate(subclass_names):
+        subclass = resolved.get(subclass_name)
+        if subclass is None:
+            if subclass_name is None:
+                raise ClassificationError(
+                    f"Could not classify {cls.__name__} with provided data. "
+                    f"Classifier function '{classifier_path}' returned None "
+                    f"for row {row}."
+                )
+            subclass = getattr(parent_package, subclass_name, None)
+            if subclass is None or not issubclass(subclass, cls):
+                raise ClassificationError(
+                    f"Classifier function '{classifier_path}' returned "
+                    f"unknown subclass name: '{subclass_name}'."
+                )
+            resolved[subclass_name] = subclass
+        groups.setdefault(subclass, []).append(row)
+    return groups
+
+
+def _build_rows(
+    cls: type,
+    columns: Dict[str, list],
+    rows: Sequence[int],
+    out: Dict[str, list],
+    identifying_out: Dict[str, list],
+    properties_out: Dict[str, list],
+) -> None:
+    """Fill the canonical output columns for ``rows``, all of class ``cls``."""
+    plan = _plan_for(cls)
+    count = len(rows)
+
+    def take(values: list) -> list:
+        return [values[row] for row in rows]
+
+    unknown = set(columns) - plan.field_names - plan.ignored - set(_ENVELOPE_FIELDS)
+    if unknown and plan.extra == 'forbid':
+        raise ValueError(
+            f"{cls.__name__} does not allow dynamic properties, "
+            f"got unexpected columns: {sorted(unknown)}"
+        )
+    dynamic = sorted(unknown) if plan.extra == 'allow' else []
+
+    # Process schema-defined fields column-wise
+    processed: Dict[str, list] = {}
+    for field in plan.fields:
+        if field.name in columns:
+            values = _process_field(cls, field, take(columns[field.name]), rows)
+        elif field.required:
+            raise ValueError(
+                f"\n{cls.__name__} is missing required fields:\n"
+                f"  • {field.name}: {field.description}"
+            )
+        else:
+            values = [field.default()] * count
+        processed[field.name] = values
+
+    # Labels: static defaults, optional input column, then the label enricher
+    default_labels = cls.model_fields['additional_labels'].get_default(
+        call_default_factory=True
+    )
+    if 'additional_labels' in columns:
+        label_column = [
+            list(labels) if labels is not None else list(default_labels)
+            for labels in take(columns['additional_labels'])
+        ]
+    else:
+        label_column = [list(default_labels) for _ in range(count)]
+
+    primary_label = _class_attr(cls, '_primary_label')
+    if plan.label_enricher is not None:
+        names = list(processed)
+        for labels, values in zip(label_column, zip(*processed.values())):
+            data = dict(zip(names, values), primary_label=primary_label)
+            for label in plan.label_enricher(data) or ():
+                if label not in labels:
+                    labels.append(label)
+
+    node_ids = node_ids_for_class(cls, {
+        field.name: processed[field.name] for field in plan.fields if field.identifying
+    })
+
+    # Labels come from a template instance so they match BaseNode.labels
+    template = cls.model_construct()
+    labels_cache: Dict[tuple, list] = {}
+    labels_out = []
+    for labels in label_column:
+        key = tuple(labels)
+        if key not in labels_cache:
+            template.__dict__['additional_labels'] = labels
+            labels_cache[key] = list(template.labels)
+        labels_out.append(labels_cache[key])
+
+    # Scatter into the shared output columns
+    n = len(out['node_id'])
+    for field in plan.fields:
+        target = identifying_out if field.identifying else properties_out
+        column = target.setdefault(field.name, [None] * n)
+        values = processed[field.name]
+        if field.is_datetime:
+            values = [_serialize_value(value) for value in values]
+        for row, value in zip(rows, values):
+            column[row] = value
+
+    for name in dynamic:
+        column = properties_out.setdefault(name, [None] * n)
+        for row, value in zip(rows, take(columns[name])):
+            column[row] = _serialize_value(value)
+
+    schema_version = cls.schema_version
+    for row, node_id, labels in zip(rows, node_ids, labels_out):
+        out['node_id'][row] = node_id
+        out['schema_version'][row] = schema_version
+        out['primary_label'][row] = primary_label
+        out['labels'][row] = labels
+
+    # Remember which container keys each row owns for JSON serialization
+    keys = tuple(
+        (field.name, field.identifying) for field in plan.fields
+    )
+    for row in rows:
+        out['_keys'][row] = (keys, dynamic)
+
+
+def _struct_array(columns: Dict[str, list], num_rows: int) -> Any:
+    """Build a struct array from child columns (missing fields are null)."""
+    if not columns:
+        return pa.array([{}] * num_rows, type=pa.struct([]))
+    return pa.StructArray.from_arrays(
+        [pa.array(values) for values in columns.values()],
+        names=list(columns),
+    )
+
+
+def _json_containers(
+    out: Dict[str, list],
+    identifying_out: Dict[str, list],
+    properties_out: Dict[str, list],
+    num_rows: int,
+) -> Tuple[List[str], List[str]]:
+    """Serialize each row's property containers exactly as ``to_dict()`` does."""
+    identifying_json = []
+    properties_json = []
+    for row in range(num_rows):
+        keys, dynamic = out['_keys'][row]
+        identifying = {}
+        properties = {}
+        for name, is_identifying in keys:
+            if is_identifying:
+                identifying[name] = identifying_out[name][row]
+            else:
+                properties[name] = properties_out[name][row]
+        for name in dynamic:
+            value = properties_out[name][row]
+            if value is not None:
+                properties[name] = value
+        identifying_json.append(dumps_json(identifying))
+        properties_json.append(dumps_json(properties))
+    return identifying_json, properties_json
+
+
+def nodes_from_columns(
+    cls: type,
+    table: Any,
+    serialize_containers: bool = False,
+) -> Any:
+    """Build canonical node rows for a whole column batch.
+
+    Args:
+        cls: Node class whose normalizers, validators and classifier apply
+        table: pyarrow Table/RecordBatch or Polars DataFrame with one column per
+               property (a dict of lists is also accepted)
+        serialize_containers: If True, emit identifying_properties/properties as
+                              JSON strings, otherwise as struct columns
+
+    Returns:
+        Table in the canonical node format (pyarrow Table, or Polars DataFrame
+        for Polars input), one row per input row in input order. Struct columns
+        hold the union of fields across classified subclasses; fields a row's
+        class does not define are null.
+
+    Raises:
+        ImportError: If pyarrow is not installed
+        TypeError: If the class has embedded node properties
+        ValueError: If required fields are missing or validation fails
+        ClassificationError: If a classifiable class cannot classify a row
+    """
+    if pa is None:
+        raise ImportError("from_columns requires pyarrow: pip install pyarrow")
+
+    columns, num_rows, kind = _to_columns(table)
+
+    if cls.__dict__.get('__classifiable__'):
+        groups = _classify(cls, columns)
+    else:
+        groups = {cls: list(range(num_rows))}
+
+    out: Dict[str, list] = {
+        name: [None] * num_rows
+        for name in ('node_id', 'schema_version', 'primary_label', 'labels', '_keys')
+    }
+    identifying_out: Dict[str, list] = {}
+    properties_out: Dict[str, list] = {}
+    for node_cls, rows in groups.items():
+        _build_rows(node_cls, columns, rows, out, identifying_out, properties_out)
+
+    if serialize_containers:
+        identifying_column, properties_column = _json_containers(
+            out, identifying_out, properties_out, num_rows
+        )
+        identifying_array = pa.array(identifying_column, type=pa.string())
+        properties_array = pa.array(properties_column, type=pa.string())
+    else:
+        identifying_array = _struct_array(identifying_out, num_rows)
+        properties_array = _struct_array(properties_out, num_rows)
+
+    result = pa.table({
+        'node_id': pa.array(out['node_id'], type=pa.string()),
+        'schema_version': pa.array(out['schema_version'], type=pa.string()),
+        'identifying_properties': identifying_array,
+        'properties': properties_array,
+        'primary_label': pa.array(out['primary_label'], type=pa.string()),
+        'labels': pa.array(out['labels'], type=pa.list_(pa.string())),
+    })
+
+    if kind == 'polars':
+        import polars as pl
+        return pl.from_arrow(result)
+    return result
+
+
+def _column_list(values: Any) -> list:
+    """A column (pyarrow/Polars/NumPy array or sequence) as a Python list."""
+    if hasattr(values, 'to_pylist'):
+        return values.to_pylist()
+    if hasattr(values, 'to_list'):
+        return values.to_list()
+    return list(values)
+
+
+def _check_endpoint_pairs(cls: type, start_labels: List[str], end_labels: List[str]) -> None:
+    """Validate each distinct (start, end) primary label combination once."""
+    labels_of: Dict[str, List[str]] = {}
+    for start_label, end_label in set(zip(start_labels, end_labels)):
+        for label in (start_label, end_label):
+            if label not in labels_of:
+                labels_of[label] = _class_labels(_node_class(label))
+        if find_label_pair(cls, labels_of[start_label], labels_of[end_label]) is None:
+            raise invalid_pair_error(
+                cls, start_label, end_label, labels_of[start_label], labels_of[end_label]
+            )
+
+
+def relationships_from_columns(
+    cls: type,
+    start_labels: Any,
+    start_ids: Any,
+    end_labels: Any,
+    end_ids: Any,
+    props: Any = None,
+    serialize_containers: bool = False,
+) -> Any:
+    """Build canonical relationship rows from parallel endpoint columns.
+
+    Endpoint legality is checked once per distinct label combination, against
+    the labels (primary + inherited) of the endpoint classes, and rel_ids are
+    computed in bulk; no endpoint node instances are built.
+
+    Args:
+        cls: Relationship class whose validators apply
+        start_labels: Primary label of the start nodes, one label for the whole
+                      batch or one per row (None: the class's only valid start label)
+        start_ids: node_id of each start node
+        end_labels: Same as start_labels, for the end nodes
+        end_ids: node_id of each end node
+        props: Optional pyarrow Table/RecordBatch, Polars DataFrame or dict of
+               lists of relationship properties, one row per edge
+        serialize_containers: If True, emit identifying_properties/properties as
+                              JSON strings, otherwise as struct columns
+
+    Returns:
+        Table in the canonical relationship format (pyarrow Table, or Polars
+        DataFrame for Polars props), one row per edge in input order
+
+    Raises:
+        ImportError: If pyarrow is not installed
+        KeyError: If an endpoint label is unknown
+        ValueError: If columns are ragged, an endpoint pair is not valid for
+                    the relationship, or property validation fails
+    """
+    if pa is None:
+        raise ImportError("from_endpoint_columns requires pyarrow: pip install pyarrow")
+
+    start_ids = _column_list(start_ids)
+    end_ids = _column_list(end_ids)
+    num_rows = len(start_ids)
+    if len(end_ids) != num_rows:
+        raise ValueError(f"Got {num_rows} start ids but {len(end_ids)} end ids")
+    if start_labels is not None and not isinstance(start_labels, str):
+        start_labels = _column_list(start_labels)
+    if end_labels is not None and not isinstance(end_labels, str):
+        end_labels = _column_list(end_labels)
+    start_labels = _endpoint_labels(cls, start_labels, 0, num_rows)
+    end_labels = _endpoint_labels(cls, end_labels, 1, num_rows)
+    _check_endpoint_pairs(cls, start_labels, end_labels)
+
+    if props is None:
+        columns, kind = {}, 'arrow'
+    else:
+        columns, props_rows, kind = _to_columns(props)
+        if columns and props_rows != num_rows:
+            raise ValueError(f"Got {num_rows} endpoints but {props_rows} property rows")
+
+    plan = _plan_for(cls)
+    unknown = set(columns) - plan.field_names - plan.ignored
+    if unknown and plan.extra == 'forbid':
+        raise ValueError(
+            f"{cls.__name__} does not allow dynamic properties, "
+            f"got unexpected columns: {sorted(unknown)}"
+        )
+    dynamic = sorted(unknown) if plan.extra == 'allow' else []
+
+    rows = range(num_rows)
+    processed: Dict[str, list] = {}
+    for field in plan.fields:
+        if field.name in columns:
+            values = _process_field(cls, field, columns[field.name], rows)
+        elif field.required:
+            raise ValueError(
+                f"\n{cls.__name__} is missing required fields:\n"
+                f"  • {field.name}: {field.description}"
+            )
+        else:
+            values = [field.default()] * num_rows
+        processed[field.name] = values
+
+    rel_ids = rel_ids_for_class(cls, start_ids, end_ids, start_labels, end_labels, {
+        field.name: processed[field.name] for field in plan.fields if field.identifying
+    })
+
+    identifying_out: Dict[str, list] = {}
+    properties_out: Dict[str, list] = {}
+    for field in plan.fields:
+        values = processed[field.name]
+        if field.is_datetime:
+            if field.name in columns:
+                values = [_serialize_value(value) for value in values]
+            else:
+                # Defaults are one value repeated
+                values = [_serialize_value(values[0]) if values else None] * num_rows
+        (identifying_out if field.identifying else properties_out)[field.name] = values
+    for name in dynamic:
+        properties_out[name] = [_serialize_value(value) for value in columns[name]]
+
+    if serialize_containers:
+        identifying_names = list(identifying_out)
+        property_names = list(properties_out)
+        identifying_array = pa.array([
+            dumps_json(dict(zip(identifying_names, values)))
+            for values in zip(*identifying_out.values())
+        ] if identifying_names else [dumps_json({})] * num_rows, type=pa.string())
+        properties_array = pa.array([
+            # Dynamic properties are only present when set, as in to_dict()
+            dumps_json({
+                name: value for name, value in zip(property_names, values)
+                if value is not None or name not in dynamic
+            })
+            for values in zip(*properties_out.values())
+        ] if property_names else [dumps_json({})] * num_rows, type=pa.string())
+    else:
+        identifying_array = _struct_array(identifying_out, num_rows)
+        properties_array = _struct_array(properties_out, num_rows)
+
+    def endpoint_array(labels: List[str], node_ids: List[str]) -> Any:
+        return pa.StructArray.from_arrays(
+            [pa.array(labels, type=pa.string()), pa.array(node_ids, type=pa.string())],
+            names=['primary_label', 'node_id'],
+        )
+
+    result = pa.table({
+        'rel_id': pa.array(rel_ids, type=pa.string()),
+        'schema_version': pa.array([cls.schema_version] * num_rows, type=pa.string()),
+        'identifying_properties': identifying_array,
+        'properties': properties_array,
+        'rel_type': pa.array([cls._rel_type] * num_rows, type=pa.string()),
+        'start_node': endpoint_array(start_labels, start_ids),
+        'end_node': endpoint_array(end_labels, end_ids),
+    })
+
+    if kind == 'polars':
+        import polars as pl
+        return pl.from_arrow(result)
+    return result
+
+
+def embedded_relationship_batches(
+    nodes: Iterable[Any],
+    embedded: Sequence[Tuple[str, str, bool]],
+    batch_size: int = DEFAULT_EDGE_BATCH_SIZE,
+    registry: Any = None,
+    serialize_containers: bool = False,
+) -> Iterator[Any]:
+    """Stream the relationships implied by embedded nodes as canonical tables.
+
+    The edges create_relationships() would build for each node are collected
+    as endpoint label/node_id columns, reusing the node_ids already computed
+    for the node and its embedded nodes, and emitted through
+    relationships_from_columns() without building relationship instances.
+
+    Args:
+        nodes: Iterable of nodes; consumed lazily
+        embedded: (field name, relationship type, inbound) per embedded node
+                  field, as in the node's create_relationships(); inbound
+                  edges start at the embedded node. A field holds one node or
+                  a list of nodes.
+        batch_size: Maximum number of edges per table
+        registry: Optional registry. If None, uses package's default registry.
+        serialize_containers: If True, emit identifying_properties/properties as
+                              JSON strings, otherwise as struct columns
+
+    Yields:
+        pyarrow Tables in the canonical relationship format. Each table holds
+        edges of a single relationship type, in node order; tables of
+        different types are interleaved as they fill up.
+
+    Raises:
+        ImportError: If pyarrow is not installed
+        KeyError: If a relationship type is not found in the registry
+        ValueError: If batch_size is not positive or an endpoint pair is not
+                    valid for the relationship
+    """
+    if pa is None:
+        raise ImportError("relationship batches require pyarrow: pip install pyarrow")
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    if registry is None:
+        from ..registry import registry as default_registry
+        registry = default_registry
+
+    rel_classes = {rel_type: registry.get_relationship_class(rel_type) for _, rel_type, _ in embedded}
+    # Per relationship type: start labels, start ids, end labels, end ids
+    pending: Dict[str, Tuple[list, list, list, list]] = {
+        rel_type: ([], [], [], []) for rel_type in rel_classes
+    }
+
+    def flush(rel_type: str) -> Any:
+        start_labels, start_ids, end_labels, end_ids = pending[rel_type]
+        pending[rel_type] = ([], [], [], [])
+        return relationships_from_columns(
+            rel_classes[rel_type], start_labels, start_ids, end_labels, end_ids,
+            serialize_containers=serialize_containers,
+        )
+
+    for node in nodes:
+        label, node_id = node.primary_label, node.node_id
+        for field_name, rel_type, inbound in embedded:
+            value = getattr(node, field_name)
+            if not value:
+                continue
+            start_labels, start_ids, end_labels, end_ids = pending[rel_type]
+            for other in value if isinstance(value, list) else (value,):
+                if inbound:
+                    start_labels.append(other.primary_label)
+                    start_ids.append(other.node_id)
+                    end_labels.append(label)
+                    end_ids.append(node_id)
+                else:
+                    start_labels.append(label)
+                    start_ids.append(node_id)
+                    end_labels.append(other.primary_label)
+                    end_ids.append(other.node_id)
+                if len(start_ids) >= batch_size:
+                    yield flush(rel_type)
+                    start_labels, start_ids, end_labels, end_ids = pending[rel_type]
+
+    for rel_type, columns in pending.items():
+        if columns[1]:
+            yield flush(rel_type)
@@ -0,0 +1,97 @@
+"""Unvalidated model construction for trusted data.
+
+model_construct() resolves every default through Pydantic's generic machinery
+(alias lookups, smart_deepcopy, private attribute initialization) on each call,
+which makes it slower than full validation for these small models. construct()
+resolves each class's defaults once and builds instances directly.
+"""
+import copy
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from pydantic_core import PydanticUndefined
+
+_IMMUTABLE = (str, int, float, bool, bytes, tuple, frozenset, type(None))
+
+
+class _ConstructPlan(NamedTuple):
+    fields: Tuple[Tuple[str, Callable[[], Any]], ...]
+    private: Tuple[Tuple[str, Callable[[], Any]], ...]
+    allow_extra: bool
+    # False when the class defines its own model_post_init
+    direct: bool
+
+
+_plans: Dict[type, _ConstructPlan] = {}
+
+
+def _default_getter(default: Any, factory: Optional[Callable[[], Any]] = None) -> Callable[[], Any]:
+    if factory is not None:
+        return factory
+    if isinstance(default, _IMMUTABLE):
+        return lambda: default
+    if type(default) in (list, set) and all(isinstance(item, _IMMUTABLE) for item in default):
+        # A shallow copy is a deep copy here, without deepcopy's memo overhead
+        return lambda: type(default)(default)
+    if type(default) is dict and all(isinstance(item, _IMMUTABLE) for item in default.values()):
+        return lambda: dict(default)
+    return lambda: copy.deepcopy(default)
+
+
+def _compile(cls: type) -> _ConstructPlan:
+    fields = []
+    for name, field_info in cls.model_fields.items():
+        if field_info.alias is not None or field_info.validation_alias is not None:
+            # Aliased fields need model_construct's alias handling
+            return _ConstructPlan((), (), False, False)
+        if field_info.is_required():
+            getter = None
+        else:
+            getter = _default_getter(field_info.default, field_info.default_factory)
+        fields.append((name, getter))
+    private = tuple(
+        (name, _default_getter(attr.default, attr.default_factory))
+        for name, attr in cls.__private_attributes__.items()
+        if attr.default is not PydanticUndefined or attr.default_factory is not None
+    )
+    post_init = getattr(cls.model_post_init, '__name__', '')
+    direct = cls.__pydantic_post_init__ is None or post_init == 'init_private_attributes'
+    return _ConstructPlan(
+        tuple(fields), private, cls.model_config.get('extra') == 'allow', direct
+    )
+
+
+def construct(cls: type, values: Dict[str, Any]) -> Any:
+    """Build an instance of cls from trusted values without validation.
+
+    Same result as ``cls.model_construct(**values)``: missing fields get their
+    defaults, unknown keys become dynamic properties only when the class allows
+    extras, and private attributes get their defaults.
+    """
+    plan = _plans.get(cls)
+    if plan is None:
+        plan = _plans[cls] = _compile(cls)
+    if not plan.direct:
+        return cls.model_construct(**values)
+
+    fields_values = {}
+    fields_set = set()
+    for name, default in plan.fields:
+        if name in values:
+            fields_values[name] = values[name]
+            fields_set.add(name)
+        elif default is not None:
+            fields_values[name] = default()
+    extra = None
+    if plan.allow_extra:
+        model_fields = cls.model_fields
+        extra = {key: value for key, value in values.items() if key not in model_fields}
+
+    instance = cls.__new__(cls)
+    object.__setattr__(instance, '__dict__', fields_values)
+    object.__setattr__(instance, '__pydantic_fields_set__', fields_set)
+    object.__setattr__(instance, '__pydantic_extra__', extra)
+    object.__setattr__(
+        instance, '__pydantic_private__',
+        {name: default() for name, default in plan.private} if plan.private else None,
+    )
+    return instance
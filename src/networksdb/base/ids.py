@@ -0,0 +1,202 @@
+"""Batch node_id / rel_id computation.
+
+IDs are produced by IDGenerationMixin from ziptie_schema, which owns the
+canonical payload layout. Rather than re-encoding that layout here, each batch
+reuses one unvalidated template instance per class: row values are written
+straight into the template and its compute_node_id()/compute_rel_id() is called,
+so batch IDs are byte-identical to the per-instance path by construction while
+no per-row model objects are built.
+"""
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+
+class _Endpoint:
+    """Minimal stand-in for a relationship endpoint node."""
+
+    __slots__ = ("primary_label", "labels", "node_id")
+
+    def __init__(self, primary_label: str, labels: List[str], node_id: Optional[str] = None):
+        self.primary_label = primary_label
+        self.labels = labels
+        self.node_id = node_id
+
+
+def _node_class(primary_label: str) -> type:
+    from ..registry import registry
+
+    if primary_label in registry.nodes:
+        return registry.nodes[primary_label]
+    # Classifiable base classes (e.g. IPAddress) are only registered by class name
+    return registry.get_node_class(primary_label)
+
+
+def _class_labels(cls: type) -> List[str]:
+    """Labels (as BaseNode.labels) of a default instance of a node class."""
+    if cls.__dict__.get("__classifiable__"):
+        # Constructing a classifiable base class classifies it, which needs properties
+        primary = cls.model_fields["primary_label"].default
+        additional = cls.model_fields["additional_labels"].get_default(call_default_factory=True) or []
+        return [primary] + [label for label in additional if label != primary]
+    return list(cls.model_construct().labels)
+
+
+def _rel_class(rel_type: str) -> type:
+    from ..registry import registry
+
+    return registry.get_relationship_by_type(rel_type)
+
+
+def node_ids_for_class(cls: type, identifying_columns: Mapping[str, Sequence[Any]]) -> List[str]:
+    """Compute node_ids for a batch of already-processed identifying values.
+
+    Args:
+        cls: Node class the rows belong to
+        identifying_columns: Identifying field name -> column of values. Values
+            must already be normalized/validated as the model would store them.
+
+    Returns:
+        One node_id per row
+    """
+    template = cls.model_construct()
+    state = template.__dict__
+    names = list(identifying_columns)
+    node_ids = []
+    for row_values in zip(*identifying_columns.values()):
+        state.update(zip(names, row_values))
+        node_ids.append(template.compute_node_id())
+    return node_ids
+
+
+def compute_node_ids(primary_label: str, identifying_columns: Mapping[str, Sequence[Any]]) -> List[str]:
+    """Compute node_ids for a column batch of identifying values.
+
+    Args:
+        primary_label: Primary label (or class name, for classifiable base
+            classes) of the nodes
+        identifying_columns: Identifying field name -> column of values, as
+            the model would store them (already normalized)
+
+    Returns:
+        One node_id per row, identical to ``node.node_id`` for each row
+
+    Raises:
+        KeyError: If primary_label is unknown
+        ValueError: If identifying columns are missing, unknown or ragged
+    """
+    cls = _node_class(primary_label)
+    expected = [
+        name for name, field_info in cls.model_fields.items()
+        if (field_info.json_schema_extra or {}).get("identifying")
+        and name != "primary_label"
+    ]
+    if set(identifying_columns) != set(expected):
+        raise ValueError(
+            f"{cls.__name__} identifying columns must be {expected}, "
+            f"got {list(identifying_columns)}"
+        )
+    lengths = {len(column) for column in identifying_columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Identifying columns have different lengths: {sorted(lengths)}")
+    return node_ids_for_class(cls, identifying_columns)
+
+
+def _endpoint_labels(
+    rel_cls: type,
+    labels: Union[str, Sequence[str], None],
+    index: int,
+    count: int,
+) -> Sequence[str]:
+    if labels is None:
+        pairs = rel_cls._valid_pairs
+        if len(pairs) != 1:
+            raise ValueError(
+                f"{rel_cls.__name__} has {len(pairs)} valid endpoint pairs; "
+                f"pass start_labels/end_labels explicitly"
+            )
+        return [pairs[0][index]] * count
+    if isinstance(labels, str):
+        return [labels] * count
+    if len(labels) != count:
+        raise ValueError(f"Expected {count} endpoint labels, got {len(labels)}")
+    return labels
+
+
+def compute_rel_ids(
+    rel_type: str,
+    start_ids: Sequence[str],
+    end_ids: Sequence[str],
+    start_labels: Union[str, Sequence[str], None] = None,
+    end_labels: Union[str, Sequence[str], None] = None,
+) -> List[str]:
+    """Compute rel_ids for a column batch of endpoint node_ids.
+
+    Args:
+        rel_type: Relationship type (e.g. "HAS_IP")
+        start_ids: node_id of each start node
+        end_ids: node_id of each end node
+        start_labels: Primary label of the start nodes, either one label for
+            the whole batch or one per row. Defaults to the relationship's only
+            valid start label.
+        end_labels: Same as start_labels, for the end nodes
+
+    Returns:
+        One rel_id per row, identical to ``rel.rel_id`` for each row
+
+    Raises:
+        KeyError: If rel_type or an endpoint label is unknown
+        ValueError: If the columns are ragged or endpoint labels are ambiguous
+    """
+    rel_cls = _rel_class(rel_type)
+    count = len(start_ids)
+    if len(end_ids) != count:
+        raise ValueError(f"Got {count} start ids but {len(end_ids)} end ids")
+    start_labels = _endpoint_labels(rel_cls, start_labels, 0, count)
+    end_labels = _endpoint_labels(rel_cls, end_labels, 1, count)
+    return rel_ids_for_class(rel_cls, start_ids, end_ids, start_labels, end_labels)
+
+
+def rel_ids_for_class(
+    rel_cls: type,
+    start_ids: Sequence[str],
+    end_ids: Sequence[str],
+    start_labels: Sequence[str],
+    end_labels: Sequence[str],
+    identifying_columns: Optional[Mapping[str, Sequence[Any]]] = None,
+) -> List[str]:
+    """Compute rel_ids for a batch of endpoints of one relationship class.
+
+    Args:
+        rel_cls: Relationship class the rows belong to
+        start_ids, end_ids: Endpoint node_ids, one per row
+        start_labels, end_labels: Endpoint primary labels, one per row
+        identifying_columns: Identifying relationship properties (field name
+            -> column of values), as the model would store them
+
+    Returns:
+        One rel_id per row
+    """
+    endpoints: Dict[str, Tuple[_Endpoint, _Endpoint]] = {}
+
+    def endpoint(label: str, side: int) -> _Endpoint:
+        pair = endpoints.get(label)
+        if pair is None:
+            labels = _class_labels(_node_class(label))
+            pair = endpoints[label] = (_Endpoint(label, labels), _Endpoint(label, labels))
+        return pair[side]
+
+    template = rel_cls.model_construct()
+    state = template.__dict__
+    names = list(identifying_columns or ())
+    identifying_rows = zip(*identifying_columns.values()) if names else None
+    rel_ids = []
+    for start_id, end_id, start_label, end_label in zip(start_ids, end_ids, start_labels, end_labels):
+        start = endpoint(start_label, 0)
+        end = endpoint(end_label, 1)
+        start.node_id = start_id
+        end.node_id = end_id
+        state["start_node"] = start
+        state["end_node"] = end
+        if identifying_rows is not None:
+            state.update(zip(names, next(identifying_rows)))
+        rel_ids.append(template.compute_rel_id())
+    return rel_ids
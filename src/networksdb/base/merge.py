@@ -4,7 +4,9 @@ This module contains merge strategy implementations used by nodes and relationsh
 to combine duplicate records according to their configured merge strategies.
 """
 
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, FrozenSet, NamedTuple, Tuple
+
+from ..metadata import load_metadata_from_package
 
 
 def error_if_different(existing: Any, new: Any, property_name: str) -> Any:
@@ -129,6 +131,80 @@ def sum_values(existing: Any, new: Any, property_name: str) -> Any:
         ) from e
 
 
+# Tags that keep frozen lists/dicts/sets distinct from tuples and each other
+_LIST_TAG = object()
+_DICT_TAG = object()
+_SET_TAG = object()
+
+
+def _freeze(item: Any) -> Any:
+    """Return a hashable stand-in for item that compares equal exactly when item does.
+
+    Lists, dicts and sets (nested at any depth) become tagged tuples/frozensets.
+    Raises TypeError for other unhashable values.
+    """
+    if isinstance(item, list):
+        return (_LIST_TAG, tuple(_freeze(value) for value in item))
+    if isinstance(item, dict):
+        return (_DICT_TAG, frozenset((key, _freeze(value)) for key, value in item.items()))
+    if isinstance(item, (set, frozenset)):
+        return (_SET_TAG, frozenset(_freeze(value) for value in item))
+    hash(item)
+    return item
+
+
+# Types that hash as-is and need no freezing
+_HASHABLE_SCALARS = frozenset({str, int, float, bool, bytes, type(None)})
+# Mutable containers the merged instance must not share with its inputs
+_CONTAINER_TYPES = frozenset({list, dict, set})
+# Private attribute carrying union accumulators from one merge() to the next
+_ACCUMULATORS = '_union_accumulators'
+
+
+class UnionAccumulator:
+    """Order-preserving union that can be extended across a whole merge fold.
+
+    Keeps its seen-set between calls, so folding n lists costs one hash per
+    item instead of re-deduplicating the growing result on every pairwise
+    merge. Unhashable list/dict items are deduplicated through _freeze.
+    """
+
+    __slots__ = ("items", "_seen", "_opaque")
+
+    def __init__(self, values: Any = None):
+        self.items: list = []
+        self._seen: set = set()
+        # Unhashable values _freeze cannot handle fall back to equality scans
+        self._opaque: list = []
+        if values:
+            self.extend(values)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def add(self, item: Any) -> bool:
+        """Append item unless an equal item was already added; return True if added."""
+        try:
+            key = item if type(item) in _HASHABLE_SCALARS else _freeze(item)
+        except TypeError:
+            if item in self._opaque:
+                return False
+            self._opaque.append(item)
+            self.items.append(item)
+            return True
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        self.items.append(item)
+        return True
+
+    def extend(self, values: Any) -> None:
+        """Add every value in order."""
+        add = self.add
+        for item in values:
+            add(item)
+
+
 def union_values(existing: Any, new: Any, property_name: str) -> Any:
     """Collect unique values (for lists).
     
@@ -145,28 +221,34 @@ def union_values(existing: Any, new: Any, property_name: str) -> Any:
     if new is None:
         return existing
     
+    _check_union_operands(existing, new, property_name)
+    
+    # Maintain order while removing duplicates
+    accumulator = UnionAccumulator(existing)
+    accumulator.extend(new)
+    return accumulator.items
+
+
+def _check_union_operands(existing: Any, new: Any, property_name: str) -> None:
     if not isinstance(existing, list) or not isinstance(new, list):
         raise TypeError(
             f"Cannot apply 'union' strategy to {property_name}: "
             f"values must be lists (existing={type(existing).__name__}, "
             f"new={type(new).__name__})"
         )
-    
-    # Maintain order while removing duplicates
-    seen = set()
-    result = []
-    for item in existing + new:
-        # Handle unhashable types by using repr as fallback
-        try:
-            if item not in seen:
-                seen.add(item)
-                result.append(item)
-        except TypeError:
-            # For unhashable types, just append (can't dedupe efficiently)
-            if item not in result:
-                result.append(item)
-    
-    return result
+
+
+def union_into(accumulator: UnionAccumulator, new: Any, property_name: str) -> list:
+    """Fold step of the union strategy for callers that keep an accumulator.
+
+    Equivalent to union_values(accumulator.items, new, property_name) but
+    without re-hashing the values already accumulated.
+    """
+    if new is None:
+        return accumulator.items
+    _check_union_operands(accumulator.items, new, property_name)
+    accumulator.extend(new)
+    return accumulator.items
 
 
 def take_any_non_null(existing: Any, new: Any, property_name: str) -> Any:
@@ -228,4 +310,212 @@ MERGE_STRATEGIES: Dict[str, Callable[[Any, Any, str], Any]] = {
     "max": max_value,
     "sum": sum_values,
     "union": union_values,
-}
\ No newline at end of file
+}
+
+
+def property_strategies(entity: str) -> Dict[str, str]:
+    """Return the merge strategy name of each schema property of an entity.
+
+    Args:
+        entity: sql_metadata entity name (primary label or relationship type)
+
+    Returns:
+        Mapping of property name to MERGE_STRATEGIES key. Properties without a
+        declared strategy default to "take_first".
+
+    Raises:
+        KeyError: If the entity is not in sql_metadata
+    """
+    entity_meta = load_metadata_from_package(__package__.rpartition('.')[0]).get_entity(entity)
+    return dict(entity_meta.merge_strategies)
+
+
+class MergePlan(NamedTuple):
+    """Static merge layout of one model class, resolved once."""
+    fields: Tuple[Tuple[str, Callable[[Any, Any, str], Any]], ...]
+    is_relationship: bool
+    include_extra: bool
+    ignored: FrozenSet[str]
+
+
+_merge_plans: Dict[type, MergePlan] = {}
+
+
+def _compile_merge_plan(cls: type) -> MergePlan:
+    fields = []
+    for name, field_info in cls.model_fields.items():
+        metadata = field_info.json_schema_extra or {}
+        strategy = metadata.get('merge_strategy')
+        if strategy is not None:
+            fields.append((name, MERGE_STRATEGIES[strategy]))
+        elif metadata.get('property_type') in ('node', 'node_list'):
+            # Embedded nodes are identifying, so duplicates share them
+            fields.append((name, take_first))
+    is_relationship = 'rel_type' in cls.model_fields
+    ignored = getattr(cls, '_ignored_properties', ())
+    if hasattr(ignored, 'get_default'):
+        ignored = ignored.get_default()
+    return MergePlan(
+        fields=tuple(fields),
+        is_relationship=is_relationship,
+        include_extra=not is_relationship and cls.model_config.get('extra') == 'allow',
+        ignored=frozenset(ignored or ()),
+    )
+
+
+def merge_plan(cls: type) -> MergePlan:
+    """Return the merge plan for cls, compiling it on first use."""
+    plan = _merge_plans.get(cls)
+    if plan is None:
+        plan = _merge_plans[cls] = _compile_merge_plan(cls)
+    return plan
+
+
+def merge_instances(existing: Any, other: Any, revalidate: bool = False) -> Any:
+    """Merge two nodes or two relationships of the same class.
+
+    This is the implementation behind the generated merge() methods. Each
+    schema property is merged with its configured strategy (applied only when
+    both values are non-null), additional labels are unioned and dynamic
+    properties use take_any_non_empty.
+
+    Args:
+        existing: The instance being merged into
+        other: Another instance of the same type
+        revalidate: If True, build the result through the model constructor so
+            all validators run again. By default the result is assembled
+            directly (as model_construct() would), since both inputs are
+            already validated.
+
+    Returns:
+        A new merged instance
+
+    Raises:
+        ValueError: If the instances have different primary labels, types or
+            endpoints, or on merge conflicts
+    """
+    cls = existing.__class__
+    plan = merge_plan(cls)
+
+    if plan.is_relationship:
+        if existing.rel_type != other.rel_type:
+            raise ValueError(
+                f"Cannot merge relationships of different types: "
+                f"{existing.rel_type} != {other.rel_type}"
+            )
+        if existing.start_node.node_id != other.start_node.node_id:
+            raise ValueError(
+                f"Cannot merge relationships with different start nodes: "
+                f"{existing.start_node.node_id} != {other.start_node.node_id}"
+            )
+        if existing.end_node.node_id != other.end_node.node_id:
+            raise ValueError(
+                f"Cannot merge relationships with different end nodes: "
+                f"{existing.end_node.node_id} != {other.end_node.node_id}"
+            )
+        merged_data = {
+            'rel_type': existing.rel_type,
+            'start_node': existing.start_node,
+            'end_node': existing.end_node,
+        }
+    else:
+        if existing.primary_label != other.primary_label:
+            raise ValueError(
+                f"Cannot merge nodes with different primary labels: "
+                f"{existing.primary_label} != {other.primary_label}"
+            )
+        merged_data = {
+            'primary_label': existing.primary_label,
+            'additional_labels': list(set(existing.additional_labels + other.additional_labels)),
+        }
+
+    existing_values = existing.__dict__
+    other_values = other.__dict__
+    accumulators = None
+    for name, strategy in plan.fields:
+        existing_value = existing_values.get(name)
+        other_value = other_values.get(name)
+        if existing_value is None:
+            merged_data[name] = other_value
+        elif other_value is None:
+            merged_data[name] = existing_value
+        elif strategy is union_values:
+            if accumulators is None:
+                accumulators = _carried_accumulators(existing)
+            merged_data[name] = _union_step(accumulators, existing_value, other_value, name)
+        else:
+            merged_data[name] = strategy(existing_value, other_value, name)
+
+    if plan.include_extra:
+        existing_extra = existing.__pydantic_extra__ or {}
+        other_extra = other.__pydantic_extra__ or {}
+        for key in (existing_extra.keys() | other_extra.keys()) - plan.ignored:
+            value = take_any_non_empty(existing_extra.get(key), other_extra.get(key), key)
+            if value is not None:
+                merged_data[key] = value
+
+    if revalidate:
+        return cls(**merged_data)
+    merged = _construct_merged(existing, merged_data, plan)
+    if accumulators:
+        merged.__pydantic_private__[_ACCUMULATORS] = accumulators
+    return merged
+
+
+def _carried_accumulators(existing: Any) -> Dict[str, UnionAccumulator]:
+    """Union accumulators left on existing by the merge that produced it."""
+    private = existing.__pydantic_private__
+    carried = private.get(_ACCUMULATORS) if private else None
+    return dict(carried) if carried else {}
+
+
+def _union_step(
+    accumulators: Dict[str, UnionAccumulator], existing: Any, new: Any, property_name: str
+) -> list:
+    """union_values(existing, new), extending the accumulator carried for the field.
+
+    The accumulator is reused only while its items still equal the instance's
+    value: the instance holds a copy, which may since have been changed, and
+    once the accumulator is extended by one merge of an instance, merging that
+    same instance again no longer matches and rebuilds it.
+    """
+    _check_union_operands(existing, new, property_name)
+    accumulator = accumulators.get(property_name)
+    if accumulator is None or accumulator.items != existing:
+        accumulator = accumulators[property_name] = UnionAccumulator(existing)
+    return union_into(accumulator, new, property_name)
+
+
+def _construct_merged(existing: Any, merged_data: Dict[str, Any], plan: MergePlan) -> Any:
+    """Assemble a merged instance from already-validated values.
+
+    Equivalent to model_construct(), but fields the merge does not touch are
+    copied from existing instead of re-resolving defaults, and private state
+    (including the memoized node_id/rel_id, which the merge cannot change) is
+    carried over. List, dict and set values are shallow-copied, as validation
+    would, so the merged instance never shares a container with its inputs.
+    """
+    cls = existing.__class__
+    fields = cls.model_fields
+    containers = _CONTAINER_TYPES
+    values = dict(existing.__dict__)
+    for name, value in values.items():
+        if type(value) in containers:
+            values[name] = value.copy()
+    extra = {} if plan.include_extra else None
+    for name, value in merged_data.items():
+        if type(value) in containers:
+            value = value.copy()
+        if name in fields:
+            values[name] = value
+        elif extra is not None:
+            extra[name] = value
+    merged = cls.__new__(cls)
+    object.__setattr__(merged, '__dict__', values)
+    object.__setattr__(merged, '__pydantic_extra__', extra)
+    object.__setattr__(
+        merged, '__pydantic_fields_set__', existing.__pydantic_fields_set__ | merged_data.keys()
+    )
+    private = existing.__pydantic_private__
+    object.__setattr__(merged, '__pydantic_private__', None if private is None else dict(private))
+    return merged
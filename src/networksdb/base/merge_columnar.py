@@ -0,0 +1,263 @@
+"""Grouped-column merge of canonical node/relationship rows.
+
+Folding merge() over n duplicates of one node builds n validated model
+instances. This module merges a whole canonical table (the to_dict() /
+from_columns() layout with struct property containers) at once: rows are
+grouped by node_id/rel_id and each property's merge strategy from sql_metadata
+is applied as a single grouped aggregation. Row order is the fold order, so the
+result matches folding merge() over the rows of each group in table order.
+
+Conflicts under error_if_different are collected into a report instead of
+raising on the first one; the first non-null value is kept for those groups.
+"""
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .merge import property_strategies
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pc = None
+
+# Strategy applied to properties not declared in the schema (dynamic properties)
+DYNAMIC_STRATEGY = "take_any_non_empty"
+
+
+class MergeConflict(NamedTuple):
+    """Distinct non-null values found for an error_if_different property."""
+    key: str
+    property: str
+    values: List[Any]
+
+
+class MergeResult(NamedTuple):
+    """Merged table (one row per key) and the error_if_different conflicts."""
+    table: Any
+    conflicts: List[MergeConflict]
+
+
+def _group_aggregate(values: Any, group_ids: Any, num_groups: int, aggregation: str, options: Any = None) -> Any:
+    """Aggregate values per group, returning one value per group id in order."""
+    if pa.types.is_null(values.type):
+        return pa.nulls(num_groups)
+    grouped = pa.table({'g': group_ids, 'v': values}).group_by('g', use_threads=False)
+    result = grouped.aggregate([('v', aggregation, options)]).sort_by('g')
+    return result.column(f'v_{aggregation}').combine_chunks()
+
+
+def _row_numbers(length: int) -> Any:
+    return pa.array(range(length), type=pa.int64())
+
+
+def _pick_row(values, group_ids, num_groups, aggregation):
+    """Take the first ('min') or last ('max') non-null row of each group.
+
+    Works through row numbers because Arrow's first/last kernels do not
+    support nested types such as lists and structs.
+    """
+    if pa.types.is_null(values.type):
+        return pa.nulls(num_groups)
+    rows = pc.if_else(pc.is_valid(values), _row_numbers(len(values)), pa.scalar(None, pa.int64()))
+    return pc.take(values, _group_aggregate(rows, group_ids, num_groups, aggregation))
+
+
+def _first_non_null(values, group_ids, num_groups):
+    return _pick_row(values, group_ids, num_groups, 'min')
+
+
+def _last_non_null(values, group_ids, num_groups):
+    return _pick_row(values, group_ids, num_groups, 'max')
+
+
+def _min(values, group_ids, num_groups):
+    return _group_aggregate(values, group_ids, num_groups, 'min')
+
+
+def _max(values, group_ids, num_groups):
+    return _group_aggregate(values, group_ids, num_groups, 'max')
+
+
+def _sum(values, group_ids, num_groups):
+    # min_count=1 keeps all-null groups null, as folding sum_values does
+    options = pc.ScalarAggregateOptions(min_count=1)
+    return _group_aggregate(values, group_ids, num_groups, 'sum', options)
+
+
+def _last_non_empty(values, group_ids, num_groups):
+    # None, "", [] and {} count as empty (see take_any_non_empty)
+    if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+        values = pc.if_else(pc.equal(values, ''), pa.scalar(None, values.type), values)
+    elif pa.types.is_list(values.type) or pa.types.is_large_list(values.type):
+        values = pc.if_else(pc.equal(pc.list_value_length(values), 0), pa.scalar(None, values.type), values)
+    elif pa.types.is_struct(values.type) and values.type.num_fields == 0:
+        return pa.nulls(num_groups, values.type)
+    return _last_non_null(values, group_ids, num_groups)
+
+
+def _union(values, group_ids, num_groups):
+    """Ordered de-duplicated concatenation of the non-null lists of each group."""
+    if pa.types.is_null(values.type):
+        return pa.nulls(num_groups)
+    has_list = _group_aggregate(
+        values, group_ids, num_groups, 'count', pc.CountOptions(mode='only_valid')
+    )
+    items = pc.list_flatten(values)
+    item_groups = pc.take(group_ids, pc.list_parent_indices(values))
+    positions = _row_numbers(len(items))
+    # Keep the first occurrence of each (group, item) and restore its position
+    firsts = (
+        pa.table({'g': item_groups, 'v': items, 'pos': positions})
+        .group_by(['g', 'v'], use_threads=False)
+        .aggregate([('pos', 'min')])
+        .sort_by([('g', 'ascending'), ('pos_min', 'ascending')])
+    )
+    lists = firsts.group_by('g', use_threads=False).aggregate([('v', 'list')])
+    slots = pc.index_in(pa.array(range(num_groups), type=group_ids.type), value_set=lists.column('g'))
+    merged = pc.take(lists.column('v_list').combine_chunks(), slots)
+    # Groups whose lists were all empty still merge to []
+    empty = pa.scalar([], merged.type)
+    return pc.if_else(
+        pc.and_(pc.greater(has_list, 0), pc.is_null(merged)),
+        empty,
+        pc.if_else(pc.greater(has_list, 0), merged, pa.scalar(None, merged.type)),
+    )
+
+
+_AGGREGATIONS = {
+    'take_first': _first_non_null,
+    'take_last': _last_non_null,
+    'take_any_non_null': _last_non_null,
+    'take_any_non_empty': _last_non_empty,
+    'min': _min,
+    'max': _max,
+    'sum': _sum,
+    'union': _union,
+    'error_if_different': _first_non_null,
+}
+
+
+def _conflicts(
+    values: Any,
+    group_ids: Any,
+    num_groups: int,
+    keys: Any,
+    property_name: str,
+) -> List[MergeConflict]:
+    if pa.types.is_null(values.type):
+        return []
+    distinct = _group_aggregate(
+        values, group_ids, num_groups, 'count_distinct', pc.CountOptions(mode='only_valid')
+    )
+    conflicting = pc.indices_nonzero(pc.greater(distinct, 1))
+    if len(conflicting) == 0:
+        return []
+    # Conflicts are rare, so the per-group value lists are built only for them
+    mask = pc.is_in(group_ids, value_set=conflicting)
+    subset = pa.table({'g': pc.filter(group_ids, mask), 'v': pc.filter(values, mask)})
+    distinct_values = subset.group_by('g', use_threads=False).aggregate(
+        [('v', 'distinct', pc.CountOptions(mode='only_valid'))]
+    ).sort_by('g')
+    return [
+        MergeConflict(keys[group].as_py(), property_name, value_list)
+        for group, value_list in zip(
+            distinct_values.column('g').to_pylist(),
+            distinct_values.column('v_distinct').to_pylist(),
+        )
+    ]
+
+
+def _merge_container(
+    container: Any,
+    strategies: Dict[str, str],
+    group_ids: Any,
+    num_groups: int,
+    keys: Any,
+    conflicts: List[MergeConflict],
+) -> Any:
+    if not pa.types.is_struct(container.type):
+        raise TypeError(
+            "merge_columnar needs struct property containers; build the table "
+            "with serialize_containers=False"
+        )
+    if isinstance(container, pa.ChunkedArray):
+        container = container.combine_chunks()
+    names, arrays = [], []
+    for index in range(container.type.num_fields):
+        name = container.type.field(index).name
+        values = container.field(index)
+        strategy = strategies.get(name, DYNAMIC_STRATEGY)
+        if strategy == 'error_if_different':
+            conflicts.extend(_conflicts(values, group_ids, num_groups, keys, name))
+        names.append(name)
+        arrays.append(_AGGREGATIONS[strategy](values, group_ids, num_groups))
+    if not names:
+        return pa.array([{}] * num_groups, type=container.type)
+    return pa.StructArray.from_arrays(arrays, names=names)
+
+
+def merge_columnar(table: Any, entity: Optional[str] = None) -> MergeResult:
+    """Merge duplicate canonical rows by node_id/rel_id using schema merge strategies.
+
+    Args:
+        table: pyarrow Table/RecordBatch or Polars DataFrame in the canonical
+               to_dict() layout, with struct identifying_properties/properties
+        entity: sql_metadata entity name (primary label or relationship type);
+                inferred from the primary_label/rel_type column when omitted
+
+    Returns:
+        MergeResult with one row per key, in order of first appearance, and the
+        list of error_if_different conflicts
+
+    Raises:
+        ImportError: If pyarrow is not installed
+        KeyError: If the entity is unknown
+        ValueError: If the entity cannot be inferred from a mixed table
+        TypeError: If the property containers are JSON strings
+    """
+    if pa is None:
+        raise ImportError(
+            "merge_columnar requires pyarrow. Install with: pip install networksdb[arrow]"
+        )
+    is_polars = hasattr(table, 'to_arrow') and not isinstance(table, (pa.Table, pa.RecordBatch))
+    if is_polars:
+        table = table.to_arrow()
+    elif isinstance(table, pa.RecordBatch):
+        table = pa.Table.from_batches([table])
+
+    is_relationship = 'rel_id' in table.column_names
+    key_column = 'rel_id' if is_relationship else 'node_id'
+    entity_column = 'rel_type' if is_relationship else 'primary_label'
+    if entity is None:
+        entities = pc.unique(table.column(entity_column)).to_pylist()
+        if len(entities) != 1:
+            raise ValueError(
+                f"Cannot infer entity from {entity_column} values {entities}; "
+                f"merge one entity at a time or pass entity="
+            )
+        entity = entities[0]
+    strategies = property_strategies(entity)
+
+    encoded = pc.dictionary_encode(table.column(key_column)).combine_chunks()
+    group_ids, keys = encoded.indices, encoded.dictionary
+    num_groups = len(keys)
+
+    conflicts: List[MergeConflict] = []
+    columns: Dict[str, Any] = {}
+    for name in table.column_names:
+        values = table.column(name).combine_chunks()
+        if name == key_column:
+            columns[name] = keys
+        elif name in ('identifying_properties', 'properties'):
+            columns[name] = _merge_container(values, strategies, group_ids, num_groups, keys, conflicts)
+        elif name == 'labels':
+            columns[name] = _union(values, group_ids, num_groups)
+        else:
+            columns[name] = _first_non_null(values, group_ids, num_groups)
+
+    merged = pa.table(columns)
+    if is_polars:
+        import polars as pl
+        merged = pl.from_arrow(merged)
+    return MergeResult(merged, conflicts)
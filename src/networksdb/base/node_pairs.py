@@ -0,0 +1,102 @@
+"""Compiled node-pair validation for generated relationship classes.
+
+A relationship's _valid_pairs list (plus the reversed pairs, for bidirectional
+relationships) is compiled once per class into a frozenset of
+(start_label, end_label) pairs. A pair of nodes is valid when any of the start
+node's labels and any of the end node's labels form a compiled pair; since
+labels include inherited types, this accepts subclasses of the declared types.
+
+Validation is memoized per (type(start_node), type(end_node)): the first valid
+pair of each node type pair is remembered as a witness, and later nodes of the
+same types only need the two witness labels checked. Labels can vary per
+instance (e.g. enrichers add labels), so nodes that lack a witness label fall
+back to the full label check, and results stay those of the uncached check.
+"""
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+LabelPair = Tuple[str, str]
+
+_pairs: Dict[type, FrozenSet[LabelPair]] = {}
+_witnesses: Dict[type, Dict[Tuple[type, type], LabelPair]] = {}
+
+
+def valid_label_pairs(rel_class: type) -> FrozenSet[LabelPair]:
+    """Compiled (start_label, end_label) pairs accepted by a relationship class."""
+    pairs = _pairs.get(rel_class)
+    if pairs is None:
+        declared = [tuple(pair) for pair in rel_class._valid_pairs]
+        if rel_class._bidirectional:
+            declared += [(end, start) for start, end in declared]
+        pairs = _pairs[rel_class] = frozenset(declared)
+    return pairs
+
+
+def node_labels(node: Any) -> List[str]:
+    """All labels of a node (primary + inherited), or just its primary label."""
+    return node.labels if hasattr(node, 'labels') else [node.primary_label]
+
+
+def _has_label(node: Any, label: str) -> bool:
+    if node.primary_label == label:
+        return True
+    additional = getattr(node, 'additional_labels', None)
+    if additional is None:
+        # e.g. NodeRef, which only carries the full labels
+        return label in node_labels(node)
+    return label in additional
+
+
+def find_label_pair(
+    rel_class: type,
+    start_labels: Iterable[str],
+    end_labels: Iterable[str],
+) -> Optional[LabelPair]:
+    """First compiled pair formed by the given labels, or None if there is none."""
+    pairs = valid_label_pairs(rel_class)
+    end_labels = list(end_labels)
+    for start_label in start_labels:
+        for end_label in end_labels:
+            if (start_label, end_label) in pairs:
+                return start_label, end_label
+    return None
+
+
+def check_node_pair(rel_class: type, start_node: Any, end_node: Any) -> None:
+    """Validate that start and end nodes may be connected by rel_class.
+
+    Raises:
+        ValueError: If no label of the start node and label of the end node
+            form a valid pair
+    """
+    witnesses = _witnesses.get(rel_class)
+    if witnesses is None:
+        witnesses = _witnesses[rel_class] = {}
+    key = (type(start_node), type(end_node))
+    witness = witnesses.get(key)
+    if witness is not None and _has_label(start_node, witness[0]) and _has_label(end_node, witness[1]):
+        return
+
+    start_labels = node_labels(start_node)
+    end_labels = node_labels(end_node)
+    witness = find_label_pair(rel_class, start_labels, end_labels)
+    if witness is None:
+        raise invalid_pair_error(
+            rel_class, start_node.primary_label, end_node.primary_label, start_labels, end_labels
+        )
+    witnesses.setdefault(key, witness)
+
+
+def invalid_pair_error(
+    rel_class: type,
+    start_primary: str,
+    end_primary: str,
+    start_labels: List[str],
+    end_labels: List[str],
+) -> ValueError:
+    """The error validate_node_types raises for an invalid node pair."""
+    # Provide helpful error showing what was given vs what's expected
+    return ValueError(
+        f"Invalid node pair: {start_primary} -> {end_primary}. "
+        f"Valid pairs (including inherited types): {rel_class._valid_pairs}. "
+        f"Start node labels: {start_labels}, End node labels: {end_labels}"
+    )
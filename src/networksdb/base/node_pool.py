@@ -0,0 +1,147 @@
+"""Batch-scoped interning of embedded nodes.
+
+The same embedded node (e.g. an Email's from_rel/to EmailAddress) recurs
+across thousands of parent nodes in a mailbox-scale ingest, and each
+occurrence is normalized, validated and hashed into a node_id again. Inside
+``intern_nodes()`` parent nodes share one instance per distinct node instead:
+
+    with intern_nodes(EmailAddress) as pools:
+        for row in rows:
+            Email(from_rel={'address': row['from']}, to=[...])
+    print(pools[EmailAddress].stats())
+
+Nodes are keyed by their normalized key field (e.g. the lowercased, trimmed
+address) plus the other fields the input sets explicitly, so two inputs share
+an instance only when they would build the same node; fields left to their
+defaults (created_at, modified_at) come from the first occurrence. Pooled
+instances are shared, so they must not be mutated while a batch is open.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+from ..transforms.cache import CacheStats, TransformCache
+from .merge import _freeze
+
+_pools: ContextVar[Optional[Dict[type, 'NodePool']]] = ContextVar('node_pools', default=None)
+
+
+class NodePool:
+    """Size-bounded pool of node instances, keyed by a normalized field.
+
+    Entries are kept in a TransformCache, so the least recently used nodes
+    are dropped once maxsize is reached (nodes already embedded elsewhere
+    stay alive) and hits, misses and evictions are counted.
+
+    Args:
+        node_class: Node class to intern
+        key_field: Field identifying a node (default: the class's only
+                   identifying field other than primary_label)
+        maxsize: Entry budget (default: the transform cache default size)
+
+    Raises:
+        ValueError: If key_field is not given and the class does not have
+            exactly one identifying field
+    """
+
+    __slots__ = ('node_class', 'key_field', '_normalizers', '_cache')
+
+    def __init__(self, node_class: type, key_field: Optional[str] = None, maxsize: Optional[int] = None):
+        if key_field is None:
+            identifying = sorted(node_class._identifying_fields - {'primary_label'})
+            if len(identifying) != 1:
+                raise ValueError(
+                    f"{node_class.__name__} has identifying fields {identifying}; "
+                    f"pass key_field to choose the pool key"
+                )
+            key_field = identifying[0]
+        # Imported here: base.columnar pulls in pyarrow, and pools are only
+        # created inside intern_nodes() batches
+        from .columnar import _resolve
+
+        metadata = node_class.model_fields[key_field].json_schema_extra or {}
+        self.node_class = node_class
+        self.key_field = key_field
+        self._normalizers = tuple(_resolve(path) for path in metadata.get('normalizers', []))
+        self._cache = TransformCache(node_class.__name__, maxsize)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def _normalize(self, value: Any) -> Any:
+        for normalizer in self._normalizers:
+            value = normalizer(value)
+        return value
+
+    def intern(self, value: Any) -> Any:
+        """Return the pooled node for value, adding it on first sight.
+
+        Args:
+            value: A node_class instance or a dict of its fields
+
+        Returns:
+            The shared node_class instance (with its node_id computed), or
+            value unchanged if it cannot be interned (another type, or a dict
+            without the key field); validation then reports any problem as usual
+
+        Raises:
+            ValidationError: If value is new and does not validate as node_class
+        """
+        if type(value) is self.node_class:
+            fields = {name: getattr(value, name) for name in value.model_fields_set}
+        elif isinstance(value, dict):
+            fields = value
+        else:
+            return value
+        if fields.get(self.key_field) is None:
+            return value
+
+        try:
+            key = (
+                self._normalize(fields[self.key_field]),
+                _freeze({name: item for name, item in fields.items() if name != self.key_field}),
+            )
+        except Exception:
+            # Left for validation to accept or reject
+            return value
+
+        cache = self._cache
+        node = cache.get(key)
+        if node is None:
+            node = value if type(value) is self.node_class else self.node_class(**fields)
+            node.node_id  # memoized on the instance
+            cache.put(key, node)
+        return node
+
+    def stats(self) -> CacheStats:
+        """Return the pool's hit/miss/eviction counters."""
+        return self._cache.stats()
+
+
+def active_pool(node_class: type) -> Optional[NodePool]:
+    """The pool for node_class in the current intern_nodes() batch, if any."""
+    pools = _pools.get()
+    return pools.get(node_class) if pools else None
+
+
+@contextmanager
+def intern_nodes(*node_classes: type, maxsize: Optional[int] = None) -> Iterator[Dict[type, NodePool]]:
+    """Intern embedded nodes of the given classes for the duration of a batch.
+
+    Pools are scoped to the current context (thread or asyncio task) and are
+    discarded on exit; nesting opens fresh pools for the inner batch.
+
+    Args:
+        *node_classes: Node classes to intern (e.g. EmailAddress)
+        maxsize: Entry budget of each pool (default: the transform cache
+                 default size)
+
+    Yields:
+        The pools, keyed by node class, for reading their stats()
+    """
+    pools = {node_class: NodePool(node_class, maxsize=maxsize) for node_class in node_classes}
+    token = _pools.set(pools)
+    try:
+        yield pools
+    finally:
+        _pools.reset(token)
@@ -0,0 +1,139 @@
+"""Lightweight node references for relationship endpoints.
+
+A relationship only needs its endpoints' labels (for validate_node_types) and
+primary_label/node_id (for rel_id and to_dict()). Holding full node instances
+as start_node/end_node keeps every endpoint, with all its properties, alive for
+as long as the edge. A NodeRef carries just those three values in a slotted
+object, so edge-heavy batches (e.g. To fan-out on mailing lists) reference
+their endpoints at a fraction of the memory.
+
+Relationship classes accept a NodeRef (or a dict with primary_label and
+node_id, and optionally labels) wherever they accept a node:
+
+    To(start_node=NodeRef.of(email), end_node=NodeRef.of(address))
+"""
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from pydantic_core import core_schema
+from ziptie_schema.base.models import BaseNode
+
+# Labels of each registered node class, by primary label
+_class_labels_by_primary: Dict[str, Tuple[str, ...]] = {}
+
+
+def _labels_for(primary_label: str) -> Tuple[str, ...]:
+    """Labels (primary + inherited) of the node class with primary_label."""
+    labels = _class_labels_by_primary.get(primary_label)
+    if labels is None:
+        from .ids import _class_labels, _node_class
+
+        try:
+            labels = tuple(_class_labels(_node_class(primary_label)))
+        except KeyError:
+            # Not a registered node class
+            labels = (primary_label,)
+        _class_labels_by_primary[primary_label] = labels
+    return labels
+
+
+class NodeRef:
+    """Reference to a node by primary label, labels and node_id.
+
+    Args:
+        primary_label: Primary label of the node
+        node_id: node_id of the node
+        labels: All labels of the node (primary + inherited); defaults to
+                the labels of the registered node class with primary_label
+                (just the primary label, for unregistered labels)
+    """
+
+    __slots__ = ('primary_label', 'labels', 'node_id')
+
+    def __init__(self, primary_label: str, node_id: str, labels: Optional[Iterable[str]] = None):
+        self.primary_label = primary_label
+        self.node_id = node_id
+        self.labels: Tuple[str, ...] = tuple(labels) if labels is not None else _labels_for(primary_label)
+
+    @classmethod
+    def of(cls, node: Any) -> 'NodeRef':
+        """Reference an existing node (or return it, if it already is a NodeRef)."""
+        if isinstance(node, cls):
+            return node
+        labels = node.labels if hasattr(node, 'labels') else None
+        return cls(node.primary_label, node.node_id, labels)
+
+    def to_dict(self) -> dict:
+        """Minimal node information, as relationship to_dict() emits for endpoints."""
+        return {'primary_label': self.primary_label, 'node_id': self.node_id}
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, NodeRef):
+            return NotImplemented
+        return self.primary_label == other.primary_label and self.node_id == other.node_id
+
+    def __hash__(self) -> int:
+        return hash((self.primary_label, self.node_id))
+
+    def __repr__(self) -> str:
+        return f"NodeRef({self.primary_label!r}, {self.node_id!r})"
+
+    @classmethod
+    def _validate(cls, value: Any) -> 'NodeRef':
+        ref = _as_ref(value)
+        if ref is None:
+            raise ValueError(
+                f"Expected a NodeRef or a dict with primary_label and node_id, got {type(value).__name__}"
+            )
+        return ref
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(_dump_ref),
+        )
+
+
+def _as_ref(value: Any) -> Optional[NodeRef]:
+    """value as a NodeRef, if it is one or its dict form, else None."""
+    if isinstance(value, NodeRef):
+        return value
+    if isinstance(value, dict) and 'primary_label' in value and 'node_id' in value:
+        return NodeRef(value['primary_label'], value['node_id'], value.get('labels'))
+    return None
+
+
+def _dump_ref(ref: NodeRef) -> dict:
+    return {'primary_label': ref.primary_label, 'labels': list(ref.labels), 'node_id': ref.node_id}
+
+
+def _coerce_endpoint(value: Any) -> Any:
+    ref = _as_ref(value)
+    return ref if ref is not None else BaseNode.model_validate(value)
+
+
+def _serialize_endpoint(value: Any, handler: Any) -> Any:
+    return _dump_ref(value) if isinstance(value, NodeRef) else handler(value)
+
+
+class NodeEndpoint:
+    """Type of relationship start_node/end_node fields: a node or a NodeRef.
+
+    Node and NodeRef instances pass an isinstance check done inside
+    pydantic-core, so edges built from either cost no Python call or caught
+    validation error; only other input (a NodeRef dict, or data for a node)
+    reaches _coerce_endpoint.
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> core_schema.CoreSchema:
+        return core_schema.union_schema(
+            [
+                (core_schema.is_instance_schema((BaseNode, NodeRef)), 'node'),
+                (core_schema.no_info_plain_validator_function(_coerce_endpoint), 'dict'),
+            ],
+            mode='left_to_right',
+            serialization=core_schema.wrap_serializer_function_ser_schema(
+                _serialize_endpoint, schema=core_schema.any_schema()
+            ),
+        )
@@ -0,0 +1,154 @@
+"""Precomputed to_dict() plans for generated node and relationship classes.
+
+The generated to_dict() methods used to walk model_fields and inspect every
+field's json_schema_extra on each call. The field layout is fixed per class, so
+it is resolved once into a ToDictPlan (compiled at import time at the bottom of
+each model module) and to_dict() reduces to straight dict extraction.
+"""
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, NamedTuple, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+ORJSON_ENV = "NETWORKSDB_ORJSON"
+
+# Opt-in (see use_orjson()): orjson output differs from json.dumps()
+_use_orjson = orjson is not None and os.environ.get(ORJSON_ENV, '').lower() in ('1', 'true', 'yes')
+
+# Fields that are part of the envelope rather than the property containers
+_NODE_ENVELOPE = frozenset({'node_id', 'labels', 'primary_label', 'additional_labels'})
+_REL_ENVELOPE = frozenset({'rel_id', 'rel_type', 'start_node', 'end_node'})
+
+
+class ToDictPlan(NamedTuple):
+    """Static serialization layout of one model class."""
+    identifying: Tuple[str, ...]
+    regular: Tuple[str, ...]
+    identifying_datetimes: Tuple[str, ...]
+    regular_datetimes: Tuple[str, ...]
+    include_extra: bool
+    ignored: FrozenSet[str]
+
+
+_plans: Dict[type, ToDictPlan] = {}
+
+
+def _is_datetime_field(field_info: Any) -> bool:
+    metadata = field_info.json_schema_extra or {}
+    return metadata.get('property_type') == 'datetime' or 'datetime' in repr(field_info.annotation)
+
+
+def _compile(cls: type) -> ToDictPlan:
+    is_relationship = 'rel_type' in cls.model_fields
+    envelope = _REL_ENVELOPE if is_relationship else _NODE_ENVELOPE
+    identifying, regular = [], []
+    identifying_datetimes, regular_datetimes = [], []
+    for name, field_info in cls.model_fields.items():
+        metadata = field_info.json_schema_extra or {}
+        if name in envelope or field_info.exclude:
+            continue
+        # Embedded nodes are for relationships, not serialization
+        if metadata.get('property_type') in ('node', 'node_list'):
+            continue
+        if metadata.get('identifying', False):
+            identifying.append(name)
+            if _is_datetime_field(field_info):
+                identifying_datetimes.append(name)
+        else:
+            regular.append(name)
+            if _is_datetime_field(field_info):
+                regular_datetimes.append(name)
+
+    ignored = getattr(cls, '_ignored_properties', ())
+    if hasattr(ignored, 'get_default'):
+        ignored = ignored.get_default()
+    return ToDictPlan(
+        identifying=tuple(identifying),
+        regular=tuple(regular),
+        identifying_datetimes=tuple(identifying_datetimes),
+        regular_datetimes=tuple(regular_datetimes),
+        # Relationships never emitted dynamic properties
+        include_extra=not is_relationship and cls.model_config.get('extra') == 'allow',
+        ignored=frozenset(ignored or ()),
+    )
+
+
+def to_dict_plan(cls: type) -> ToDictPlan:
+    """Return the to_dict() plan for cls, compiling it on first use."""
+    plan = _plans.get(cls)
+    if plan is None:
+        plan = _plans[cls] = _compile(cls)
+    return plan
+
+
+def split_properties(instance: Any, plan: ToDictPlan) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Extract (identifying_properties, properties) from a model instance.
+
+    Datetimes are converted to ISO strings and non-null dynamic properties
+    (minus ignored ones) are merged into properties, as to_dict() always did.
+    """
+    values = instance.__dict__
+    identifying = {name: values[name] for name in plan.identifying}
+    regular = {name: values[name] for name in plan.regular}
+    for name in plan.identifying_datetimes:
+        value = identifying[name]
+        if isinstance(value, datetime):
+            identifying[name] = value.isoformat()
+    for name in plan.regular_datetimes:
+        value = regular[name]
+        if isinstance(value, datetime):
+            regular[name] = value.isoformat()
+    if plan.include_extra:
+        extra = instance.__pydantic_extra__
+        if extra:
+            ignored = plan.ignored
+            for key, value in extra.items():
+                if value is not None and key not in ignored:
+                    regular[key] = value.isoformat() if isinstance(value, datetime) else value
+    return identifying, regular
+
+
+def use_orjson(enabled: bool = True) -> None:
+    """Serialize JSON with orjson (several times faster) instead of the stdlib.
+
+    orjson output differs from the default json.dumps() text: it is compact
+    ({"a":1} rather than {"a": 1}), writes non-ASCII characters as UTF-8
+    rather than escaping it, and formats exponent and non-finite floats
+    differently (1e16 rather than 1e+16, null rather than NaN). Enable it only
+    where output need not match text already written. The NETWORKSDB_ORJSON
+    environment variable (1/true/yes) enables it at import time.
+
+    Raises:
+        ImportError: If enabled and orjson is not installed
+    """
+    global _use_orjson
+    if enabled and orjson is None:
+        raise ImportError("use_orjson requires orjson: pip install orjson")
+    _use_orjson = enabled
+
+
+def dumps_json(value: Any) -> str:
+    """Serialize a property container to a JSON string.
+
+    The output is plain json.dumps(value) (``{"a": 1}``, non-ASCII escaped),
+    whatever is installed; orjson is used only when enabled with use_orjson().
+    """
+    if _use_orjson:
+        return dumps_json_bytes(value).decode()
+    return json.dumps(value)
+
+
+def dumps_json_bytes(value: Any) -> bytes:
+    """dumps_json() as UTF-8 bytes."""
+    if _use_orjson:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            # Values orjson refuses (e.g. non-str keys) keep the stdlib behavior
+            pass
+    return json.dumps(value).encode()
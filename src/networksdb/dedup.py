@@ -0,0 +1,251 @@
+"""Streaming deduplication of canonical node/relationship JSONL files.
+
+Merges duplicate canonical records (the to_dict() layout, one JSON object per
+line) by node_id/rel_id with bounded memory, using an external sort:
+
+1. Input records are read in chunks of at most ``run_size`` records, each chunk
+   is sorted by (key, input sequence number) and spilled to a temporary run file.
+2. The runs are k-way merged with heapq, so records with the same key meet in
+   input order.
+3. Consecutive duplicates are folded with the entity's merge strategies from
+   sql_metadata, exactly as folding merge() over the same records would.
+
+Usage:
+    python -m networksdb.dedup nodes*.jsonl -o merged.jsonl
+"""
+import argparse
+import heapq
+import json
+import os
+import sys
+import tempfile
+from itertools import groupby, islice
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .base.merge import MERGE_STRATEGIES, UnionAccumulator, property_strategies, union_into
+from .base.serialization import dumps_json
+from .io.jsonl import iter_records
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+DEFAULT_RUN_SIZE = 1_000_000
+
+# Strategy applied to properties not declared in the schema (dynamic properties)
+DYNAMIC_STRATEGY = "take_any_non_empty"
+
+_loads: Callable[[Any], Any] = orjson.loads if orjson is not None else json.loads
+
+Record = Dict[str, Any]
+
+
+def record_key(record: Record) -> str:
+    """Return the dedup key of a canonical record (node_id or rel_id)."""
+    key = record.get('node_id')
+    if key is None:
+        key = record.get('rel_id')
+    if key is None:
+        raise ValueError(f"Record has neither node_id nor rel_id: {record!r}")
+    return key
+
+
+def read_jsonl(paths: Iterable[str]) -> Iterator[Record]:
+    """Yield the records of one or more JSONL files in order, skipping blank lines.
+
+    Files may be gzip/zstd compressed (see networksdb.io.jsonl).
+    """
+    return iter_records(list(paths))
+
+
+def write_sorted_runs(
+    records: Iterable[Record],
+    run_dir: str,
+    run_size: int = DEFAULT_RUN_SIZE,
+) -> List[str]:
+    """Spill records into sorted run files of at most run_size records each.
+
+    Each run line is ``[key, seq, record]``, where seq is the record's position
+    in the input, so merging runs by (key, seq) preserves input order within a key.
+
+    Returns:
+        Paths of the run files, in creation order
+    """
+    if run_size <= 0:
+        raise ValueError(f"run_size must be > 0, got {run_size}")
+    paths = []
+    numbered = enumerate(records)
+    while True:
+        chunk = [(record_key(record), seq, record) for seq, record in islice(numbered, run_size)]
+        if not chunk:
+            return paths
+        chunk.sort(key=itemgetter(0, 1))
+        path = os.path.join(run_dir, f"run-{len(paths):06d}.jsonl")
+        with open(path, 'w') as f:
+            for entry in chunk:
+                f.write(dumps_json(entry))
+                f.write('\n')
+        paths.append(path)
+
+
+def _read_run(path: str) -> Iterator[Tuple[str, int, Record]]:
+    with open(path, 'rb') as f:
+        for line in f:
+            key, seq, record = _loads(line)
+            yield key, seq, record
+
+
+def merge_runs(paths: List[str]) -> Iterator[Tuple[str, int, Record]]:
+    """k-way merge sorted run files into one (key, seq, record) stream."""
+    return heapq.merge(*(_read_run(path) for path in paths), key=itemgetter(0, 1))
+
+
+def _union_labels(existing: List[str], new: List[str]) -> List[str]:
+    seen = set(existing)
+    merged = list(existing)
+    for label in new:
+        if label not in seen:
+            seen.add(label)
+            merged.append(label)
+    return merged
+
+
+def _merge_container(
+    existing: Dict[str, Any],
+    new: Dict[str, Any],
+    strategies: Dict[str, str],
+    accumulators: Optional[Dict[str, UnionAccumulator]] = None,
+) -> Dict[str, Any]:
+    merged = dict(existing)
+    for name, new_value in new.items():
+        old_value = merged.get(name)
+        strategy = strategies.get(name)
+        if strategy == 'union' and accumulators is not None and old_value is not None:
+            accumulator = accumulators.get(name)
+            if accumulator is None or accumulator.items is not old_value:
+                accumulator = accumulators[name] = UnionAccumulator(old_value)
+            merged[name] = union_into(accumulator, new_value, name)
+        elif strategy is None:
+            # Dynamic property: merge() drops it when nothing non-empty remains
+            value = MERGE_STRATEGIES[DYNAMIC_STRATEGY](old_value, new_value, name)
+            if value is None:
+                merged.pop(name, None)
+            else:
+                merged[name] = value
+        elif old_value is None:
+            merged[name] = new_value
+        elif new_value is not None:
+            merged[name] = MERGE_STRATEGIES[strategy](old_value, new_value, name)
+    return merged
+
+
+def merge_records(
+    existing: Record,
+    new: Record,
+    strategies: Dict[str, str],
+    accumulators: Optional[Dict[str, Dict[str, UnionAccumulator]]] = None,
+) -> Record:
+    """Merge two canonical records of the same key.
+
+    Schema properties use their sql_metadata strategy (applied only when both
+    values are non-null, as merge() does), dynamic properties use
+    take_any_non_empty and labels are unioned. Other fields keep the existing value.
+
+    When folding many records, pass the same (initially empty) accumulators
+    dict to every call so union properties are extended in place instead of
+    being re-deduplicated on each step.
+
+    Raises:
+        ValueError: On error_if_different conflicts
+    """
+    merged = dict(existing)
+    for container in ('identifying_properties', 'properties'):
+        if container in new:
+            merged[container] = _merge_container(
+                existing.get(container) or {}, new[container] or {}, strategies,
+                None if accumulators is None else accumulators.setdefault(container, {}),
+            )
+    if 'labels' in new:
+        merged['labels'] = _union_labels(existing.get('labels') or [], new['labels'] or [])
+    return merged
+
+
+def entity_strategies(entity: str) -> Dict[str, str]:
+    """Merge strategy of each schema property of an entity.
+
+    Entities missing from sql_metadata (e.g. records from another schema) have
+    no schema properties, so all their properties merge as dynamic ones.
+    """
+    try:
+        return property_strategies(entity)
+    except KeyError:
+        return {}
+
+
+def dedup_sorted(entries: Iterable[Tuple[str, int, Record]]) -> Iterator[Record]:
+    """Fold key-sorted (key, seq, record) entries into one record per key."""
+    strategies_by_entity: Dict[str, Dict[str, str]] = {}
+    for _, group in groupby(entries, key=itemgetter(0)):
+        _, _, merged = next(group)
+        entity = merged.get('primary_label') or merged.get('rel_type')
+        strategies = strategies_by_entity.get(entity)
+        if strategies is None:
+            strategies = strategies_by_entity[entity] = entity_strategies(entity)
+        accumulators: Dict[str, Dict[str, UnionAccumulator]] = {}
+        for _, _, record in group:
+            merged = merge_records(merged, record, strategies, accumulators)
+        yield merged
+
+
+def dedup_records(
+    records: Iterable[Record],
+    run_size: int = DEFAULT_RUN_SIZE,
+    tmp_dir: Optional[str] = None,
+) -> Iterator[Record]:
+    """Deduplicate canonical records with at most run_size records held in memory.
+
+    Args:
+        records: Canonical node and/or relationship records
+        run_size: Records per sorted run (bounds peak memory)
+        tmp_dir: Directory for the temporary run files (default: system temp)
+
+    Yields:
+        One merged record per node_id/rel_id, in key order
+    """
+    with tempfile.TemporaryDirectory(prefix='networksdb-dedup-', dir=tmp_dir) as run_dir:
+        paths = write_sorted_runs(records, run_dir, run_size)
+        yield from dedup_sorted(merge_runs(paths))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m networksdb.dedup',
+        description='Deduplicate canonical node/relationship JSONL files by node_id/rel_id.',
+    )
+    parser.add_argument('inputs', nargs='+', help='Input JSONL files')
+    parser.add_argument('-o', '--output', help='Output JSONL file (default: stdout)')
+    parser.add_argument(
+        '--run-size', type=int, default=DEFAULT_RUN_SIZE,
+        help=f'Records per sorted run held in memory (default: {DEFAULT_RUN_SIZE:,})',
+    )
+    parser.add_argument('--tmp-dir', help='Directory for temporary run files')
+    args = parser.parse_args(argv)
+
+    out = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        count = 0
+        for record in dedup_records(read_jsonl(args.inputs), args.run_size, args.tmp_dir):
+            out.write(dumps_json(record))
+            out.write('\n')
+            count += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"Wrote {count:,} records", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
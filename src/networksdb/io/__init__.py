@@ -0,0 +1,56 @@
+"""Readers and writers for canonical node/relationship data.
+
+Submodules are imported on first attribute access (PEP 562), so optional
+dependencies (pyarrow, numpy, ...) are only needed for the formats actually used.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .jsonl import JsonlWriter, iter_node_batches, iter_record_batches, iter_records, write_jsonl
+    from .node_index import NodeIndex, build_node_index, iter_orphan_edges
+    from .parquet import CanonicalParquetWriter, write_parquet
+    from .trino import TrinoLoader, trino_connect
+
+_MODULES = {
+    "JsonlWriter": ".jsonl",
+    "iter_node_batches": ".jsonl",
+    "iter_record_batches": ".jsonl",
+    "iter_records": ".jsonl",
+    "write_jsonl": ".jsonl",
+    "NodeIndex": ".node_index",
+    "build_node_index": ".node_index",
+    "iter_orphan_edges": ".node_index",
+    "CanonicalParquetWriter": ".parquet",
+    "write_parquet": ".parquet",
+    "TrinoLoader": ".trino",
+    "trino_connect": ".trino",
+}
+
+__all__ = [
+    "JsonlWriter",
+    "iter_node_batches",
+    "iter_record_batches",
+    "iter_records",
+    "write_jsonl",
+    "NodeIndex",
+    "build_node_index",
+    "iter_orphan_edges",
+    "CanonicalParquetWriter",
+    "write_parquet",
+    "TrinoLoader",
+    "trino_connect",
+]
+
+
+def __getattr__(name):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
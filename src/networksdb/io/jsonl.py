@@ -0,0 +1,258 @@
+"""Streaming reader/writer for canonical node/relationship JSONL.
+
+Canonical JSONL holds one to_dict() record per line (the test_nodes.jsonl /
+test_relationships.jsonl files exchanged by the version2 pipelines). Files
+ending in .gz are read/written through gzip, and .zst/.zstd through the
+optional zstandard package.
+
+Reading is chunked: each chunk (DEFAULT_CHUNK_SIZE bytes) is cut at its last
+newline and its lines are parsed by a single orjson call, as one JSON array, so
+there is no Python-level work per line. Cyclic garbage collection is paused
+while a chunk is parsed: parsing only allocates acyclic dicts and lists, and
+the collector would otherwise rescan every record of the chunk several times.
+
+Writing appends encoded lines (json.dumps() text, see
+base.serialization.dumps_json) to a buffer that is flushed once it reaches
+buffer_size bytes, rather than one write call per line.
+
+Usage:
+    for batch in iter_node_batches("test_nodes.jsonl.gz", trusted=True):
+        ...
+    with JsonlWriter("merged.jsonl.zst") as writer:
+        writer.write_all(nodes)
+"""
+import gc
+import gzip
+import json
+from contextlib import contextmanager
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from ..base.serialization import dumps_json_bytes
+from ..lazy import materialize_node
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+Record = Dict[str, Any]
+Source = Union[str, IO[bytes]]
+
+
+def open_stream(path: str, mode: str = 'rb') -> IO[bytes]:
+    """Open a binary stream, decompressing .gz and .zst/.zstd files.
+
+    Raises:
+        ImportError: For .zst files if zstandard is not installed
+    """
+    if path.endswith('.gz'):
+        return gzip.open(path, mode)
+    if path.endswith(('.zst', '.zstd')):
+        if zstandard is None:
+            raise ImportError("zstd-compressed JSONL requires zstandard: pip install zstandard")
+        return zstandard.open(path, mode)
+    return open(path, mode)
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _parse_lines(body: bytes) -> List[Record]:
+    """Parse newline-separated JSON documents (body ends with a newline)."""
+    with _gc_paused():
+        try:
+            return _loads(b'[' + body[:-1].replace(b'\n', b',') + b']')
+        except ValueError:
+            # Blank lines (or a malformed one): parse line by line to skip
+            # blanks and report the offending line
+            return [_loads(line) for line in body.split(b'\n') if line.strip()]
+
+
+def _read_chunks(stream: IO[bytes], chunk_size: int) -> Iterator[List[Record]]:
+    tail = b''
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        data = tail + chunk if tail else chunk
+        cut = data.rfind(b'\n') + 1
+        tail = data[cut:]
+        if cut:
+            records = _parse_lines(data[:cut])
+            if records:
+                yield records
+    if tail.strip():
+        yield _parse_lines(tail + b'\n')
+
+
+def iter_record_batches(
+    sources: Union[Source, Iterable[Source]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[List[Record]]:
+    """Yield the records of one or more JSONL files, one list per read chunk.
+
+    Args:
+        sources: Path(s) or binary stream(s); paths may be .gz/.zst compressed
+        chunk_size: Bytes read (and parsed) at a time
+
+    Yields:
+        Lists of records, in file order
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be > 0, got {chunk_size}")
+    if isinstance(sources, str) or hasattr(sources, 'read'):
+        sources = [sources]
+    for source in sources:
+        if isinstance(source, str):
+            with open_stream(source) as stream:
+                yield from _read_chunks(stream, chunk_size)
+        else:
+            yield from _read_chunks(source, chunk_size)
+
+
+def iter_records(
+    sources: Union[Source, Iterable[Source]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Record]:
+    """Yield the records of one or more JSONL files one at a time."""
+    for batch in iter_record_batches(sources, chunk_size):
+        yield from batch
+
+
+def node_properties(record: Record) -> Dict[str, Any]:
+    """Flatten a canonical node record into constructor keyword arguments.
+
+    Identifying and regular properties are merged; dynamic_properties (a dict,
+    or a JSON string as written by the Arrow/Parquet layout) are added too.
+    """
+    data = dict(record.get('identifying_properties') or {})
+    data.update(record.get('properties') or {})
+    dynamic = record.get('dynamic_properties')
+    if dynamic:
+        data.update(_loads(dynamic) if isinstance(dynamic, (str, bytes)) else dynamic)
+    return data
+
+
+def iter_node_batches(
+    sources: Union[Source, Iterable[Source]],
+    trusted: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    registry: Any = None,
+) -> Iterator[List[Any]]:
+    """Yield node instances from canonical node JSONL, one list per read chunk.
+
+    Each record's class is resolved from its labels with the registry's
+    memoized best-label match (as Registry.deserialize_node_from_labels does).
+
+    Args:
+        sources: Path(s) or binary stream(s) of canonical node records
+        trusted: If True, build models without validation (as model_construct()
+                 does). Only for files written by this package; values keep
+                 their JSON types (e.g. timestamps stay ISO strings).
+        chunk_size: Bytes read (and parsed) at a time
+        registry: Registry to resolve classes with (default: networksdb.registry)
+
+    Raises:
+        KeyError: If a record matches no node class
+    """
+    if registry is None:
+        from ..registry import registry as default_registry
+        registry = default_registry
+    for records in iter_record_batches(sources, chunk_size):
+        nodes = []
+        for record in records:
+            labels = record.get('labels')
+            if labels:
+                node_class, extra_labels = registry.match_labels(labels)
+            elif 'primary_label' in record:
+                node_class, extra_labels = registry.get_node_by_label(record['primary_label']), ()
+            else:
+                raise KeyError(f"Record has no labels or primary_label: {record!r}")
+            nodes.append(materialize_node(node_class, node_properties(record), extra_labels, trusted))
+        yield nodes
+
+
+class JsonlWriter:
+    """Buffered canonical JSONL writer.
+
+    Args:
+        target: Output path (.gz/.zst compress) or binary stream
+        buffer_size: Bytes buffered before each write to the stream
+    """
+
+    def __init__(self, target: Source, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        if buffer_size <= 0:
+            raise ValueError(f"buffer_size must be > 0, got {buffer_size}")
+        self._owns_stream = isinstance(target, str)
+        self._stream: Optional[IO[bytes]] = open_stream(target, 'wb') if self._owns_stream else target
+        self._buffer = bytearray()
+        self.buffer_size = buffer_size
+        self.count = 0
+
+    def write(self, item: Any) -> None:
+        """Write a node/relationship instance or a to_dict() record."""
+        buffer = self._buffer
+        buffer += dumps_json_bytes(item.to_dict() if hasattr(item, 'to_dict') else item)
+        buffer += b'\n'
+        self.count += 1
+        if len(buffer) >= self.buffer_size:
+            self.flush()
+
+    def write_all(self, items: Iterable[Any]) -> None:
+        """Write many node/relationship instances or to_dict() records."""
+        for item in items:
+            self.write(item)
+
+    def flush(self) -> None:
+        """Write the buffered lines to the stream."""
+        if self._stream is None:
+            raise ValueError("Writer is closed")
+        if self._buffer:
+            self._stream.write(self._buffer)
+            self._buffer = bytearray()
+
+    def close(self) -> None:
+        """Flush, and close the stream if the writer opened it."""
+        if self._stream is None:
+            return
+        self.flush()
+        if self._owns_stream:
+            self._stream.close()
+        else:
+            self._stream.flush()
+        self._stream = None
+
+    def __enter__(self) -> 'JsonlWriter':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def write_jsonl(items: Iterable[Any], target: Source, buffer_size: int = DEFAULT_BUFFER_SIZE) -> int:
+    """Write node/relationship instances or to_dict() records as JSONL.
+
+    Returns:
+        Number of lines written
+    """
+    with JsonlWriter(target, buffer_size) as writer:
+        writer.write_all(items)
+    return writer.count
@@ -0,0 +1,509 @@
+"""Memory-mapped node_id index for resolving relationship endpoints.
+
+Relationship records only carry ``{primary_label, node_id}`` references to
+their endpoints (see HasIP.to_dict()). A NodeIndex maps each node_id of a set
+of canonical node files to its primary_label and location (source file, row)
+without loading the nodes: lookups binary-search a sorted, fixed-width key
+column that is memory-mapped, so only the pages on the search path are read.
+
+Index file layout (all integers little-endian):
+
+    b'NDBNIDX' + version byte
+    uint32 header length, then a JSON header: count, key_width, labels, sources
+    node_id column: count sorted keys of key_width bytes, NUL-padded
+    label column:   uint16 index into header labels, per key
+    source column:  uint32 index into header sources, per key
+    row column:     uint64 row of the node within its source, per key
+
+Each column starts on an 8-byte boundary. Indexes are built with an external
+sort (sorted runs of at most run_size nodes, then a k-way merge), so building
+also needs bounded memory. A node_id that occurs more than once keeps its
+first occurrence.
+
+Sources are canonical node JSONL files (optionally .gz/.zst) or Parquet files /
+directories as written by CanonicalParquetWriter. Rows count records, not
+lines: blank JSONL lines are skipped.
+
+Usage:
+    python -m networksdb.io.node_index build out/nodes -o nodes.nidx
+    python -m networksdb.io.node_index orphans nodes.nidx out/relationships
+"""
+import argparse
+import json
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .jsonl import iter_record_batches
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pc = None
+    pq = None
+
+MAGIC = b'NDBNIDX\x01'
+DEFAULT_RUN_SIZE = 4_000_000
+DEFAULT_BATCH_SIZE = 1_000_000
+
+_LABEL_DTYPE = '<u2'
+_SOURCE_DTYPE = '<u4'
+_ROW_DTYPE = '<u8'
+_ALIGNMENT = 8
+
+# Record paths read from each kind of source
+_NODE_PATHS = (('node_id',), ('primary_label',))
+_EDGE_PATHS = (('rel_id',), ('start_node', 'node_id'), ('end_node', 'node_id'))
+
+
+class NodeLocation(NamedTuple):
+    """Where an indexed node was found."""
+    primary_label: str
+    source: str
+    row: int
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Node indexes require numpy: pip install numpy")
+
+
+def _padded(size: int) -> int:
+    return -size % _ALIGNMENT
+
+
+def _expand_sources(sources: Union[str, Iterable[str]]) -> List[str]:
+    """Paths of the files to read, with directories expanded to their Parquet files."""
+    if isinstance(sources, str):
+        sources = [sources]
+    paths = []
+    for source in sources:
+        if os.path.isdir(source):
+            found = sorted(
+                os.path.join(directory, name)
+                for directory, _, names in os.walk(source)
+                for name in names
+                if name.endswith('.parquet')
+            )
+            if not found:
+                raise ValueError(f"No Parquet files under {source}")
+            paths.extend(found)
+        else:
+            paths.append(source)
+    return paths
+
+
+def _get_path(record: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    value = record
+    for key in path:
+        value = value.get(key) if value else None
+    return value
+
+
+def _parquet_column(table: Any, path: Tuple[str, ...]) -> List[Any]:
+    column = table.column(path[0])
+    for key in path[1:]:
+        column = pc.struct_field(column, key)
+    return column.to_pylist()
+
+
+def _iter_columns(
+    path: str,
+    paths: Sequence[Tuple[str, ...]],
+    batch_size: int,
+) -> Iterator[List[List[Any]]]:
+    """Yield one list of values per record path, for each batch of a source."""
+    if path.endswith('.parquet'):
+        if pq is None:
+            raise ImportError("Parquet sources require pyarrow: pip install pyarrow")
+        parquet_file = pq.ParquetFile(path)
+        columns = sorted({record_path[0] for record_path in paths})
+        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+            yield [_parquet_column(batch, record_path) for record_path in paths]
+    else:
+        for records in iter_record_batches(path):
+            yield [[_get_path(record, record_path) for record in records] for record_path in paths]
+
+
+def _encode_keys(node_ids: Any) -> Any:
+    """node_ids (str or bytes, ASCII) as a fixed-width bytes array."""
+    keys = np.asarray(node_ids)
+    if keys.dtype.kind == 'U':
+        keys = keys.astype('S')
+    elif keys.dtype.kind != 'S':
+        keys = np.array([_require_id(node_id) for node_id in keys.ravel()], dtype='S')
+    return keys
+
+
+def _require_id(node_id: Any) -> Any:
+    if node_id is None:
+        raise ValueError("Record has no node_id")
+    return node_id
+
+
+def _run_dtype(key_width: int) -> Any:
+    return np.dtype([
+        ('node_id', f'S{key_width}'),
+        ('label', _LABEL_DTYPE),
+        ('source', _SOURCE_DTYPE),
+        ('row', _ROW_DTYPE),
+    ])
+
+
+def _sorted_run(entries: List[Any]) -> Any:
+    """Concatenate entry blocks, sort them by node_id and keep first occurrences."""
+    width = max(block.dtype['node_id'].itemsize for block in entries)
+    run = np.concatenate([block.astype(_run_dtype(width)) for block in entries])
+    # Stable: entries are in input order, so the first occurrence sorts first
+    run = run[np.argsort(run['node_id'], kind='stable')]
+    keys = run['node_id']
+    first = np.ones(len(run), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    return run[first]
+
+
+def _merge_runs(runs: List[Any], block_size: int) -> Iterator[Any]:
+    """k-way merge sorted, duplicate-free runs into sorted duplicate-free blocks.
+
+    Runs are in input order, so each key keeps the entry of its earliest run.
+    Each step takes every buffered key up to the smallest last-buffered key of
+    all runs: no unbuffered key can sort before it, and a run holding that key
+    has it buffered.
+    """
+    width = max(run.dtype['node_id'].itemsize for run in runs)
+    dtype = _run_dtype(width)
+    cursors = [0] * len(runs)
+    while True:
+        buffers = [
+            (index, run[cursors[index]:cursors[index] + block_size].astype(dtype))
+            for index, run in enumerate(runs)
+            if cursors[index] < len(run)
+        ]
+        if not buffers:
+            return
+        bound = min(buffer['node_id'][-1] for _, buffer in buffers)
+        taken = []
+        for index, buffer in buffers:
+            end = int(np.searchsorted(buffer['node_id'], bound, side='right'))
+            cursors[index] += end
+            taken.append(buffer[:end])
+        block = np.concatenate(taken)
+        # Keys are unique per run and the sort is stable, so ties keep run order
+        block = block[np.argsort(block['node_id'], kind='stable')]
+        keys = block['node_id']
+        first = np.ones(len(block), dtype=bool)
+        first[1:] = keys[1:] != keys[:-1]
+        yield block[first]
+
+
+def _write_index(
+    path: str,
+    blocks: Iterable[Any],
+    key_width: int,
+    labels: List[str],
+    sources: List[str],
+    tmp_dir: str,
+) -> int:
+    """Write sorted entry blocks as an index file; returns the node count."""
+    names = ('node_id', 'label', 'source', 'row')
+    column_paths = [os.path.join(tmp_dir, f'column-{name}') for name in names]
+    count = 0
+    files = [open(column_path, 'wb') for column_path in column_paths]
+    try:
+        for block in blocks:
+            block['node_id'].astype(f'S{key_width}').tofile(files[0])
+            for name, column_file in zip(names[1:], files[1:]):
+                block[name].tofile(column_file)
+            count += len(block)
+    finally:
+        for column_file in files:
+            column_file.close()
+
+    header = json.dumps({
+        'count': count,
+        'key_width': key_width,
+        'labels': labels,
+        'sources': sources,
+    }).encode()
+    with open(path, 'wb') as out:
+        out.write(MAGIC)
+        out.write(struct.pack('<I', len(header)))
+        out.write(header)
+        out.write(b'\0' * _padded(out.tell()))
+        for column_path in column_paths:
+            with open(column_path, 'rb') as column_file:
+                shutil.copyfileobj(column_file, out, 1024 * 1024)
+            out.write(b'\0' * _padded(out.tell()))
+    return count
+
+
+def build_node_index(
+    sources: Union[str, Iterable[str]],
+    path: str,
+    run_size: int = DEFAULT_RUN_SIZE,
+    tmp_dir: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Build a node_id index file from canonical node files.
+
+    Args:
+        sources: Node JSONL files and/or Parquet files or directories
+        path: Index file to write
+        run_size: Nodes sorted in memory at a time (bounds peak memory)
+        tmp_dir: Directory for temporary run files (default: system temp)
+        batch_size: Parquet rows read at a time
+
+    Returns:
+        Number of distinct node_ids indexed
+
+    Raises:
+        ImportError: If numpy (or pyarrow, for Parquet sources) is not installed
+        ValueError: If a record has no node_id or primary_label
+    """
+    _require_numpy()
+    if run_size <= 0:
+        raise ValueError(f"run_size must be > 0, got {run_size}")
+    paths = _expand_sources(sources)
+    label_codes: Dict[str, int] = {}
+
+    with tempfile.TemporaryDirectory(prefix='networksdb-index-', dir=tmp_dir) as work_dir:
+        runs = []
+        pending: List[Any] = []
+        pending_size = 0
+
+        def spill() -> None:
+            run = _sorted_run(pending)
+            run_path = os.path.join(work_dir, f'run-{len(runs):06d}.bin')
+            run.tofile(run_path)
+            runs.append(np.memmap(run_path, dtype=run.dtype, mode='r', shape=(len(run),)))
+
+        for source_index, source in enumerate(paths):
+            row = 0
+            for node_ids, primary_labels in _iter_columns(source, _NODE_PATHS, batch_size):
+                if None in primary_labels:
+                    raise ValueError(f"Record without primary_label in {source}")
+                keys = _encode_keys(node_ids)
+                block = np.empty(len(keys), dtype=_run_dtype(keys.dtype.itemsize))
+                block['node_id'] = keys
+                block['label'] = [label_codes.setdefault(label, len(label_codes)) for label in primary_labels]
+                block['source'] = source_index
+                block['row'] = np.arange(row, row + len(keys), dtype=_ROW_DTYPE)
+                row += len(keys)
+                pending.append(block)
+                pending_size += len(block)
+                if pending_size >= run_size:
+                    spill()
+                    pending, pending_size = [], 0
+
+        if len(label_codes) > np.iinfo(_LABEL_DTYPE).max:
+            raise ValueError(f"Too many distinct primary labels: {len(label_codes)}")
+        if not runs:
+            blocks = [_sorted_run(pending)] if pending else []
+        else:
+            if pending:
+                spill()
+            blocks = _merge_runs(runs, max(1024, run_size // len(runs)))
+        key_width = max([block.dtype['node_id'].itemsize for block in runs or blocks] or [1])
+        return _write_index(path, blocks, key_width, list(label_codes), paths, work_dir)
+
+
+class NodeIndex:
+    """Read-only, memory-mapped node_id index written by build_node_index().
+
+    Single lookups (``node_id in index``, ``index[node_id]``, get()) and
+    vectorized lookups (locate(), contains()) binary-search the mapped
+    node_id column.
+    """
+
+    def __init__(self, path: str):
+        _require_numpy()
+        with open(path, 'rb') as f:
+            magic = f.read(len(MAGIC))
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a node index (bad magic {magic!r})")
+            (header_size,) = struct.unpack('<I', f.read(4))
+            header = json.loads(f.read(header_size))
+        self.path = path
+        self.count: int = header['count']
+        self.key_width: int = header['key_width']
+        self.labels: List[str] = header['labels']
+        self.sources: List[str] = header['sources']
+
+        offset = len(MAGIC) + 4 + header_size
+        offset += _padded(offset)
+        columns = {}
+        for name, dtype in (
+            ('node_id', f'S{self.key_width}'),
+            ('label', _LABEL_DTYPE),
+            ('source', _SOURCE_DTYPE),
+            ('row', _ROW_DTYPE),
+        ):
+            dtype = np.dtype(dtype)
+            if self.count:
+                columns[name] = np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(self.count,))
+            else:
+                columns[name] = np.empty(0, dtype=dtype)
+            offset += dtype.itemsize * self.count
+            offset += _padded(offset)
+        self.node_ids = columns['node_id']
+        self._label_codes = columns['label']
+        self._source_codes = columns['source']
+        self._rows = columns['row']
+        self._label_names = np.array(self.labels, dtype=object)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, node_id: Any) -> bool:
+        return self.get(node_id) is not None
+
+    def __getitem__(self, node_id: Any) -> NodeLocation:
+        location = self.get(node_id)
+        if location is None:
+            raise KeyError(node_id)
+        return location
+
+    def get(self, node_id: Any) -> Optional[NodeLocation]:
+        """Return the NodeLocation of node_id, or None if it is not indexed."""
+        position = int(self.locate([node_id])[0])
+        if position < 0:
+            return None
+        return NodeLocation(
+            self.labels[self._label_codes[position]],
+            self.sources[self._source_codes[position]],
+            int(self._rows[position]),
+        )
+
+    def locate(self, node_ids: Any) -> Any:
+        """Positions of node_ids in the index (-1 where missing), as an int64 array.
+
+        Args:
+            node_ids: Sequence or array of node_ids (str or bytes)
+        """
+        keys = _encode_keys(node_ids)
+        positions = np.full(len(keys), -1, dtype=np.int64)
+        if not self.count or not len(keys):
+            return positions
+        fits = np.ones(len(keys), dtype=bool)
+        if keys.dtype.itemsize > self.key_width:
+            # Longer keys cannot be indexed; astype() would truncate them
+            fits = np.char.str_len(keys) <= self.key_width
+            keys = keys.astype(self.node_ids.dtype)
+        found = np.searchsorted(self.node_ids, keys)
+        in_range = found < self.count
+        found_clipped = np.minimum(found, self.count - 1)
+        hit = fits & in_range & (self.node_ids[found_clipped] == keys)
+        positions[hit] = found[hit]
+        return positions
+
+    def contains(self, node_ids: Any) -> Any:
+        """Boolean array: whether each of node_ids is indexed."""
+        return self.locate(node_ids) >= 0
+
+    def primary_labels(self, positions: Any) -> Any:
+        """Primary labels (object array) at positions returned by locate()."""
+        return self._label_names[self._label_codes[positions]]
+
+    def close(self) -> None:
+        """Release the memory maps."""
+        for name in ('node_ids', '_label_codes', '_source_codes', '_rows'):
+            column = getattr(self, name)
+            if isinstance(column, np.memmap):
+                column._mmap.close()
+            setattr(self, name, None)
+
+    def __enter__(self) -> 'NodeIndex':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def iter_orphan_edges(
+    index: NodeIndex,
+    sources: Union[str, Iterable[str]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """Yield the relationships whose start or end node is not in the index.
+
+    Endpoints are checked a batch at a time with vectorized lookups, so
+    relationship files of any size are streamed with bounded memory.
+
+    Args:
+        index: Index of the node set the relationships should refer to
+        sources: Relationship JSONL files and/or Parquet files or directories
+        batch_size: Parquet rows read at a time
+
+    Yields:
+        Dicts with source, row, rel_id, start_node and end_node (node_ids) and
+        missing (the endpoint names not found)
+    """
+    for source in _expand_sources(sources):
+        row = 0
+        for rel_ids, start_ids, end_ids in _iter_columns(source, _EDGE_PATHS, batch_size):
+            start_missing = ~index.contains(start_ids)
+            end_missing = ~index.contains(end_ids)
+            for offset in np.flatnonzero(start_missing | end_missing).tolist():
+                missing = []
+                if start_missing[offset]:
+                    missing.append('start_node')
+                if end_missing[offset]:
+                    missing.append('end_node')
+                yield {
+                    'source': source,
+                    'row': row + offset,
+                    'rel_id': rel_ids[offset],
+                    'start_node': start_ids[offset],
+                    'end_node': end_ids[offset],
+                    'missing': missing,
+                }
+            row += len(rel_ids)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m networksdb.io.node_index',
+        description='Build node_id indexes and find relationships with missing endpoints.',
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help='Index canonical node files by node_id')
+    build.add_argument('inputs', nargs='+', help='Node JSONL files, Parquet files or directories')
+    build.add_argument('-o', '--output', required=True, help='Index file to write')
+    build.add_argument(
+        '--run-size', type=int, default=DEFAULT_RUN_SIZE,
+        help=f'Nodes sorted in memory at a time (default: {DEFAULT_RUN_SIZE:,})',
+    )
+    build.add_argument('--tmp-dir', help='Directory for temporary run files')
+
+    orphans = commands.add_parser('orphans', help='List relationships whose endpoints are not indexed')
+    orphans.add_argument('index', help='Index file written by build')
+    orphans.add_argument('inputs', nargs='+', help='Relationship JSONL files, Parquet files or directories')
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        count = build_node_index(args.inputs, args.output, args.run_size, args.tmp_dir)
+        print(f"Indexed {count:,} node_ids", file=sys.stderr)
+        return 0
+
+    count = 0
+    with NodeIndex(args.index) as index:
+        for orphan in iter_orphan_edges(index, args.inputs):
+            sys.stdout.write(json.dumps(orphan))
+            sys.stdout.write('\n')
+            count += 1
+    print(f"Found {count:,} relationships with missing endpoints", file=sys.stderr)
+    return 1 if count else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,385 @@
+"""Canonical-format Parquet writer.
+
+Writes nodes and relationships in the canonical to_dict() layout, one Hive-style
+partition per entity type:
+
+    <root>/nodes/primary_label=PublicIPAddress/part-00000.parquet
+    <root>/relationships/rel_type=HAS_IP/part-00000.parquet
+
+Every partition uses the fixed Arrow schema of its entity type (see
+networksdb.arrow_schema), so no schema is inferred per batch. Input is buffered
+per partition up to one row group and written as soon as a row group is full,
+so memory stays bounded by roughly row_group_size rows per entity type.
+Low-cardinality columns are dictionary-encoded and pages are zstd-compressed
+by default.
+
+Usage:
+    with CanonicalParquetWriter("out/") as writer:
+        writer.write_all(nodes)
+        writer.write_batch(Domain.from_columns(table))
+"""
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from ..arrow_schema import arrow_schema, canonical_batch
+from ..base.serialization import dumps_json
+from ..metadata import load_metadata_from_package
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pc = None
+    pq = None
+
+DEFAULT_ROW_GROUP_SIZE = 128_000
+
+# Parquet leaf columns with few distinct values per file
+DICTIONARY_COLUMNS = (
+    'primary_label',
+    'labels.list.element',
+    'schema_version',
+    'rel_type',
+    'start_node.primary_label',
+    'end_node.primary_label',
+)
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("Parquet output requires pyarrow: pip install pyarrow")
+
+
+def _leaf_paths(arrow_type: Any, prefix: str) -> List[str]:
+    """Parquet column paths of the leaves under an Arrow type."""
+    if pa.types.is_struct(arrow_type):
+        return [
+            path for field in arrow_type
+            for path in _leaf_paths(field.type, f"{prefix}.{field.name}")
+        ]
+    if pa.types.is_list(arrow_type):
+        return _leaf_paths(arrow_type.value_type, f"{prefix}.list.element")
+    return [prefix]
+
+
+def _dictionary_columns(schema: Any, columns: Sequence[str]) -> List[str]:
+    leaves = {path for field in schema for path in _leaf_paths(field.type, field.name)}
+    return [column for column in columns if column in leaves]
+
+
+def _to_arrow_table(batch: Any) -> Any:
+    """Accept a pyarrow Table/RecordBatch or a Polars DataFrame."""
+    if isinstance(batch, pa.Table):
+        return batch
+    if isinstance(batch, pa.RecordBatch):
+        return pa.Table.from_batches([batch])
+    if hasattr(batch, 'to_arrow'):
+        return batch.to_arrow()
+    raise TypeError(
+        f"Expected a pyarrow Table/RecordBatch or Polars DataFrame, got {type(batch).__name__}"
+    )
+
+
+def _struct_child(column: Any, name: str, arrow_type: Any) -> Any:
+    """Child `name` of a struct column cast to arrow_type (nulls if absent)."""
+    if name not in [field.name for field in column.type]:
+        return pa.nulls(len(column), type=arrow_type)
+    return column.field(name).cast(arrow_type)
+
+
+def _parse_json_container(column: Any) -> Any:
+    """Decode a JSON-string container column (serialize_containers=True) to dicts."""
+    return [json.loads(value) if value is not None else {} for value in column.to_pylist()]
+
+
+def conform_table(table: Any, entity_type_name: str) -> Any:
+    """Cast a canonical table of one entity type to that entity's fixed schema.
+
+    Property containers may be struct columns (e.g. from_columns() output,
+    whose structs hold the union of fields across classified subclasses) or
+    JSON strings. Schema properties are picked out by name and cast; any other
+    non-null struct fields become the dynamic_properties JSON.
+
+    Args:
+        table: pyarrow Table in the canonical layout, rows of one entity type
+        entity_type_name: Primary label or relationship type of the rows
+
+    Returns:
+        pyarrow Table with exactly arrow_schema(entity_type_name)
+    """
+    schema = arrow_schema(entity_type_name)
+    if table.schema.equals(schema, check_metadata=False):
+        return table.replace_schema_metadata(schema.metadata)
+
+    for container in ('identifying_properties', 'properties'):
+        if container in table.column_names and pa.types.is_string(table.schema.field(container).type):
+            # JSON containers have no fixed layout: go through the row path
+            records = table.to_pylist()
+            parsed = {
+                name: _parse_json_container(table.column(name))
+                for name in ('identifying_properties', 'properties')
+                if name in table.column_names
+            }
+            for index, record in enumerate(records):
+                for name, values in parsed.items():
+                    record[name] = values[index]
+            return pa.Table.from_batches([canonical_batch(records, entity_type_name)])
+
+    entity = load_metadata_from_package(__package__.rpartition('.')[0]).get_entity(entity_type_name)
+    declared = set(entity.properties)
+    arrays = []
+    for field in schema:
+        if field.name == 'dynamic_properties':
+            arrays.append(_dynamic_column(table, declared))
+        elif pa.types.is_struct(field.type) and field.name in ('identifying_properties', 'properties'):
+            column = table.column(field.name).combine_chunks()
+            arrays.append(pa.StructArray.from_arrays(
+                [_struct_child(column, child.name, child.type) for child in field.type],
+                fields=list(field.type),
+            ))
+        else:
+            arrays.append(table.column(field.name).cast(field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def _dynamic_column(table: Any, declared: set) -> Any:
+    """JSON of the non-schema struct fields of each row (null when none are set)."""
+    extras = []
+    for container in ('identifying_properties', 'properties', 'dynamic_properties'):
+        if container not in table.column_names:
+            continue
+        column = table.column(container).combine_chunks()
+        if container == 'dynamic_properties':
+            if pa.types.is_string(column.type):
+                # Already JSON: keep it as is
+                return column
+            continue
+        for field in column.type:
+            if field.name not in declared:
+                extras.append((field.name, column.field(field.name).to_pylist()))
+    if not extras:
+        return pa.nulls(table.num_rows, type=pa.string())
+    values = []
+    for row in range(table.num_rows):
+        dynamic = {name: column[row] for name, column in extras if column[row] is not None}
+        values.append(dumps_json(dynamic) if dynamic else None)
+    return pa.array(values, type=pa.string())
+
+
+class _Partition:
+    """Buffered Parquet output of one entity type."""
+
+    __slots__ = (
+        "entity", "directory", "schema", "records", "tables", "buffered",
+        "writer", "rows_in_file", "paths",
+    )
+
+    def __init__(self, entity: str, directory: str):
+        self.entity = entity
+        self.directory = directory
+        self.schema = arrow_schema(entity)
+        self.records: List[Dict[str, Any]] = []
+        self.tables: List[Any] = []
+        self.buffered = 0
+        self.writer: Optional[Any] = None
+        self.rows_in_file = 0
+        self.paths: List[str] = []
+
+
+def _stage_records(partition: _Partition) -> None:
+    """Convert buffered records to a table, keeping input order with batches."""
+    if partition.records:
+        partition.tables.append(
+            pa.Table.from_batches([canonical_batch(partition.records, partition.entity)])
+        )
+        partition.records = []
+
+
+class CanonicalParquetWriter:
+    """Stream nodes/relationships into canonical Parquet, partitioned by entity type.
+
+    Args:
+        root: Output directory (created if missing)
+        row_group_size: Rows per Parquet row group, also the per-entity buffer size
+        compression: Parquet compression codec
+        compression_level: Codec level (None for the codec default)
+        max_rows_per_file: Start a new part file after this many rows (None: one
+            file per entity type)
+        dictionary_columns: Parquet leaf columns to dictionary-encode
+    """
+
+    def __init__(
+        self,
+        root: str,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        compression: str = 'zstd',
+        compression_level: Optional[int] = None,
+        max_rows_per_file: Optional[int] = None,
+        dictionary_columns: Sequence[str] = DICTIONARY_COLUMNS,
+    ):
+        _require_pyarrow()
+        if row_group_size <= 0:
+            raise ValueError(f"row_group_size must be > 0, got {row_group_size}")
+        if max_rows_per_file is not None and max_rows_per_file < row_group_size:
+            raise ValueError("max_rows_per_file must be >= row_group_size")
+        self.root = root
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self.compression_level = compression_level
+        self.max_rows_per_file = max_rows_per_file
+        self.dictionary_columns = tuple(dictionary_columns)
+        self._partitions: Dict[str, _Partition] = {}
+        self._closed = False
+
+    # ========== Input ==========
+
+    def write(self, item: Any) -> None:
+        """Write one node/relationship instance or to_dict() record."""
+        record = item.to_dict() if hasattr(item, 'to_dict') else item
+        entity = record.get('primary_label') or record.get('rel_type')
+        if entity is None:
+            raise ValueError(f"Record has neither primary_label nor rel_type: {record!r}")
+        partition = self._partition(entity, 'rel_type' in record)
+        partition.records.append(record)
+        partition.buffered += 1
+        if partition.buffered >= self.row_group_size:
+            self._flush(partition, final=False)
+
+    def write_all(self, items: Iterable[Any]) -> None:
+        """Write many node/relationship instances or to_dict() records."""
+        for item in items:
+            self.write(item)
+
+    def write_batch(self, batch: Any, entity_type_name: Optional[str] = None) -> None:
+        """Write a columnar batch in the canonical layout.
+
+        Args:
+            batch: pyarrow Table/RecordBatch or Polars DataFrame, e.g. the output
+                of from_columns(). Rows may mix entity types; they are split by
+                primary_label/rel_type.
+            entity_type_name: Entity type of all rows, if the batch has no
+                primary_label/rel_type column
+        """
+        table = _to_arrow_table(batch)
+        is_relationship = 'rel_type' in table.column_names or 'rel_id' in table.column_names
+        key = 'rel_type' if is_relationship else 'primary_label'
+        if entity_type_name is not None:
+            groups = [(entity_type_name, table)]
+        else:
+            if key not in table.column_names:
+                raise ValueError(f"Batch has no '{key}' column; pass entity_type_name")
+            entities = table.column(key).unique().to_pylist()
+            if len(entities) == 1:
+                groups = [(entities[0], table)]
+            else:
+                groups = [
+                    (entity, table.filter(pc.equal(table.column(key), entity)))
+                    for entity in entities
+                ]
+        for entity, rows in groups:
+            partition = self._partition(entity, is_relationship)
+            _stage_records(partition)
+            partition.tables.append(conform_table(rows, entity))
+            partition.buffered += rows.num_rows
+            if partition.buffered >= self.row_group_size:
+                self._flush(partition, final=False)
+
+    # ========== Output ==========
+
+    def _partition(self, entity: str, is_relationship: bool) -> _Partition:
+        if self._closed:
+            raise ValueError("Writer is closed")
+        partition = self._partitions.get(entity)
+        if partition is None:
+            kind, key = ('relationships', 'rel_type') if is_relationship else ('nodes', 'primary_label')
+            directory = os.path.join(self.root, kind, f"{key}={entity}")
+            partition = self._partitions[entity] = _Partition(entity, directory)
+        return partition
+
+    def _open(self, partition: _Partition) -> Any:
+        os.makedirs(partition.directory, exist_ok=True)
+        path = os.path.join(partition.directory, f"part-{len(partition.paths):05d}.parquet")
+        partition.paths.append(path)
+        partition.rows_in_file = 0
+        partition.writer = pq.ParquetWriter(
+            path,
+            partition.schema,
+            compression=self.compression,
+            compression_level=self.compression_level,
+            use_dictionary=_dictionary_columns(partition.schema, self.dictionary_columns),
+        )
+        return partition.writer
+
+    def _write_rows(self, partition: _Partition, table: Any) -> None:
+        offset = 0
+        while offset < table.num_rows:
+            writer = partition.writer
+            if writer is None or (
+                self.max_rows_per_file is not None and partition.rows_in_file >= self.max_rows_per_file
+            ):
+                if writer is not None:
+                    writer.close()
+                writer = self._open(partition)
+            take = table.num_rows - offset
+            if self.max_rows_per_file is not None:
+                take = min(take, self.max_rows_per_file - partition.rows_in_file)
+            writer.write_table(table.slice(offset, take), row_group_size=self.row_group_size)
+            partition.rows_in_file += take
+            offset += take
+
+    def _flush(self, partition: _Partition, final: bool) -> None:
+        """Write the full row groups buffered for a partition (everything if final)."""
+        _stage_records(partition)
+        tables = partition.tables
+        if not tables:
+            return
+        table = pa.concat_tables(tables) if len(tables) > 1 else tables[0]
+        keep = 0 if final else table.num_rows % self.row_group_size
+        self._write_rows(partition, table.slice(0, table.num_rows - keep))
+        partition.tables = [table.slice(table.num_rows - keep)] if keep else []
+        partition.buffered = keep
+
+    def flush(self) -> None:
+        """Write all buffered rows (may produce short row groups)."""
+        for partition in self._partitions.values():
+            self._flush(partition, final=True)
+
+    def close(self) -> Dict[str, List[str]]:
+        """Flush and close all files.
+
+        Returns:
+            Mapping of entity type to the Parquet files written for it
+        """
+        if not self._closed:
+            self.flush()
+            for partition in self._partitions.values():
+                if partition.writer is not None:
+                    partition.writer.close()
+                    partition.writer = None
+            self._closed = True
+        return {entity: list(partition.paths) for entity, partition in self._partitions.items()}
+
+    def __enter__(self) -> 'CanonicalParquetWriter':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def write_parquet(items: Iterable[Any], root: str, **options: Any) -> Dict[str, List[str]]:
+    """Write node/relationship instances or to_dict() records to canonical Parquet.
+
+    Args:
+        items: Nodes, relationships and/or to_dict() records, in any mix
+        root: Output directory
+        **options: CanonicalParquetWriter options
+
+    Returns:
+        Mapping of entity type to the Parquet files written for it
+    """
+    with CanonicalParquetWriter(root, **options) as writer:
+        writer.write_all(items)
+    return writer.close()
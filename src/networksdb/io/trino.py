@@ -0,0 +1,446 @@
+"""Bulk loading into Trino (or any qmark-style DB-API connection).
+
+TrinoLoader inserts rows with parameterized multi-row statements:
+
+    INSERT INTO t (a, b) VALUES (?, ?), (?, ?), ...
+
+one statement per batch, with values passed as parameters rather than quoted
+into the SQL. (DB-API executemany() would run one INSERT per row, which in
+Trino means one query, and one Iceberg commit, per row.) Batches run
+concurrently on worker threads, each borrowing a connection from a small pool.
+A transient error raised before a statement is sent (opening the connection
+or its cursor) is retried on a fresh connection with exponential backoff. An
+INSERT that fails after it was sent may still have been applied, so it is
+only retried with retry_submitted=True, at the risk of loading its rows twice.
+
+For data already written as Parquet (see networksdb.io.parquet), files can be
+loaded server-side instead: register their location as a Hive external table
+(create_external_table()) and copy it with insert_select(), so no row passes
+through Python.
+
+Connections come from a zero-argument factory, so any DB-API connection can
+stand in for Trino (sqlite3 uses the same qmark parameter style):
+
+    loader = TrinoLoader(trino_connect(catalog='iceberg', schema='testdb'),
+                         'iceberg.testdb."50k_public"', ['ipv4_address', 'domain'])
+    stats = loader.load_rows(rows)
+    print(f"{stats.rows:,} rows, {stats.rows_per_second:,.0f} rows/s")
+"""
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Type
+
+try:
+    import trino
+    from trino import exceptions as trino_exceptions
+except ImportError:  # pragma: no cover - optional dependency
+    trino = None
+    trino_exceptions = None
+
+DEFAULT_BATCH_SIZE = 1_000
+DEFAULT_WORKERS = 4
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+
+# Errors worth retrying: connection failures and Trino's external/internal errors.
+# User errors (bad SQL, type mismatches) fail immediately. Once a statement has
+# been sent these are only retried for idempotent statements (see execute()).
+TRANSIENT_ERRORS: Tuple[Type[BaseException], ...] = (OSError,) + tuple(
+    getattr(trino_exceptions, name)
+    for name in ('TrinoConnectionError', 'TrinoExternalError', 'TrinoInternalError', 'HttpError')
+    if trino_exceptions is not None and hasattr(trino_exceptions, name)
+)
+
+Connection = Any
+Row = Sequence[Any]
+
+
+def trino_connect(
+    host: str = 'localhost',
+    port: int = 8080,
+    user: str = 'trino',
+    catalog: str = 'iceberg',
+    schema: str = 'testdb',
+    http_scheme: str = 'http',
+    **options: Any,
+) -> Callable[[], Connection]:
+    """Return a factory of trino.dbapi connections with these settings.
+
+    Raises:
+        ImportError: If the trino client is not installed
+    """
+    if trino is None:
+        raise ImportError("Trino loading requires the trino client: pip install trino")
+    from trino.dbapi import connect
+
+    def factory() -> Connection:
+        return connect(
+            host=host, port=port, user=user, catalog=catalog, schema=schema,
+            http_scheme=http_scheme, **options,
+        )
+
+    return factory
+
+
+class ConnectionPool:
+    """Thread-safe pool of at most `size` connections, created on demand.
+
+    Args:
+        connect: Zero-argument connection factory
+        size: Maximum number of open connections
+    """
+
+    def __init__(self, connect: Callable[[], Connection], size: int = DEFAULT_WORKERS):
+        if size <= 0:
+            raise ValueError(f"size must be > 0, got {size}")
+        self._connect = connect
+        self._idle: 'queue.LifoQueue[Connection]' = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._connections: List[Connection] = []
+
+    def acquire(self) -> Connection:
+        """Borrow a connection, opening one if none is idle (blocks when all are in use)."""
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            connection = self._connect()
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._connections.append(connection)
+        return connection
+
+    def release(self, connection: Connection, broken: bool = False) -> None:
+        """Return a borrowed connection; broken connections are closed, not reused."""
+        if broken:
+            self._discard(connection)
+        else:
+            self._idle.put(connection)
+        self._slots.release()
+
+    def _discard(self, connection: Connection) -> None:
+        with self._lock:
+            self._connections = [c for c in self._connections if c is not connection]
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        """Close every connection the pool opened."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        for connection in connections:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    def __enter__(self) -> 'ConnectionPool':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class LoadStats:
+    """Counters of a load; rows_per_second covers the wall time so far."""
+
+    __slots__ = ('rows', 'batches', 'retries', 'started', 'elapsed')
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.batches = 0
+        self.retries = 0
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"LoadStats(rows={self.rows}, batches={self.batches}, retries={self.retries}, "
+            f"elapsed={self.elapsed:.2f}s, rows_per_second={self.rows_per_second:.0f})"
+        )
+
+
+def _run(cursor: Any, sql: str, parameters: Optional[Sequence[Any]] = None) -> List[Any]:
+    if parameters is None:
+        cursor.execute(sql)
+    else:
+        cursor.execute(sql, parameters)
+    # Trino runs a query until its results are consumed (closing the cursor
+    # earlier cancels it); an INSERT returns its row count
+    return cursor.fetchall()
+
+
+class TrinoLoader:
+    """Concurrent, retrying batch loader for one table.
+
+    Args:
+        connect: Zero-argument DB-API connection factory (see trino_connect())
+        table: Target table name, as it should appear in SQL
+        columns: Column names, in the order of each row's values
+        batch_size: Rows per INSERT statement
+        workers: Batches in flight at once (and pool size)
+        retries: Attempts after the first for a failing batch
+        backoff: Seconds before the first retry, doubled for each further one
+        retry_on: Exception types that are retried (default: TRANSIENT_ERRORS)
+        retry_submitted: Also retry statements that failed after being sent.
+            The server may have applied them, so a retried INSERT batch can
+            load its rows twice; enable only when duplicates are acceptable
+            or removed downstream (e.g. by node_id)
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Connection],
+        table: str,
+        columns: Sequence[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        workers: int = DEFAULT_WORKERS,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        retry_on: Tuple[Type[BaseException], ...] = TRANSIENT_ERRORS,
+        retry_submitted: bool = False,
+    ):
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be > 0, got {batch_size}")
+        if retries < 0:
+            raise ValueError(f"retries must be >= 0, got {retries}")
+        if not columns:
+            raise ValueError("columns must not be empty")
+        self.pool = ConnectionPool(connect, workers)
+        self.table = table
+        self.columns = list(columns)
+        self.batch_size = batch_size
+        self.workers = workers
+        self.retries = retries
+        self.backoff = backoff
+        self.retry_on = retry_on
+        self.retry_submitted = retry_submitted
+        self._row_placeholder = '(' + ', '.join('?' * len(self.columns)) + ')'
+        self._statements: Dict[int, str] = {}
+        self._stats_lock = threading.Lock()
+
+    def insert_sql(self, row_count: int) -> str:
+        """Parameterized INSERT statement for row_count rows (cached per count)."""
+        sql = self._statements.get(row_count)
+        if sql is None:
+            sql = self._statements[row_count] = (
+                f"INSERT INTO {self.table} ({', '.join(self.columns)}) VALUES "
+                + ', '.join([self._row_placeholder] * row_count)
+            )
+        return sql
+
+    def execute(
+        self,
+        sql: str,
+        parameters: Optional[Sequence[Any]] = None,
+        stats: Optional[LoadStats] = None,
+        idempotent: bool = False,
+    ) -> List[Any]:
+        """Run one statement on a pooled connection, retrying transient errors.
+
+        Errors opening the connection or cursor are always retried; errors
+        after the statement was sent only if it is idempotent or the loader
+        was created with retry_submitted=True.
+
+        Args:
+            sql: Statement to run
+            parameters: Values of its ? placeholders
+            stats: LoadStats whose retries counter to update
+            idempotent: Whether running the statement twice is harmless
+                (e.g. CREATE TABLE IF NOT EXISTS)
+
+        Returns:
+            The statement's result rows (fetched, so the query completes)
+        """
+        retry_submitted = idempotent or self.retry_submitted
+        attempt = 0
+        while True:
+            connection = None
+            submitted = False
+            try:
+                connection = self.pool.acquire()
+                cursor = connection.cursor()
+                submitted = True
+                try:
+                    result = _run(cursor, sql, parameters)
+                finally:
+                    cursor.close()
+                commit = getattr(connection, 'commit', None)
+                if commit is not None:
+                    commit()
+            except self.retry_on:
+                if connection is not None:
+                    self.pool.release(connection, broken=True)
+                if attempt >= self.retries or (submitted and not retry_submitted):
+                    raise
+                if stats is not None:
+                    with self._stats_lock:
+                        stats.retries += 1
+                time.sleep(self.backoff * 2 ** attempt)
+                attempt += 1
+                continue
+            except BaseException:
+                if connection is not None:
+                    self.pool.release(connection, broken=True)
+                raise
+            self.pool.release(connection)
+            return result
+
+    def _insert_batch(self, batch: List[Row], stats: LoadStats) -> None:
+        parameters = [value for row in batch for value in row]
+        self.execute(self.insert_sql(len(batch)), parameters, stats)
+        with self._stats_lock:
+            stats.rows += len(batch)
+            stats.batches += 1
+            stats.elapsed = time.perf_counter() - stats.started
+
+    def load_rows(
+        self,
+        rows: Iterable[Row],
+        on_batch: Optional[Callable[[LoadStats], None]] = None,
+    ) -> LoadStats:
+        """Insert rows (sequences of values in column order) in concurrent batches.
+
+        At most 2 * workers batches are held in memory. Batches commit
+        independently: if one still fails after its retries, the error is
+        raised once in-flight batches finish, and earlier batches stay loaded.
+
+        Args:
+            rows: Rows to insert
+            on_batch: Called with the running LoadStats after each batch
+
+        Returns:
+            LoadStats of the load
+        """
+        stats = LoadStats()
+        iterator = iter(rows)
+        pending: Set[Future] = set()
+        error: Optional[BaseException] = None
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='trino-load') as executor:
+            while error is None:
+                while len(pending) < 2 * self.workers:
+                    batch = list(islice(iterator, self.batch_size))
+                    if not batch:
+                        break
+                    pending.add(executor.submit(self._insert_batch, batch, stats))
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is not None:
+                        error = error or future.exception()
+                    elif on_batch is not None:
+                        on_batch(stats)
+            for future in pending:
+                future.cancel()
+        stats.elapsed = time.perf_counter() - stats.started
+        if error is not None:
+            raise error
+        return stats
+
+    def insert_select(self, source: str, source_columns: Optional[Sequence[str]] = None) -> LoadStats:
+        """Copy a (staging) table into the target with INSERT INTO ... SELECT.
+
+        Args:
+            source: Source table name, e.g. a Hive external table over staged
+                Parquet files (see create_external_table())
+            source_columns: Source expressions matching the target columns
+                (default: the same column names)
+
+        Returns:
+            LoadStats; rows is the count Trino reports for the INSERT
+        """
+        stats = LoadStats()
+        select = ', '.join(source_columns or self.columns)
+        result = self.execute(
+            f"INSERT INTO {self.table} ({', '.join(self.columns)}) SELECT {select} FROM {source}",
+            stats=stats,
+        )
+        stats.rows = int(result[0][0]) if result and result[0] and result[0][0] is not None else 0
+        stats.batches = 1
+        stats.elapsed = time.perf_counter() - stats.started
+        return stats
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.pool.close()
+
+    def __enter__(self) -> 'TrinoLoader':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def trino_type(arrow_type: Any) -> str:
+    """Trino SQL type of a pyarrow type (as used by the canonical schemas).
+
+    Raises:
+        ValueError: If the type has no Trino mapping here
+    """
+    import pyarrow as pa
+
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return 'VARCHAR'
+    if pa.types.is_int64(arrow_type):
+        return 'BIGINT'
+    if pa.types.is_int32(arrow_type):
+        return 'INTEGER'
+    if pa.types.is_floating(arrow_type):
+        return 'DOUBLE'
+    if pa.types.is_boolean(arrow_type):
+        return 'BOOLEAN'
+    if pa.types.is_list(arrow_type):
+        return f'ARRAY({trino_type(arrow_type.value_type)})'
+    if pa.types.is_struct(arrow_type):
+        return 'ROW(' + ', '.join(f'"{field.name}" {trino_type(field.type)}' for field in arrow_type) + ')'
+    if pa.types.is_dictionary(arrow_type):
+        return trino_type(arrow_type.value_type)
+    raise ValueError(f"No Trino type for Arrow type {arrow_type}")
+
+
+def external_table_sql(table: str, schema: Any, location: str, file_format: str = 'PARQUET') -> str:
+    """CREATE TABLE statement of a Hive external table over staged files.
+
+    Args:
+        table: Table to create, in a Hive catalog (e.g. hive.staging.domain)
+        schema: pyarrow.Schema of the files (e.g. arrow_schema('Domain'))
+        location: Directory holding the files, as Trino sees it (s3://..., hdfs://...)
+        file_format: Hive storage format
+    """
+    columns = ',\n    '.join(f'"{field.name}" {trino_type(field.type)}' for field in schema)
+    escaped = location.replace("'", "''")
+    return (
+        f"CREATE TABLE IF NOT EXISTS {table} (\n    {columns}\n)\n"
+        f"WITH (external_location = '{escaped}', format = '{file_format}')"
+    )
+
+
+def create_external_table(
+    loader: TrinoLoader,
+    table: str,
+    schema: Any,
+    location: str,
+    file_format: str = 'PARQUET',
+) -> None:
+    """Register staged files as a Hive external table, for TrinoLoader.insert_select()."""
+    loader.execute(external_table_sql(table, schema, location, file_format), idempotent=True)
@@ -0,0 +1,173 @@
+"""Lazy loading helpers for the registry.
+
+LazyClassMap backs the registry's lookup tables: each generated class is
+imported the first time it is looked up, so importing the package does not
+define and compile every Pydantic model.
+
+Registry.deserialize_many() returns LazyNode proxies: the matching class and the
+raw property dict are resolved up front, but the Pydantic model (defaults,
+normalizers, validators) is only built when something that needs it is
+accessed. Raw properties stay readable through item access without that cost.
+"""
+import importlib
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+
+class _ClassRef:
+    """Not-yet-imported class: module name and attribute."""
+
+    __slots__ = ("module", "name", "package")
+
+    def __init__(self, module: str, name: str, package: Optional[str]):
+        self.module = module
+        self.name = name
+        self.package = package
+
+    def load(self) -> type:
+        return getattr(importlib.import_module(self.module, self.package), self.name)
+
+    def __repr__(self) -> str:
+        return f"<lazy {self.module}.{self.name}>"
+
+
+class LazyClassMap(MutableMapping):
+    """Dict-like key -> class mapping that imports each class on first lookup.
+
+    Membership tests, len() and key iteration never import anything; item
+    access (and values()/items(), which go through it) imports the class once
+    and caches it. Assigned values are stored as-is.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, refs: Dict[str, Tuple[str, str]], package: Optional[str] = None):
+        """
+        Args:
+            refs: key -> (module, class name); relative modules resolve against package
+            package: Package for relative module names
+        """
+        self._data: Dict[str, Any] = {
+            key: _ClassRef(module, name, package) for key, (module, name) in refs.items()
+        }
+
+    def __getitem__(self, key: str) -> type:
+        value = self._data[key]
+        if type(value) is _ClassRef:
+            value = self._data[key] = value.load()
+        return value
+
+    def __setitem__(self, key: str, value: type) -> None:
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"LazyClassMap({self._data!r})"
+
+
+def materialize_node(
+    node_class: type,
+    data: Dict[str, Any],
+    extra_labels: Iterable[str] = (),
+    trusted: bool = False,
+) -> Any:
+    """Build a node instance the way Registry.deserialize_node_from_labels does.
+
+    Args:
+        node_class: Class to instantiate
+        data: Node properties
+        extra_labels: Neo4j labels not defined by node_class
+        trusted: If True, skip validation (as model_construct() does). Only for
+            data written by this package, which is already normalized.
+
+    Returns:
+        Node instance with extra labels merged into additional_labels
+    """
+    if trusted:
+        # Deferred: networksdb.base imports ziptie_schema
+        from .base.construct import construct
+
+        instance = construct(node_class, data)
+        if extra_labels and 'additional_labels' in instance.__dict__:
+            # Direct write: the trusted path skips validate_assignment too
+            current_labels = instance.__dict__['additional_labels'] or []
+            instance.__dict__['additional_labels'] = list(set(current_labels) | set(extra_labels))
+            instance.__pydantic_fields_set__.add('additional_labels')
+        return instance
+
+    instance = node_class(**data)
+    if extra_labels and hasattr(instance, 'additional_labels'):
+        current_labels = getattr(instance, 'additional_labels', [])
+        instance.additional_labels = list(set(current_labels) | set(extra_labels))
+    return instance
+
+
+class LazyNode:
+    """Proxy for a node that is validated and built on first model access.
+
+    ``node["prop"]``, ``node.get("prop")``, ``node.data``, ``node.node_class``
+    and ``node.primary_label`` read the raw record without building the model.
+    Any other attribute (node_id, labels, fields, to_dict(), merge(), ...)
+    materializes the model once and delegates to it.
+    """
+
+    __slots__ = ("node_class", "data", "extra_labels", "trusted", "_instance")
+
+    def __init__(
+        self,
+        node_class: type,
+        data: Dict[str, Any],
+        extra_labels: Iterable[str] = (),
+        trusted: bool = False,
+    ):
+        self.node_class = node_class
+        self.data = data
+        self.extra_labels = tuple(extra_labels)
+        self.trusted = trusted
+        self._instance: Optional[Any] = None
+
+    @property
+    def primary_label(self) -> str:
+        """Primary label of the node class (no materialization)."""
+        label = self.node_class._primary_label
+        return label.get_default() if hasattr(label, 'get_default') else label
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the model instance has been built."""
+        return self._instance is not None
+
+    def materialize(self) -> Any:
+        """Return the model instance, building (and validating) it on first call."""
+        instance = self._instance
+        if instance is None:
+            instance = self._instance = materialize_node(
+                self.node_class, self.data, self.extra_labels, self.trusted
+            )
+        return instance
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Raw property value, without building the model."""
+        return self.data.get(key, default)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names that are not proxy slots or properties
+        return getattr(self.materialize(), name)
+
+    def __repr__(self) -> str:
+        state = "materialized" if self._instance is not None else "lazy"
+        return f"LazyNode({self.node_class.__name__}, {self.data!r}, {state})"
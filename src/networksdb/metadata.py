@@ -0,0 +1,274 @@
+"""Schema metadata registry over sql_metadata (see api_specification.md).
+
+Exposes the schema information of each entity (property layout, identifying
+fields, merge strategies) without instantiating models or walking the raw
+nested sql_metadata dict. Metadata objects are immutable, built once per
+package and process, and shared by every caller:
+
+    registry = load_metadata_from_package("networksdb")
+    entity_meta = registry.get_entity("PublicIPAddress")
+    entity_meta.classify_fields(["address", "context", "count"])
+    # {"identifying_properties": ["address"], "properties": ["count"],
+    #  "dynamic_properties": ["context"]}
+"""
+import importlib
+from types import MappingProxyType, ModuleType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence
+
+DEFAULT_MERGE_STRATEGY = "take_first"
+
+# classify_fields() result buckets
+IDENTIFYING_PROPERTIES = "identifying_properties"
+PROPERTIES = "properties"
+DYNAMIC_PROPERTIES = "dynamic_properties"
+
+
+class _Frozen:
+    """Base for read-only __slots__ objects: attributes are set once in __init__."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def _init(self, **attributes: Any) -> None:
+        for name, value in attributes.items():
+            object.__setattr__(self, name, value)
+
+
+class PropertyMetadata(_Frozen):
+    """Metadata for a single property (schema-defined or canonical)."""
+
+    __slots__ = (
+        "name", "type", "items_type", "identifying", "required", "source",
+        "fields", "_merge_strategy",
+    )
+
+    def __init__(self, name: str, spec: Mapping[str, Any]):
+        self._init(
+            name=name,
+            type=spec.get('type'),
+            items_type=spec.get('items_type'),
+            identifying=bool(spec.get('identifying', False)),
+            required=bool(spec.get('required', False)),
+            source=spec.get('source'),
+            # Sub-fields of structured canonical fields (e.g. start_node)
+            fields=tuple(
+                PropertyMetadata(field_name, field_spec)
+                for field_name, field_spec in spec.get('properties', {}).items()
+            ),
+            _merge_strategy=spec.get('merge_strategy') or DEFAULT_MERGE_STRATEGY,
+        )
+
+    def is_identifying(self) -> bool:
+        """Whether this property goes in the identifying_properties struct."""
+        return self.identifying
+
+    @property
+    def merge_strategy(self) -> str:
+        """Merge strategy for deduplication ("take_first" if the schema sets none)."""
+        return self._merge_strategy
+
+    def __repr__(self) -> str:
+        return (
+            f"PropertyMetadata({self.name!r}, type={self.type!r}, "
+            f"identifying={self.identifying}, merge_strategy={self._merge_strategy!r})"
+        )
+
+
+class EntityMetadata(_Frozen):
+    """Metadata for a single node or relationship type.
+
+    Each known field name gets one bit. Identifying, regular and canonical
+    fields are precomputed bitmasks, so classifying a field list is one dict
+    lookup and mask test per name. Results are also memoized per field tuple,
+    since the same DataFrame schema is usually classified for every batch.
+    """
+
+    __slots__ = (
+        "name", "class_name", "is_relationship", "schema_version",
+        "has_dynamic_properties", "properties", "merge_strategies",
+        "identifying_fields", "regular_fields", "canonical_fields", "canonical",
+        "_bits", "_identifying_mask", "_regular_mask", "_canonical_mask",
+        "_classified",
+    )
+
+    def __init__(self, name: str, spec: Mapping[str, Any]):
+        properties: Dict[str, PropertyMetadata] = {}
+        canonical: Dict[str, PropertyMetadata] = {}
+        for prop_name, prop_spec in spec.get('properties', {}).items():
+            if prop_spec.get('source') == 'canonical':
+                canonical[prop_name] = PropertyMetadata(prop_name, prop_spec)
+            else:
+                properties[prop_name] = PropertyMetadata(prop_name, prop_spec)
+
+        identifying = tuple(prop_name for prop_name, prop in properties.items() if prop.identifying)
+        regular = tuple(prop_name for prop_name, prop in properties.items() if not prop.identifying)
+        bits = {field: 1 << index for index, field in enumerate((*properties, *canonical))}
+
+        def mask(fields: Sequence[str]) -> int:
+            value = 0
+            for field in fields:
+                value |= bits[field]
+            return value
+
+        self._init(
+            name=name,
+            class_name=spec.get('class_name', name),
+            is_relationship=bool(spec.get('is_relationship', False)),
+            schema_version=spec.get('schema_version'),
+            has_dynamic_properties=bool(spec.get('has_dynamic_properties', False)),
+            properties=MappingProxyType(properties),
+            merge_strategies=MappingProxyType(
+                {prop_name: prop.merge_strategy for prop_name, prop in properties.items()}
+            ),
+            identifying_fields=identifying,
+            regular_fields=regular,
+            canonical_fields=tuple(canonical),
+            canonical=MappingProxyType(canonical),
+            _bits=bits,
+            _identifying_mask=mask(identifying),
+            _regular_mask=mask(regular),
+            _canonical_mask=mask(canonical),
+            _classified={},
+        )
+
+    def classify_fields(self, field_names: Sequence[str]) -> Dict[str, List[str]]:
+        """Classify field names into their struct buckets.
+
+        Canonical fields (node_id, labels, ...) belong to no bucket and are
+        left out; every other name not defined by this entity's schema is a
+        dynamic property. Input order is kept within each bucket.
+
+        Args:
+            field_names: Field names from a DataFrame schema or entity dict
+
+        Returns:
+            Dict with "identifying_properties", "properties" and
+            "dynamic_properties" lists
+        """
+        key = tuple(field_names)
+        buckets = self._classified.get(key)
+        if buckets is None:
+            identifying: List[str] = []
+            regular: List[str] = []
+            dynamic: List[str] = []
+            bits = self._bits
+            for field in key:
+                bit = bits.get(field, 0)
+                if bit & self._identifying_mask:
+                    identifying.append(field)
+                elif bit & self._regular_mask:
+                    regular.append(field)
+                elif not bit & self._canonical_mask:
+                    dynamic.append(field)
+            buckets = self._classified[key] = (tuple(identifying), tuple(regular), tuple(dynamic))
+        return {
+            IDENTIFYING_PROPERTIES: list(buckets[0]),
+            PROPERTIES: list(buckets[1]),
+            DYNAMIC_PROPERTIES: list(buckets[2]),
+        }
+
+    def __repr__(self) -> str:
+        return f"EntityMetadata({self.name!r}, properties={list(self.properties)})"
+
+
+class MetadataRegistry(_Frozen):
+    """Registry of entity metadata for a schema package."""
+
+    __slots__ = ("package_name", "entities", "_aliases")
+
+    def __init__(self, package_name: str, sql_metadata: Mapping[str, Any]):
+        entities = {
+            name: EntityMetadata(name, spec)
+            for name, spec in sql_metadata.items()
+            if not name.startswith('_')
+        }
+        # Relationships are keyed by rel_type; also accept their class names
+        aliases = {
+            entity.class_name: entity for entity in entities.values()
+            if entity.class_name not in entities
+        }
+        self._init(
+            package_name=package_name,
+            entities=MappingProxyType(entities),
+            _aliases=aliases,
+        )
+
+    def get_entity(self, entity_type_name: str) -> EntityMetadata:
+        """Get metadata for an entity type.
+
+        Args:
+            entity_type_name: Primary label or relationship type as used in
+                sql_metadata (e.g. "PublicIPAddress", "HAS_IP"), or class name
+
+        Returns:
+            EntityMetadata for that type
+
+        Raises:
+            KeyError: If the entity type is not found
+        """
+        entity = self.entities.get(entity_type_name)
+        if entity is None:
+            entity = self._aliases.get(entity_type_name)
+            if entity is None:
+                raise KeyError(
+                    f"Entity '{entity_type_name}' not found in sql_metadata. "
+                    f"Available: {list(self.entities)}"
+                )
+        return entity
+
+    def __contains__(self, entity_type_name: object) -> bool:
+        return entity_type_name in self.entities or entity_type_name in self._aliases
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entities)
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def __repr__(self) -> str:
+        return f"MetadataRegistry({self.package_name!r}, entities={list(self.entities)})"
+
+
+_registries: Dict[str, MetadataRegistry] = {}
+
+
+def _package_sql_metadata(package_name: str) -> Optional[Mapping[str, Any]]:
+    package = importlib.import_module(package_name)
+    # Through the package attribute first: networksdb binds it to the dict lazily
+    metadata = getattr(package, 'sql_metadata', None)
+    if metadata is None or isinstance(metadata, ModuleType):
+        try:
+            module = importlib.import_module(f"{package_name}.sql_metadata")
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{package_name}.sql_metadata":
+                raise
+            return None
+        metadata = getattr(module, 'sql_metadata', None)
+    return metadata
+
+
+def load_metadata_from_package(package_name: str) -> MetadataRegistry:
+    """Load the metadata registry for a schema package (built once per process).
+
+    Args:
+        package_name: Name of the schema package (e.g. "networksdb")
+
+    Returns:
+        MetadataRegistry for accessing entity metadata
+
+    Raises:
+        ImportError: If the package is not found or has no sql_metadata
+    """
+    registry = _registries.get(package_name)
+    if registry is None:
+        metadata = _package_sql_metadata(package_name)
+        if not isinstance(metadata, Mapping):
+            raise ImportError(f"Package '{package_name}' has no sql_metadata")
+        registry = _registries[package_name] = MetadataRegistry(package_name, metadata)
+    return registry
+
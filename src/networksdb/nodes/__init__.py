@@ -1,10 +1,27 @@
-"""Generated node models."""
-from .ip_address import IPAddress
-from .private_ip_address import PrivateIPAddress
-from .public_ip_address import PublicIPAddress
-from .domain import Domain
-from .email_address import EmailAddress
-from .email import Email
+"""Generated node models.
+
+Classes are imported on first attribute access (PEP 562), so importing the
+package does not define every model.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .ip_address import IPAddress
+    from .private_ip_address import PrivateIPAddress
+    from .public_ip_address import PublicIPAddress
+    from .domain import Domain
+    from .email_address import EmailAddress
+    from .email import Email
+
+_MODULES = {
+    "IPAddress": ".ip_address",
+    "PrivateIPAddress": ".private_ip_address",
+    "PublicIPAddress": ".public_ip_address",
+    "Domain": ".domain",
+    "EmailAddress": ".email_address",
+    "Email": ".email",
+}
 
 __all__ = [
     "IPAddress",
@@ -14,3 +31,16 @@ __all__ = [
     "EmailAddress",
     "Email",
 ]
+
+
+def __getattr__(name):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -8,6 +8,11 @@ from pydantic import ConfigDict, Field, field_validator, model_validator, comput
 from ziptie_schema.base.models import BaseNode
 from ziptie_schema.base.mixins import IDGenerationMixin
 
+from ..base.merge import merge_instances, merge_plan
+from ..base.node_pool import active_pool
+from ..base.node_ref import NodeRef
+from ..base.serialization import dumps_json, split_properties, to_dict_plan
+
 
 
 class Email(BaseNode, IDGenerationMixin):
@@ -23,6 +28,9 @@ validate_assignment=True
     # Class attributes
     _primary_label = "Email"
     schema_version: ClassVar[str] = "0.1"
+    # Fields that feed node_id; assigning one drops the memoized node_id
+    _identifying_fields: ClassVar[frozenset] = frozenset({"primary_label", "from_rel", "to"})
+    _node_id_memo: Optional[tuple] = None
 
     # Override base fields with defaults from schema
     primary_label: str = Field(
@@ -74,6 +82,17 @@ json_schema_extra={"identifying": True, "from_base_schema": False, "property_typ
 
 
     # Validators for embedded node properties
+    @field_validator('from_rel', 'to', mode='before')
+    @classmethod
+    def _intern_embedded_nodes(cls, v):
+        """Share one EmailAddress per address inside an intern_nodes() batch."""
+        pool = active_pool(EmailAddress)
+        if pool is None or v is None:
+            return v
+        if isinstance(v, list):
+            return [pool.intern(node) for node in v]
+        return pool.intern(v)
+
     @field_validator('from_rel', 'to')
     @classmethod
     def _validate_embedded_nodes(cls, v, info):
@@ -125,14 +144,29 @@ json_schema_extra={"identifying": True, "from_base_schema": False, "property_typ
 
     @property
     def node_id(self) -> str:
-        """Compute the unique node ID."""
-        return self.compute_node_id()
+        """Compute the unique node ID.
 
-    def _serialize_value(self, value):
-        """Convert datetime objects to ISO format strings for JSON serialization."""
-        if isinstance(value, datetime):
-            return value.isoformat()
-        return value
+        Memoized per instance. Embedded nodes can change in place, so the memo
+        is keyed by their (themselves memoized) node_ids.
+        """
+        key = (self.from_rel.node_id, tuple(node.node_id for node in self.to))
+        memo = self._node_id_memo
+        if memo is None or memo[0] != key:
+            memo = self._node_id_memo = (key, self.compute_node_id())
+        return memo[1]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Assign a field (validated via validate_assignment) and drop a stale node_id."""
+        super().__setattr__(name, value)
+        if name in self._identifying_fields:
+            self._node_id_memo = None
+
+    def model_copy(self, *, update: Optional[dict] = None, deep: bool = False) -> Any:
+        """Copy the node, dropping the memoized node_id if identifying fields change."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update and not self._identifying_fields.isdisjoint(update):
+            copied._node_id_memo = None
+        return copied
 
     def to_dict(
         self,
@@ -159,34 +193,8 @@ json_schema_extra={"identifying": True, "from_base_schema": False, "property_typ
         """
         result = {}
 
-        # Use Pydantic's model_fields to iterate through all fields
-        identifying_props = {}
-        regular_props = {}
-
-        for field_name, field_info in self.__class__.model_fields.items():
-            # Skip computed fields and base class fields
-            if field_name in ('node_id', 'labels', 'primary_label', 'additional_labels'):
-                continue
-
-            metadata = field_info.json_schema_extra or {}
-
-            # Skip embedded node properties - they're for relationships, not serialization
-            if metadata.get('property_type') in ['node', 'node_list']:
-                continue
-
-            # Skip excluded fields (those with exclude=True in Field definition)
-            if field_info.exclude:
-                continue
-
-            value = self._serialize_value(getattr(self, field_name))
-
-            # Check if this is an identifying property
-            if metadata.get('identifying', False):
-                identifying_props[field_name] = value
-            # Otherwise it's a regular property
-            else:
-                regular_props[field_name] = value
-
+        # Field layout is resolved once per class (see base.serialization)
+        identifying_props, regular_props = split_properties(self, to_dict_plan(self.__class__))
 
         # Add structured data
         result['node_id'] = self.node_id
@@ -198,9 +206,8 @@ json_schema_extra={"identifying": True, "from_base_schema": False, "property_typ
 
         # Optionally serialize containers to JSON strings
         if serialize_containers:
-            import json
-            result['identifying_properties'] = json.dumps(result['identifying_properties'])
-            result['properties'] = json.dumps(result['properties'])
+            result['identifying_properties'] = dumps_json(result['identifying_properties'])
+            result['properties'] = dumps_json(result['properties'])
 
         return result
 
@@ -211,7 +218,25 @@ json_schema_extra={"identifying": True, "from_base_schema": False, "property_typ
             registry: Optional registry. If None, uses package's default registry.
 
         Returns:
-            List of relationship instances
+            List of relationship instances, whose endpoints are NodeRefs
+
+        Raises:
+            KeyError: If relationship type not found in registry
+            ValidationError: If nodes don't match relationship requirements (from Pydantic)
+        """
+        return list(self.iter_relationships(registry))
+
+    def iter_relationships(self, registry=None):
+        """Yield relationship instances from embedded nodes, one at a time.
+
+        Same relationships, in the same order, as create_relationships(), without
+        holding them all in a list.
+
+        Args:
+            registry: Optional registry. If None, uses package's default registry.
+
+        Yields:
+            Relationship instances, whose endpoints are NodeRefs
 
         Raises:
             KeyError: If relationship type not found in registry
@@ -221,32 +246,64 @@ json_schema_extra={"identifying": True, "from_base_schema": False, "property_typ
             from ..registry import registry as default_registry
             registry = default_registry
 
-        relationships = []
-
         if self.from_rel:
             # Get relationship class from registry
             RelClass = registry.get_relationship_class("FromRelationship")
 
             # Single embedded node
-            rel = RelClass(start_node=self.from_rel, end_node=self)
-            relationships.append(rel)
+            yield RelClass(start_node=NodeRef.of(self.from_rel), end_node=NodeRef.of(self))
 
         if self.to:
             # Get relationship class from registry
             RelClass = registry.get_relationship_class("To")
 
-            # List of embedded nodes
+            # List of embedded nodes; all edges share one reference to this email
+            start_node = NodeRef.of(self)
             for node in self.to:
-                rel = RelClass(start_node=self, end_node=node)
-                relationships.append(rel)
+                yield RelClass(start_node=start_node, end_node=NodeRef.of(node))
 
-        return relationships
+    @classmethod
+    def relationship_batches(
+        cls,
+        emails: Any,
+        batch_size: int = 65_536,
+        registry=None,
+        serialize_containers: bool = False
+    ) -> Any:
+        """Stream the relationships of many emails as canonical Arrow tables.
+
+        Edges are built from the node_ids of each email and its embedded
+        EmailAddress nodes, without relationship instances (see
+        base.columnar.embedded_relationship_batches).
+
+        Args:
+            emails: Iterable of Email instances; consumed lazily
+            batch_size: Maximum number of edges per table
+            registry: Optional registry. If None, uses package's default registry.
+            serialize_containers: If True, serialize property containers to JSON
+                                strings, as to_dict(serialize_containers=True) does
 
-    def merge(self, other: 'Email') -> 'Email':
+        Returns:
+            Iterator of pyarrow Tables in the canonical to_dict() format, each
+            holding edges of one relationship type
+        """
+        from ..base.columnar import embedded_relationship_batches
+
+        return embedded_relationship_batches(
+            emails,
+            # (field, relationship type, inbound), as in iter_relationships()
+            (("from_rel", "FromRelationship", True), ("to", "To", False)),
+            batch_size, registry,
+            serialize_containers=serialize_containers,
+        )
+
+    def merge(self, other: 'Email', revalidate: bool = False) -> 'Email':
         """Merge another node into this one using configured merge strategies.
 
         Args:
             other: Another node of the same type to merge with this one
+            revalidate: If True, re-run all validators on the merged data; by
+                        default it is assembled without revalidation
 
         Returns:
             A new merged node instance with combined data
@@ -254,101 +311,8 @@ json_schema_extra={"identifying": True, "from_base_schema": False, "property_typ
         Raises:
             ValueError: If nodes have different primary labels or merge conflicts
         """
-        from ..base.merge import MERGE_STRATEGIES
-
-        # Verify same primary label
-        if self.primary_label != other.primary_label:
-            raise ValueError(
-                f"Cannot merge nodes with different primary labels: "
-                f"{self.primary_label} != {other.primary_label}"
-            )
-
-        # Merge additional labels (union)
-        merged_labels = list(set(self.additional_labels + other.additional_labels))
-
-        # Merge properties
-        merged_data = {
-            'primary_label': self.primary_label,
-            'additional_labels': merged_labels
-        }
-
-        # Merge created_at (strategy: min)
-        self_created_at = getattr(self, 'created_at', None)
-        other_created_at = getattr(other, 'created_at', None)
-
-        if self_created_at is None and other_created_at is None:
-            merged_data['created_at'] = None
-        elif self_created_at is None:
-            merged_data['created_at'] = other_created_at
-        elif other_created_at is None:
-            merged_data['created_at'] = self_created_at
-        else:
-            # Both have values, use merge strategy
-            strategy = MERGE_STRATEGIES['min']
-            merged_data['created_at'] = strategy(
-                self_created_at,
-                other_created_at,
-                'created_at'
-            )
-        # Merge modified_at (strategy: max)
-        self_modified_at = getattr(self, 'modified_at', None)
-        other_modified_at = getattr(other, 'modified_at', None)
-
-        if self_modified_at is None and other_modified_at is None:
-            merged_data['modified_at'] = None
-        elif self_modified_at is None:
-            merged_data['modified_at'] = other_modified_at
-        elif other_modified_at is None:
-            merged_data['modified_at'] = self_modified_at
-        else:
-            # Both have values, use merge strategy
-            strategy = MERGE_STRATEGIES['max']
-            merged_data['modified_at'] = strategy(
-                self_modified_at,
-                other_modified_at,
-                'modified_at'
-            )
-        # Merge count (strategy: sum)
-        self_count = getattr(self, 'count', None)
-        other_count = getattr(other, 'count', None)
-
-        if self_count is None and other_count is None:
-            merged_data['count'] = None
-        elif self_count is None:
-            merged_data['count'] = other_count
-        elif other_count is None:
-            merged_data['count'] = self_count
-        else:
-            # Both have values, use merge strategy
-            strategy = MERGE_STRATEGIES['sum']
-            merged_data['count'] = strategy(
-                self_count,
-                other_count,
-                'count'
-            )
-        # Merge sources (strategy: union)
-        self_sources = getattr(self, 'sources', None)
-        other_sources = getattr(other, 'sources', None)
-
-        if self_sources is None and other_sources is None:
-            merged_data['sources'] = None
-        elif self_sources is None:
-            merged_data['sources'] = other_sources
-        elif other_sources is None:
-            merged_data['sources'] = self_sources
-        else:
-            # Both have values, use merge strategy
-            strategy = MERGE_STRATEGIES['union']
-            merged_data['sources'] = strategy(
-                self_sources,
-                other_sources,
-                'sources'
-            )
-
-
-
-        # Create new merged instance
-        return self.__class__(**merged_data)
+        # Strategies are resolved once per class (see base.merge.merge_plan)
+        return merge_instances(self, other, revalidate=revalidate)
 
 
 
@@ -359,3 +323,8 @@ Email.model_fields['from_rel'].json_schema_extra = {
 Email.model_fields['to'].json_schema_extra = {
     'identifying': True,
     'property_type': 'node_list',}
+
+
+# Compile the to_dict() and merge() plans now that field metadata is final
+to_dict_plan(Email)
+merge_plan(Email)
@@ -6,6 +6,9 @@ from typing import ClassVar
 from pydantic import ConfigDict, Field, field_validator, model_validator, computed_field
 from ziptie_schema.base.models import BaseNode
 from ziptie_schema.base.mixins import IDGenerationMixin
+
+from ..base.merge import merge_instances, merge_plan
+from ..base.serialization import dumps_json, split_properties, to_dict_plan
 from ziptie_schema.classification import ClassificationError
 
 
@@ -30,6 +33,9 @@ validate_assignment=True
     # Class attributes
     _primary_label = "IPAddress"
     schema_version: ClassVar[str] = "0.1"
+    # Fields that feed node_id; assigning one drops the memoized node_id
+    _identifying_fields: ClassVar[frozenset] = frozenset({"primary_label", "address"})
+    _node_id_memo: Optional[str] = None
 
     # Override base fields with defaults from schema
     primary_label: str = Field(
@@ -76,6 +82,7 @@ json_schema_extra={"identifying": True, "from_base_schema": False, "property_typ
 # Classification configuration
     _classifiable = True
     _classifier_function = "networksdb.transforms.transforms.classify_ip"
+    _batch_classifier_function: ClassVar[str] = "networksdb.transforms.ip_batch.classify_ip_batch"
 
     def __new__(cls, **kwargs):
         """Handle runtime classification for base class instantiation.
@@ -267,14 +274,27 @@ json_schema_extra={"identifying": True, "from_base_schema": False, "property_typ
 
     @property
     def node_id(self) -> str:
-        """Compute the unique node ID."""
-        return self.compute_node_id()
+        """Compute the unique node ID.
 
-    def _serialize_value(self, value):
-        """Convert datetime objects to ISO format strings for JSON serialization."""
-        if isinstance(value, datetime):
-            return value.isoformat()
-        return value
+        Memoized per instance; assigning an identifying field clears the memo.
+        """
+        node_id = self._node_id_memo
+        if node_id is None:
+            node_id = self._node_id_memo = self.compute_node_id()
+        return node_id
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Assign a field (validated via validate_assignment) and drop a stale node_id."""
+        super().__setattr__(name, value)
+        if name in self._identifying_fields:
+            self._node_id_memo = None
+
+    def model_copy(self, *, update: Optional[dict] = None, deep: bool = False) -> Any:
+        """Copy the node, dropping the memoized node_id if identifying fields change."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update and not self._identifying_fields.isdisjoint(update):
+            copied._node_id_memo = None
+        return copied
 
     def to_dict(
         self,
@@ -301,39 +321,8 @@ json_schema_extra={"identifying": True, "from_base_schema": False, "property_typ
         """
         result = {}
 
-        # Use Pydantic's model_fields to iterate through all fields
-        identifying_props = {}
-        regular_props = {}
-
-        for field_name, field_info in self.__class__.model_fields.items():
-            # Skip computed fields and base class fields
-            if field_name in ('node_id', 'labels', 'primary_label', 'additional_labels'):
-                continue
-
-            metadata = field_info.json_schema_extra or {}
-
-            # Skip embedded node properties - they're for relationships, not serialization
-            if metadata.get('property_type') in ['node', 'node_list']:
-                continue
-
-            # Skip excluded fields (those with exclude=True in Field definition)
-            if field_info.exclude:
-                continue
-
-            value = self._serialize_value(getattr(self, field_name))
-
-            # Check if this is an identifying property
-            if metadata.get('identifying', False):
-                identifying_props[field_name] = value
-            # Otherwise it's a regular property
-            else:
-                regular_props[field_name] = value
-
-        # Merge dynamic properties into regular properties (always merged in canonical format)
-        dynamic_props = getattr(self, '__pydantic_extra__', {})
-        serialized_dynamic_props = {k: self._serialize_value(v) for k, v in dynamic_props.items() if v is not None}
-        # Always merge into regular properties
-        regular_props.update(serialized_dynamic_props)
+        # Field layout is resolved once per class (see base.serialization)
+        identifying_props, regular_props = split_properties(self, to_dict_plan(self.__class__))
 
         # Add structured data
         result['node_id'] = self.node_id
@@ -345,12 +334,35 @@ json_schema_extra={"identifying": True, "from_base_schema": False, "property_typ
 
         # Optionally serialize containers to JSON strings
         if serialize_containers:
-            import json
-            result['identifying_properties'] = json.dumps(result['identifying_properties'])
-            result['properties'] = json.dumps(result['properties'])
+            result['identifying_properties'] = dumps_json(result['identifying_properties'])
+            result['properties'] = dumps_json(result['properties'])
 
         return result
 
+    @classmethod
+    def from_columns(
+        cls,
+        table: Any,
+        serialize_containers: bool = False
+    ) -> Any:
+        """Build canonical rows for a whole column batch without per-row instances.
+
+        Applies the same normalizers, validators, classifier and node_id
+        computation as instantiation, column by column.
+
+        Args:
+            table: pyarrow Table/RecordBatch or Polars DataFrame with one column
+                   per property
+            serialize_containers: If True, serialize property containers to JSON
+                                strings, as to_dict(serialize_containers=True) does
+
+        Returns:
+            Table of the same kind in the canonical to_dict() format
+        """
+        from ..base.columnar import nodes_from_columns
+
+        return nodes_from_columns(cls, table, serialize_containers=serialize_containers)
+
     def create_relationships(self, registry=None) -> list:
         """Create relationship instances from embedded nodes.
 
@@ -373,11 +385,13 @@ json_schema_extra={"identifying": True, "from_base_schema": False, "property_typ
 
         return relationships
 
-    def merge(self, other: 'IPAddress') -> 'IPAddress':
+    def merge(self, other: 'IPAddress', revalidate: bool = False) -> 'IPAddress':
         """Merge another node into this one using configured merge strategies.
 
         Args:
             other: Another node of the same type to merge with this one
+            revalidate: If True, re-run all validators on the merged data; by
+                        default it is assembled without revalidation
 
         Returns:
             A new merged node instance with combined data
@@ -385,136 +399,14 @@ json_schema_extra={"identifying": True, "from_base_schema": False, "property_typ
         Raises:
             ValueError: If nodes have different primary labels or merge conflicts
         """
-        from ..base.merge import MERGE_STRATEGIES
-
-        # Verify same primary label
-        if self.primary_label != other.primary_label:
-            raise ValueError(
-                f"Cannot merge nodes with different primary labels: "
-                f"{self.primary_label} != {other.primary_label}"
-            )
-
-        # Merge additional labels (union)
-        merged_labels = list(set(self.additional_labels + other.additional_labels))
-
-        # Merge properties
-        merged_data = {
-            'primary_label': self.primary_label,
-            'additional_labels': merged_labels
-        }
-
-        # Merge created_at (strategy: min)
-        self_created_at = getattr(self, 'created_at', None)
-        other_created_at = getattr(other, 'created_at', None)
-
-        if self_created_at is None and other_created_at is None:
-            merged_data['created_at'] = None
-        elif self_created_at is None:
-            merged_data['created_at'] = other_created_at
-        elif other_created_at is None:
-            merged_data['created_at'] = self_created_at
-        else:
-            # Both have values, use merge strategy
-            strategy = MERGE_STRATEGIES['min']
-            merged_data['created_at'] = strategy(
-                self_created_at,
-                other_created_at,
-                'created_at'
-            )
-        # Merge modified_at (strategy: max)
-        self_modified_at = getattr(self, 'modified_at', None)
-        other_modified_at = getattr(other, 'modified_at', None)
-
-        if self_modified_at is None and other_modified_at is None:
-            merged_data['modified_at'] = None
-        elif self_modified_at is None:
-            merged_data['modified_at'] = other_modified_at
-        elif other_modified_at is None:
-            merged_data['modified_at'] = self_modified_at
-        else:
-            # Both have values, use merge strategy
-            strategy = MERGE_STRATEGIES['max']
-            merged_data['modified_at'] = strategy(
-                self_modified_at,
-                other_modified_at,
-                'modified_at'
-            )
-        # Merge count (strategy: sum)
-        self_count = getattr(self, 'count', None)
-        other_count = getattr(other, 'count', None)
-
-        if self_count is None and other_count is None:
-            merged_data['count'] = None
-        elif self_count is None:
-            merged_data['count'] = other_count
-        elif other_count is None:
-            merged_data['count'] = self_count
-        else:
-            # Both have values, use merge strategy
-            strategy = MERGE_STRATEGIES['sum']
-            merged_data['count'] = strategy(
-                self_count,
-                other_count,
-                'count'
-            )
-        # Merge sources (strategy: union)
-        self_sources = getattr(self, 'sources', None)
-        other_sources = getattr(other, 'sources', None)
-
-        if self_sources is None and other_sources is None:
-            merged_data['sources'] = None
-        elif self_sources is None:
-            merged_data['sources'] = other_sources
-        elif other_sources is None:
-            merged_data['sources'] = self_sources
-        else:
-            # Both have values, use merge strategy
-            strategy = MERGE_STRATEGIES['union']
-            merged_data['sources'] = strategy(
-                self_sources,
-                other_sources,
-                'sources'
-            )
-        # Merge address (strategy: error_if_different)
-        self_address = getattr(self, 'address', None)
-        other_address = getattr(other, 'address', None)
-
-        if self_address is None and other_address is None:
-            merged_data['address'] = None
-        elif self_address is None:
-            merged_data['address'] = other_address
-        elif other_address is None:
-            merged_data['address'] = self_address
-        else:
-            # Both have values, use merge strategy
-            strategy = MERGE_STRATEGIES['error_if_different']
-            merged_data['address'] = strategy(
-                self_address,
-                other_address,
-                'address'
-            )
-        # Merge dynamic properties from __pydantic_extra__
-        self_extra = getattr(self, '__pydantic_extra__', {})
-        other_extra = getattr(other, '__pydantic_extra__', {})
-
-        # Get all unique dynamic property keys
-        all_extra_keys = set(self_extra.keys()) | set(other_extra.keys())
+        # Strategies are resolved once per class (see base.merge.merge_plan)
+        return merge_instances(self, other, revalidate=revalidate)
 
-        # Merge each dynamic property using take_any_non_empty strategy
-        for extra_key in all_extra_keys:
-            self_value = self_extra.get(extra_key)
-            other_value = other_extra.get(extra_key)
-
-            # Apply take_any_non_empty strategy from base.merge
-            merged_value = MERGE_STRATEGIES['take_any_non_empty'](
-                self_value, other_value, extra_key
-            )
-            if merged_value is not None:
-                merged_data[extra_key] = merged_value
 
-        # Create new merged instance
-        return self.__class__(**merged_data)
 
+# Set json_schema_extra for embedded node properties after class definition
 
 
-# Set json_schema_extra for embedded node properties after class definition
\ No newline at end of file
+# Compile the to_dict() and merge() plans now that field metadata is final
+to_dict_plan(IPAddress)
+merge_plan(IPAddress)
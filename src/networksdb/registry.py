@@ -4,21 +4,12 @@ Provides dual lookup mechanisms:
 1. By class name - for Python code and ziptie-ingest (includes all classes)
 2. By primary_label/rel_type - for Neo4j deserialization (excludes classifiable base classes)
 """
-from typing import Type, Dict, List, Any, Optional
+from typing import Type, Dict, FrozenSet, Iterable, List, Any, Optional, Tuple
 
-# Import all node classes
-from .nodes.ip_address import IPAddress
-from .nodes.private_ip_address import PrivateIPAddress
-from .nodes.public_ip_address import PublicIPAddress
-from .nodes.domain import Domain
-from .nodes.email_address import EmailAddress
-from .nodes.email import Email
+from .lazy import LazyClassMap, LazyNode, materialize_node
 
-# Import all relationship classes
-from .relationships.has_ip import HasIP
-from .relationships.from_relationship import FromRelationship
-from .relationships.to import To
-from .relationships.knows import Knows
+# Node and relationship classes are imported on first lookup (see LazyClassMap),
+# so importing the registry does not build every Pydantic model.
 
 
 class Registry:
@@ -28,58 +19,74 @@ class Registry:
         """Initialize registry with dual lookup mechanisms."""
         
         # Python/code use: class_name -> class (includes ALL classes)
-        self.node_classes: Dict[str, Type] = {
-            "IPAddress": IPAddress,
-            "PrivateIPAddress": PrivateIPAddress,
-            "PublicIPAddress": PublicIPAddress,
-            "Domain": Domain,
-            "EmailAddress": EmailAddress,
-            "Email": Email,
-        }
-        
-        self.relationship_classes: Dict[str, Type] = {
-            "HasIP": HasIP,
-            "FromRelationship": FromRelationship,
-            "To": To,
-            "Knows": Knows,
-        }
+        self.node_classes: Dict[str, Type] = LazyClassMap({
+            "IPAddress": (".nodes.ip_address", "IPAddress"),
+            "PrivateIPAddress": (".nodes.private_ip_address", "PrivateIPAddress"),
+            "PublicIPAddress": (".nodes.public_ip_address", "PublicIPAddress"),
+            "Domain": (".nodes.domain", "Domain"),
+            "EmailAddress": (".nodes.email_address", "EmailAddress"),
+            "Email": (".nodes.email", "Email"),
+        }, package=__package__)
+        
+        self.relationship_classes: Dict[str, Type] = LazyClassMap({
+            "HasIP": (".relationships.has_ip", "HasIP"),
+            "FromRelationship": (".relationships.from_relationship", "FromRelationship"),
+            "To": (".relationships.to", "To"),
+            "Knows": (".relationships.knows", "Knows"),
+        }, package=__package__)
         
         # Neo4j use: primary_label/rel_type -> class (excludes classifiable base classes)
         # Classifiable nodes are excluded since they're never instantiated directly in Neo4j
         # Nodes with roles or auto_labels are INCLUDED since they're the same type, just with dynamic labels
-        self.nodes: Dict[str, Type] = {
-            "PrivateIPAddress": PrivateIPAddress,
-            "PublicIPAddress": PublicIPAddress,
-            "Domain": Domain,
-            "EmailAddress": EmailAddress,
-            "Email": Email,
-        }
-        
-        self.relationships: Dict[str, Type] = {
-            "HAS_IP": HasIP,
-            "FROM": FromRelationship,
-            "TO": To,
-            "Knows": Knows,
-        }
-        
-        # NEW: Class to labels mapping for best-match deserialization
-        self.class_to_labels: Dict[Type, set] = {
-            IPAddress: {
+        self.nodes: Dict[str, Type] = LazyClassMap({
+            "PrivateIPAddress": (".nodes.private_ip_address", "PrivateIPAddress"),
+            "PublicIPAddress": (".nodes.public_ip_address", "PublicIPAddress"),
+            "Domain": (".nodes.domain", "Domain"),
+            "EmailAddress": (".nodes.email_address", "EmailAddress"),
+            "Email": (".nodes.email", "Email"),
+        }, package=__package__)
+        
+        self.relationships: Dict[str, Type] = LazyClassMap({
+            "HAS_IP": (".relationships.has_ip", "HasIP"),
+            "FROM": (".relationships.from_relationship", "FromRelationship"),
+            "TO": (".relationships.to", "To"),
+            "Knows": (".relationships.knows", "Knows"),
+        }, package=__package__)
+        
+        # Class name to labels mapping for best-match deserialization. Keyed by
+        # name so label matching only imports the winning class; the class-keyed
+        # class_to_labels view is built on first access.
+        self._class_labels: Dict[str, set] = {
+            "IPAddress": {
                 "IPAddress"            },
-            PrivateIPAddress: {
+            "PrivateIPAddress": {
                 "PrivateIPAddress",
                 "IPAddress"            },
-            PublicIPAddress: {
+            "PublicIPAddress": {
                 "PublicIPAddress",
                 "IPAddress"            },
-            Domain: {
+            "Domain": {
                 "Domain"            },
-            EmailAddress: {
+            "EmailAddress": {
                 "EmailAddress"            },
-            Email: {
+            "Email": {
                 "Email"            },
         }
         
+    @property
+    def class_to_labels(self) -> Dict[Type, set]:
+        """Class to labels mapping (imports every node class on first access)."""
+        mapping = self.__dict__.get('_class_to_labels')
+        if mapping is None:
+            mapping = self._class_to_labels = {
+                self.node_classes[name]: labels
+                for name, labels in self._class_labels.items()
+            }
+        return mapping
+    
+    @class_to_labels.setter
+    def class_to_labels(self, value: Dict[Type, set]) -> None:
+        self._class_to_labels = value
     
     # ========== Python/ziptie-ingest Interface (REQUIRED BY SPEC) ==========
     
@@ -277,34 +284,12 @@ class Registry:
         Raises:
             KeyError: If no class matches any of the provided labels
         """
-        neo4j_label_set = set(labels)
-        
-        # Find the class with the most matching labels
-        best_match_class = None
-        best_match_score = 0
-        best_match_labels = set()
-        
-        for cls, cls_labels in self.class_to_labels.items():
-            # Count how many labels match
-            matching_labels = cls_labels & neo4j_label_set
-            score = len(matching_labels)
-            
-            if score > best_match_score:
-                best_match_class = cls
-                best_match_score = score
-                best_match_labels = cls_labels
-        
-        if not best_match_class:
-            raise KeyError(
-                f"No class found matching any of labels: {labels}. "
-                f"Available classes: {list(self.node_classes.keys())}"
-            )
+        best_match_class, extra_labels = self.match_labels(labels)
         
         # Create the instance
         instance = best_match_class(**data)
         
         # Add any extra labels that aren't part of the class definition
-        extra_labels = list(neo4j_label_set - best_match_labels)
         if extra_labels and hasattr(instance, 'additional_labels'):
             # Merge extra labels with existing additional_labels
             current_labels = getattr(instance, 'additional_labels', [])
@@ -313,6 +298,77 @@ class Registry:
         
         return instance
     
+    def match_labels(self, labels: List[str]) -> Tuple[Type, Tuple[str, ...]]:
+        """Find the best matching class for a set of Neo4j labels.
+        
+        The class sharing the most labels wins; ties go to the class registered
+        first in class_to_labels. Results are memoized per label combination,
+        and candidates are found through a label -> classes index instead of
+        scanning every class.
+        
+        Args:
+            labels: List of ALL labels from Neo4j
+            
+        Returns:
+            Tuple of (best matching class, labels not defined by that class)
+            
+        Raises:
+            KeyError: If no class matches any of the provided labels
+        """
+        key = frozenset(labels)
+        matches = self._label_match_cache()
+        match = matches.get(key)
+        if match is None:
+            match = self._best_label_match(key)
+            if match is None:
+                raise KeyError(
+                    f"No class found matching any of labels: {labels}. "
+                    f"Available classes: {list(self.node_classes.keys())}"
+                )
+            matches[key] = match
+        return match
+    
+    def _label_match_cache(self) -> Dict[FrozenSet[str], Tuple[Type, Tuple[str, ...]]]:
+        # Built lazily (combine() creates registries without __init__) and
+        # rebuilt if class_to_labels was replaced or resized since. Until
+        # class_to_labels is accessed, the index holds class names instead of
+        # classes so unmatched classes are never imported.
+        class_labels = self.__dict__.get('_class_to_labels')
+        if class_labels is None:
+            class_labels = self._class_labels
+        state = (id(class_labels), len(class_labels))
+        if self.__dict__.get('_label_index_state') != state:
+            index: Dict[str, List[Tuple[int, Any, set]]] = {}
+            for order, (cls, cls_labels) in enumerate(class_labels.items()):
+                for label in cls_labels:
+                    index.setdefault(label, []).append((order, cls, cls_labels))
+            self._label_index = index
+            self._label_matches = {}
+            self._label_index_state = state
+        return self._label_matches
+    
+    def _best_label_match(self, label_set: FrozenSet[str]) -> Optional[Tuple[Type, Tuple[str, ...]]]:
+        scores: Dict[int, List[Any]] = {}
+        for label in label_set:
+            for order, cls, cls_labels in self._label_index.get(label, ()):
+                entry = scores.get(order)
+                if entry is None:
+                    scores[order] = [1, cls, cls_labels]
+                else:
+                    entry[0] += 1
+        if not scores:
+            return None
+        # Highest score wins; the lowest registration order breaks ties
+        order = min(scores, key=lambda o: (-scores[o][0], o))
+        _, cls, cls_labels = scores[order]
+        if isinstance(cls, str):
+            cls = self.node_classes[cls]
+        return cls, tuple(label_set - cls_labels)
+    
+    def clear_label_cache(self) -> None:
+        """Drop memoized label matches, e.g. after editing class_to_labels in place."""
+        self.__dict__.pop('_label_index_state', None)
+    
     def deserialize_neo4j_node(self, neo4j_node) -> Any:
         """Convenience method to deserialize directly from a Neo4j node object.
         
@@ -338,6 +394,44 @@ class Registry:
         
         return self.deserialize_node_from_labels(data, labels)
     
+    def deserialize_many(self, records: Iterable[Any], lazy: bool = True, trusted: bool = False) -> List[Any]:
+        """Deserialize many Neo4j nodes, deferring model construction.
+        
+        Each record is resolved to its class exactly like deserialize_neo4j_node
+        (best label match, or primary_label when there are no labels), using the
+        memoized label matching, but no model is built up front.
+        
+        Args:
+            records: Neo4j node objects (with .labels and properties) or plain
+                     property dicts containing 'primary_label'
+            lazy: If True (default), return LazyNode proxies that build the model
+                  on first access to anything but raw properties. If False,
+                  build every model immediately.
+            trusted: If True, build models without validation (as
+                     model_construct() does). Only for data written by this package.
+            
+        Returns:
+            List of LazyNode proxies (lazy=True) or node instances, in record order
+            
+        Raises:
+            KeyError: If a record matches no class
+        """
+        nodes = []
+        for record in records:
+            data = dict(record)
+            labels = list(record.labels) if hasattr(record, 'labels') else []
+            if labels:
+                node_class, extra_labels = self.match_labels(labels)
+            elif 'primary_label' in data:
+                node_class, extra_labels = self.get_node_by_label(data['primary_label']), ()
+            else:
+                raise KeyError("No labels found on Neo4j node and no primary_label in data")
+            if lazy:
+                nodes.append(LazyNode(node_class, data, extra_labels, trusted))
+            else:
+                nodes.append(materialize_node(node_class, data, extra_labels, trusted))
+        return nodes
+    
     @staticmethod
     def combine(*registries: 'Registry', strict: bool = False) -> 'Registry':
         """Combine multiple registries into one.
@@ -400,7 +494,18 @@ deserialize_node = registry.deserialize_node
 deserialize_relationship = registry.deserialize_relationship
 deserialize_node_from_labels = registry.deserialize_node_from_labels
 deserialize_neo4j_node = registry.deserialize_neo4j_node
+deserialize_many = registry.deserialize_many
 
 # Registry exports for Neo4j label/type to class mapping
 NODE_REGISTRY = registry.nodes
-RELATIONSHIP_REGISTRY = registry.relationships
\ No newline at end of file
+RELATIONSHIP_REGISTRY = registry.relationships
+
+
+def __getattr__(name: str) -> Type:
+    # Generated classes used to be imported into this module; keep
+    # `from networksdb.registry import Domain` working without eager imports
+    if name in registry.node_classes:
+        return registry.node_classes[name]
+    if name in registry.relationship_classes:
+        return registry.relationship_classes[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,23 @@
-"""Generated relationship models."""
-from .has_ip import HasIP
-from .from_relationship import FromRelationship
-from .to import To
-from .knows import Knows
+"""Generated relationship models.
+
+Classes are imported on first attribute access (PEP 562), so importing the
+package does not define every model.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .has_ip import HasIP
+    from .from_relationship import FromRelationship
+    from .to import To
+    from .knows import Knows
+
+_MODULES = {
+    "HasIP": ".has_ip",
+    "FromRelationship": ".from_relationship",
+    "To": ".to",
+    "Knows": ".knows",
+}
 
 __all__ = [
     "HasIP",
@@ -10,3 +25,16 @@ __all__ = [
     "To",
     "Knows",
 ]
+
+
+def __getattr__(name):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
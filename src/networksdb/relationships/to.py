@@ -5,6 +5,11 @@ from pydantic import ConfigDict, Field, field_validator, model_validator
 from ziptie_schema.base.models import BaseRelationship
 from ziptie_schema.base.mixins import IDGenerationMixin
 
+from ..base.merge import merge_instances, merge_plan
+from ..base.node_pairs import check_node_pair
+from ..base.node_ref import NodeEndpoint
+from ..base.serialization import dumps_json, split_properties, to_dict_plan
+
 # Import node types for type checking
 from ..nodes.email import Email
 from ..nodes.email_address import EmailAddress
@@ -18,6 +23,9 @@ class To(BaseRelationship, IDGenerationMixin):
     # Class attributes
     _rel_type: ClassVar[str] = "TO"
     schema_version: ClassVar[str] = "0.1"
+    # Fields that feed rel_id; assigning one drops the memoized rel_id
+    _identifying_fields: ClassVar[frozenset] = frozenset({"rel_type", "start_node", "end_node"})
+    _rel_id_memo: Optional[tuple] = None
     _valid_pairs: ClassVar[list[tuple[str, str]]] = [        ("Email", "EmailAddress"),    ]
     _bidirectional: ClassVar[bool] = False
     
@@ -26,6 +34,9 @@ class To(BaseRelationship, IDGenerationMixin):
         default="TO",
         description="Type of this relationship"
     )
+    # Endpoints: node instances or lightweight NodeRefs
+    start_node: NodeEndpoint
+    end_node: NodeEndpoint
     
     # Properties
     created_at: Optional[datetime] = Field(        default_factory=lambda: datetime.now(),        description="When this entity was created",        json_schema_extra={
@@ -93,46 +104,35 @@ class To(BaseRelationship, IDGenerationMixin):
         accept PrivateIPAddress -> PublicIPAddress since both are subclasses
         of IPAddress.
         """
-        # Get all labels from the nodes (primary + inherited)
-        start_labels = self.start_node.labels if hasattr(self.start_node, 'labels') else [self.start_node.primary_label]
-        end_labels = self.end_node.labels if hasattr(self.end_node, 'labels') else [self.end_node.primary_label]
-        
-        # Check if this pair is valid (checking against all labels for inheritance)
-        valid = False
-        for valid_start, valid_end in self._valid_pairs:
-            # Check if any of the start node's labels match the required start type
-            # AND any of the end node's labels match the required end type
-            if valid_start in start_labels and valid_end in end_labels:
-                valid = True
-                break
-            # For bidirectional relationships, also check the reverse
-            if self._bidirectional and valid_end in start_labels and valid_start in end_labels:
-                valid = True
-                break
-        
-        if not valid:
-            # Provide helpful error showing what was given vs what's expected
-            start_primary = self.start_node.primary_label
-            end_primary = self.end_node.primary_label
-            raise ValueError(
-                f"Invalid node pair: {start_primary} -> {end_primary}. "
-                f"Valid pairs (including inherited types): {self._valid_pairs}. "
-                f"Start node labels: {start_labels}, End node labels: {end_labels}"
-            )
-        
+        check_node_pair(type(self), self.start_node, self.end_node)
         return self
     
     @property
     def rel_id(self) -> str:
-        """Compute the unique relationship ID."""
-        return self.compute_rel_id()
+        """Compute the unique relationship ID.
+        
+        Memoized per instance and keyed by the endpoint node_ids, since the
+        endpoint nodes can change after the relationship is created.
+        """
+        endpoints = (self.start_node.node_id, self.end_node.node_id)
+        memo = self._rel_id_memo
+        if memo is None or memo[0] != endpoints:
+            memo = self._rel_id_memo = (endpoints, self.compute_rel_id())
+        return memo[1]
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Assign a field (validated via validate_assignment) and drop a stale rel_id."""
+        super().__setattr__(name, value)
+        if name in self._identifying_fields:
+            self._rel_id_memo = None
+    
+    def model_copy(self, *, update: Optional[dict] = None, deep: bool = False) -> Any:
+        """Copy the relationship, dropping the memoized rel_id if identifying fields change."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update and not self._identifying_fields.isdisjoint(update):
+            copied._rel_id_memo = None
+        return copied
     
-    def _serialize_value(self, value):
-        """Convert datetime objects to ISO format strings for JSON serialization."""
-        if isinstance(value, datetime):
-            return value.isoformat()
-        return value
-
     def to_dict(
         self,
         serialize_containers: bool = False
@@ -157,26 +157,8 @@ class To(BaseRelationship, IDGenerationMixin):
         """
         result = {}
 
-        identifying_props = {}
-        regular_props = {}
-
-        for field_name, field_info in self.__class__.model_fields.items():
-            # Skip computed and base fields
-            if field_name in ('rel_id', 'rel_type', 'start_node', 'end_node'):
-                continue
-
-            # Skip excluded fields (those with exclude=True in Field definition)
-            if field_info.exclude:
-                continue
-
-            value = self._serialize_value(getattr(self, field_name))
-            metadata = field_info.json_schema_extra or {}
-
-            if metadata.get('identifying', False):
-                identifying_props[field_name] = value
-            else:
-                regular_props[field_name] = value
-
+        # Field layout is resolved once per class (see base.serialization)
+        identifying_props, regular_props = split_properties(self, to_dict_plan(self.__class__))
 
         result['rel_id'] = self.rel_id
         result['schema_version'] = self.__class__.schema_version
@@ -195,17 +177,54 @@ class To(BaseRelationship, IDGenerationMixin):
 
         # Optionally serialize containers to JSON strings
         if serialize_containers:
-            import json
-            result['identifying_properties'] = json.dumps(result['identifying_properties'])
-            result['properties'] = json.dumps(result['properties'])
+            result['identifying_properties'] = dumps_json(result['identifying_properties'])
+            result['properties'] = dumps_json(result['properties'])
 
         return result
     
-    def merge(self, other: 'To') -> 'To':
+    @classmethod
+    def from_endpoint_columns(
+        cls,
+        start_labels: Any,
+        start_ids: Any,
+        end_labels: Any,
+        end_ids: Any,
+        props: Any = None,
+        serialize_containers: bool = False
+    ) -> Any:
+        """Build canonical rows for a batch of edges without endpoint node instances.
+
+        Endpoint pairs are validated once per label combination and rel_ids are
+        computed in bulk; properties go through the same normalizers and
+        validators as instantiation, column by column.
+
+        Args:
+            start_labels: Start node primary label(s): one for the batch or one per row
+            start_ids: Start node node_ids
+            end_labels: End node primary label(s): one for the batch or one per row
+            end_ids: End node node_ids
+            props: Optional table (pyarrow, Polars or dict of lists) of
+                   relationship properties, one row per edge
+            serialize_containers: If True, serialize property containers to JSON
+                                strings, as to_dict(serialize_containers=True) does
+
+        Returns:
+            Table in the canonical to_dict() format
+        """
+        from ..base.columnar import relationships_from_columns
+
+        return relationships_from_columns(
+            cls, start_labels, start_ids, end_labels, end_ids, props,
+            serialize_containers=serialize_containers,
+        )
+
+    def merge(self, other: 'To', revalidate: bool = False) -> 'To':
         """Merge another relationship into this one using configured merge strategies.
         
         Args:
             other: Another relationship of the same type to merge with this one
+            revalidate: If True, re-run all validators on the merged data; by
+                        default it is assembled without revalidation
             
         Returns:
             A new merged relationship instance with combined data
@@ -213,114 +232,8 @@ class To(BaseRelationship, IDGenerationMixin):
         Raises:
             ValueError: If relationships have different types, endpoints, or merge conflicts
         """
-        from ..base.merge import MERGE_STRATEGIES
-        
-        # Verify same relationship type
-        if self.rel_type != other.rel_type:
-            raise ValueError(
-                f"Cannot merge relationships of different types: "
-                f"{self.rel_type} != {other.rel_type}"
-            )
-        
-        # Verify same start and end nodes
-        if self.start_node.node_id != other.start_node.node_id:
-            raise ValueError(
-                f"Cannot merge relationships with different start nodes: "
-                f"{self.start_node.node_id} != {other.start_node.node_id}"
-            )
-        
-        if self.end_node.node_id != other.end_node.node_id:
-            raise ValueError(
-                f"Cannot merge relationships with different end nodes: "
-                f"{self.end_node.node_id} != {other.end_node.node_id}"
-            )
-        
-        # Merge properties
-        merged_data = {
-            'rel_type': self.rel_type,
-            'start_node': self.start_node,
-            'end_node': self.end_node
-        }
-        
-        # Merge created_at (strategy: min)
-        self_created_at = getattr(self, 'created_at')
-        other_created_at = getattr(other, 'created_at')
-        
-        if self_created_at is None and other_created_at is None:
-            merged_data['created_at'] = None
-        elif self_created_at is None:
-            merged_data['created_at'] = other_created_at
-        elif other_created_at is None:
-            merged_data['created_at'] = self_created_at
-        else:
-            # Both have values, use merge strategy
-            strategy = MERGE_STRATEGIES['min']
-            merged_data['created_at'] = strategy(
-                self_created_at, 
-                other_created_at, 
-                'created_at'
-            )
-        
-        # Merge modified_at (strategy: max)
-        self_modified_at = getattr(self, 'modified_at')
-        other_modified_at = getattr(other, 'modified_at')
-        
-        if self_modified_at is None and other_modified_at is None:
-            merged_data['modified_at'] = None
-        elif self_modified_at is None:
-            merged_data['modified_at'] = other_modified_at
-        elif other_modified_at is None:
-            merged_data['modified_at'] = self_modified_at
-        else:
-            # Both have values, use merge strategy
-            strategy = MERGE_STRATEGIES['max']
-            merged_data['modified_at'] = strategy(
-                self_modified_at, 
-                other_modified_at, 
-                'modified_at'
-            )
-        
-        # Merge count (strategy: sum)
-        self_count = getattr(self, 'count')
-        other_count = getattr(other, 'count')
-        
-        if self_count is None and other_count is None:
-            merged_data['count'] = None
-        elif self_count is None:
-            merged_data['count'] = other_count
-        elif other_count is None:
-            merged_data['count'] = self_count
-        else:
-            # Both have values, use merge strategy
-            strategy = MERGE_STRATEGIES['sum']
-            merged_data['count'] = strategy(
-                self_count, 
-                other_count, 
-                'count'
-            )
-        
-        # Merge sources (strategy: union)
-        self_sources = getattr(self, 'sources')
-        other_sources = getattr(other, 'sources')
-        
-        if self_sources is None and other_sources is None:
-            merged_data['sources'] = None
-        elif self_sources is None:
-            merged_data['sources'] = other_sources
-        elif other_sources is None:
-            merged_data['sources'] = self_sources
-        else:
-            # Both have values, use merge strategy
-            strategy = MERGE_STRATEGIES['union']
-            merged_data['sources'] = strategy(
-                self_sources, 
-                other_sources, 
-                'sources'
-            )
-        
-
-        # Create new merged instance
-        return self.__class__(**merged_data)
+        # Strategies are resolved once per class (see base.merge.merge_plan)
+        return merge_instances(self, other, revalidate=revalidate)
     
     # Model configuration for better error handling
     model_config = ConfigDict(
@@ -328,4 +241,9 @@ class To(BaseRelationship, IDGenerationMixin):
         validate_assignment=True,
         str_strip_whitespace=True,
         validate_default=True
-    )
\ No newline at end of file
+    )
+
+
+# Compile the to_dict() and merge() plans now that field metadata is final
+to_dict_plan(To)
+merge_plan(To)
@@ -1,6 +1,12 @@
 from .transforms import enrich_domain_labels, validate_domain, classify_ip, normalize_ip, validate_email_address
+from .ip_batch import classify_ip_batch
+from .cache import TransformCache, cache_stats, configure_cache
 __all__ = ["enrich_domain_labels",
            "validate_domain",
            "classify_ip", 
+           "classify_ip_batch",
            "normalize_ip", 
-           "validate_email_address"]
+           "validate_email_address",
+           "TransformCache",
+           "cache_stats",
+           "configure_cache"]
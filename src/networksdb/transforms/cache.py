@@ -0,0 +1,162 @@
+"""Bounded, instrumented caches shared by transform functions.
+
+Each named cache is a least-recently-used mapping with a fixed entry budget and
+hit/miss/eviction counters, so the size can be tuned per feed. The default size
+comes from the NETWORKSDB_TRANSFORM_CACHE_SIZE environment variable and can be
+changed at runtime with configure_cache(), for existing and later caches.
+"""
+import os
+from typing import Any, Dict, Hashable, NamedTuple, Optional
+
+CACHE_SIZE_ENV = "NETWORKSDB_TRANSFORM_CACHE_SIZE"
+DEFAULT_CACHE_SIZE = 65536
+
+_MISSING = object()
+
+# Size set by configure_cache() for all caches; overrides the environment
+_configured_size: Optional[int] = None
+
+
+def _default_size() -> int:
+    if _configured_size is not None:
+        return _configured_size
+    value = os.environ.get(CACHE_SIZE_ENV)
+    if value is None:
+        return DEFAULT_CACHE_SIZE
+    try:
+        size = int(value)
+    except ValueError:
+        raise ValueError(
+            f"{CACHE_SIZE_ENV} must be an integer number of entries, got {value!r}"
+        ) from None
+    if size < 0:
+        raise ValueError(f"{CACHE_SIZE_ENV} must be >= 0, got {size}")
+    return size
+
+
+class CacheStats(NamedTuple):
+    """Point-in-time counters for one cache."""
+    name: str
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TransformCache:
+    """Least-recently-used cache with a fixed entry budget and counters.
+
+    Entries live in a plain dict, whose insertion order doubles as the recency
+    order: a hit re-inserts the key at the end and eviction drops the first key.
+    This avoids the per-entry linked-list overhead of OrderedDict.
+    """
+
+    __slots__ = ("name", "maxsize", "hits", "misses", "evictions", "_data")
+
+    def __init__(self, name: str, maxsize: Optional[int] = None):
+        self.name = name
+        self.maxsize = _default_size() if maxsize is None else maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: Dict[Hashable, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key (refreshing its recency) or default."""
+        data = self._data
+        value = data.pop(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        data[key] = value
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        if self.maxsize <= 0:
+            return
+        data = self._data
+        data.pop(key, None)
+        while len(data) >= self.maxsize:
+            del data[next(iter(data))]
+            self.evictions += 1
+        data[key] = value
+
+    def resize(self, maxsize: int) -> None:
+        """Change the entry budget, evicting the oldest entries if needed."""
+        if maxsize < 0:
+            raise ValueError(f"Cache size must be >= 0, got {maxsize}")
+        self.maxsize = maxsize
+        data = self._data
+        while len(data) > maxsize:
+            del data[next(iter(data))]
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Return the current counters."""
+        return CacheStats(
+            self.name, self.hits, self.misses, self.evictions,
+            len(self._data), self.maxsize,
+        )
+
+
+_caches: Dict[str, TransformCache] = {}
+
+
+def get_cache(name: str) -> TransformCache:
+    """Return the shared cache called name, creating it on first use."""
+    cache = _caches.get(name)
+    if cache is None:
+        cache = _caches[name] = TransformCache(name)
+    return cache
+
+
+def configure_cache(maxsize: int, name: Optional[str] = None) -> None:
+    """Resize one named cache, or every cache when name is None.
+
+    With name None, maxsize also becomes the default size of caches created
+    later (e.g. by transform modules imported afterwards), in place of the
+    NETWORKSDB_TRANSFORM_CACHE_SIZE environment variable.
+
+    Args:
+        maxsize: New entry budget (0 disables caching)
+        name: Cache to resize (e.g. "ip_info"); None resizes all caches
+
+    Raises:
+        KeyError: If name is given but no such cache exists
+        ValueError: If maxsize is negative
+    """
+    global _configured_size
+    if name is None:
+        if maxsize < 0:
+            raise ValueError(f"Cache size must be >= 0, got {maxsize}")
+        _configured_size = maxsize
+        for cache in _caches.values():
+            cache.resize(maxsize)
+        return
+    if name not in _caches:
+        raise KeyError(
+            f"Transform cache '{name}' not found. Available: {list(_caches.keys())}"
+        )
+    _caches[name].resize(maxsize)
+
+
+def cache_stats() -> Dict[str, CacheStats]:
+    """Return the counters of every transform cache, keyed by cache name."""
+    return {name: cache.stats() for name, cache in _caches.items()}
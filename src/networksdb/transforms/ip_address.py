@@ -1,37 +1,62 @@
-from functools import lru_cache
 from ipaddress import ip_address
+from socket import AF_INET, inet_ntop, inet_pton
+from typing import NamedTuple, Union
 from ziptie_schema.transforms.markers import classifier, normalizer, validator, auto_labels
 
-@lru_cache(maxsize=128)
-def ip_info(s: str) -> dict:
+from .cache import get_cache
+
+
+class IPInfo(NamedTuple):
+    normalized_address: str
+    is_private: bool
+    is_loopback: bool
+    version: int
+
+
+_ip_info_cache = get_cache("ip_info")
+
+
+def _ip_key(s: str) -> Union[int, str]:
+    # Canonical IPv4 dotted quads are keyed by their 32-bit value; any other
+    # spelling (IPv6, or e.g. leading zeros where inet_pton accepts them) by
+    # the string itself, so a lookup hit always returns the info for s
+    try:
+        packed = inet_pton(AF_INET, s)
+    except (OSError, TypeError, ValueError):
+        return s
+    return int.from_bytes(packed, "big") if inet_ntop(AF_INET, packed) == s else s
+
+
+def ip_info(s: str) -> IPInfo:
+    key = _ip_key(s)
+    info = _ip_info_cache.get(key)
+    if info is not None:
+        return info
     ip = ip_address(s)
-    return {
-        "normalized_address" : str(ip),
-        "is_private": ip.is_private,
-        "is_loopback": ip.is_loopback,
-        "version": ip.version
-    }
+    info = IPInfo(str(ip), ip.is_private, ip.is_loopback, ip.version)
+    _ip_info_cache.put(key, info)
+    return info
 
 @classifier
 def classify_ip(props: dict)-> str:
     ip = ip_info(props['address'])
-    if ip['is_private']:
+    if ip.is_private:
         return 'PrivateIPAddress'
     else:
         return 'PublicIPAddress'
-    
+
 @normalizer
 def normalize_ip(value: str):
     ip = ip_info(value)
-    return ip['normalized_address'].lower()
+    return ip.normalized_address.lower()
 
 @auto_labels
 def auto_label(ip_data: dict)->list[str]:
     labels = []
-    ip = ip_info(ip_data)
-    if ip['version'] == 4:
+    ip = ip_info(ip_data['address'])
+    if ip.version == 4:
         labels.append('IPv4Address')
-    elif ip['version'] == 6:
+    elif ip.version == 6:
         labels.append('IPv6Addres')
     else:
         raise ValueError("Unknown ipaddress version")
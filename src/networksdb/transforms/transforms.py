@@ -1,12 +1,12 @@
 
-from ipaddress import ip_address
-
 from ziptie_schema.transforms.markers import classifier, normalizer, validator, auto_labels
 
+from .ip_address import ip_info
+
 
 @classifier
 def classify_ip(props: dict) -> str:
-    ip = ip_address(props['address'])
+    ip = ip_info(props['address'])
     if ip.is_private:
         return 'PrivateIPAddress'
     else:
@@ -16,6 +16,23 @@ catalog_config = {
     "s3.path-style-access": "true",
 }
 
+
+def _normalize(arrow_type):
+    """Compare large_* and regular Arrow types alike (pyiceberg uses large types)."""
+    import pyarrow as pa
+    
+    if pa.types.is_large_string(arrow_type):
+        return pa.string()
+    if pa.types.is_large_list(arrow_type) or pa.types.is_list(arrow_type):
+        return pa.list_(_normalize(arrow_type.value_type))
+    if pa.types.is_struct(arrow_type):
+        return pa.struct([
+            pa.field(field.name, _normalize(field.type))
+            for field in arrow_type
+        ])
+    return arrow_type
+
+
 try:
     from pyiceberg.catalog import load_catalog
     
@@ -43,47 +60,47 @@ try:
     for field in rels_table.schema().fields:
         print(f"  - {field.name}: {field.field_type}")
     
-    # Check canonical format compliance
+    # Check canonical format compliance against the Arrow schemas generated
+    # from sql_metadata (networksdb.arrow_schema)
     print("\n" + "=" * 80)
     print("CANONICAL FORMAT COMPLIANCE CHECK")
     print("=" * 80)
     
-    required_node_fields = ["node_id", "schema_version", "primary_label", "labels", 
-                           "identifying_properties", "properties", "dynamic_properties"]
-    required_rel_fields = ["rel_id", "schema_version", "rel_type", "start_node", "end_node",
-                          "identifying_properties", "properties", "dynamic_properties"]
-    
-    forbidden_node_fields = ["rel_id", "rel_type", "start_node", "end_node"]
-    forbidden_rel_fields = ["node_id", "primary_label", "labels"]
-    
-    nodes_fields = [f.name for f in nodes_table.schema().fields]
-    rels_fields = [f.name for f in rels_table.schema().fields]
-    
-    print("\n✓ NODES TABLE:")
-    for field in required_node_fields:
-        if field in nodes_fields:
-            print(f"  ✓ Has required field: {field}")
-        else:
-            print(f"  ✗ MISSING required field: {field}")
-    
-    for field in forbidden_node_fields:
-        if field in nodes_fields:
-            print(f"  ✗ ERROR: Has forbidden relationship field: {field}")
-        else:
-            print(f"  ✓ Correctly excludes: {field}")
-    
-    print("\n✓ RELATIONSHIPS TABLE:")
-    for field in required_rel_fields:
-        if field in rels_fields:
-            print(f"  ✓ Has required field: {field}")
-        else:
-            print(f"  ✗ MISSING required field: {field}")
+    from pyiceberg.io.pyarrow import schema_to_pyarrow
+    from networksdb.arrow_schema import canonical_columns, required_columns
     
-    for field in forbidden_rel_fields:
-        if field in rels_fields:
-            print(f"  ✗ ERROR: Has forbidden node field: {field}")
-        else:
-            print(f"  ✓ Correctly excludes: {field}")
+    for title, table, is_relationship in (("NODES", nodes_table, False),
+                                          ("RELATIONSHIPS", rels_table, True)):
+        expected = canonical_columns(is_relationship)
+        required = required_columns(is_relationship)
+        # The other kind's envelope fields (rel_id, start_node, labels, ...)
+        forbidden = (set(canonical_columns(not is_relationship)) - set(expected)
+                     - {"identifying_properties", "properties", "dynamic_properties"})
+        actual = schema_to_pyarrow(table.schema())
+        
+        print(f"\n✓ {title} TABLE:")
+        for field in required:
+            if field in actual.names:
+                print(f"  ✓ Has required field: {field}")
+            else:
+                print(f"  ✗ MISSING required field: {field}")
+        
+        for field in sorted(forbidden):
+            if field in actual.names:
+                print(f"  ✗ ERROR: Has forbidden field: {field}")
+            else:
+                print(f"  ✓ Correctly excludes: {field}")
+        
+        # Columns with one type across all entities must match it exactly
+        # (struct property containers differ per entity type)
+        for field, types in expected.items():
+            if len(types) != 1 or field not in actual.names:
+                continue
+            actual_type = _normalize(actual.field(field).type)
+            if actual_type.equals(_normalize(types[0])):
+                print(f"  ✓ Type matches: {field}: {types[0]}")
+            else:
+                print(f"  ✗ TYPE MISMATCH: {field}: expected {types[0]}, got {actual.field(field).type}")
     
     print("\n" + "=" * 80)
     print("VERIFICATION COMPLETE")